@@ -25,11 +25,18 @@ bl_info = {
 
 import bpy
 from .sequenced_bake_core import (
+    SequencedBakeRenderProfile,
+    SequencedBakeResolution,
+    SequencedBakeEncoding,
     SequencedBakeProperties,
     SequencedBakePanel,
     SequencedBakeNode,
     SequencedBakeSocket,
     SequencedBakeOperator,
+    SequencedBakeExportFrameStoreOperator,
+    SequencedBakeBenchmarkEncodingOperator,
+    stop_watch,
+    watch_load_post,
 )
 from .sprite_sheet_creator import (
     SpriteSheetCreatorPanel,
@@ -94,10 +101,15 @@ classes = (
     SequencedBakeAddonProperties,
 
     # --- Sequenced Bake ---
+    SequencedBakeRenderProfile,
+    SequencedBakeResolution,
+    SequencedBakeEncoding,
     SequencedBakeProperties,
     SequencedBakeSocket,
     SequencedBakeNode,
     SequencedBakeOperator,
+    SequencedBakeExportFrameStoreOperator,
+    SequencedBakeBenchmarkEncodingOperator,
     SequencedBakePanel,
 
     # --- Sprite Sheet ---
@@ -131,12 +143,23 @@ def register():
         name="Sequenced Bake Node Props",
     )
 
+    bpy.types.Material.sequenced_bake_resolution = bpy.props.PointerProperty(
+        type=SequencedBakeResolution,
+        name="Sequenced Bake Material Resolution",
+    )
+
+    bpy.app.handlers.load_post.append(watch_load_post)
+
     add_custom_node_category()
 
 
 def unregister():
     remove_custom_node_category()
 
+    stop_watch()
+    if watch_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(watch_load_post)
+
     if hasattr(bpy.types.Scene, "sprite_sheet_props"):
         del bpy.types.Scene.sprite_sheet_props
 
@@ -146,6 +169,9 @@ def unregister():
     if hasattr(bpy.types.ShaderNode, "sequenced_bake_props"):
         del bpy.types.ShaderNode.sequenced_bake_props
 
+    if hasattr(bpy.types.Material, "sequenced_bake_resolution"):
+        del bpy.types.Material.sequenced_bake_resolution
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
@@ -19,19 +19,39 @@
 # This package intentionally does NOT register or unregister Blender classes.
 # All registration is handled by the root add-on __init__.py.
 
-from .properties import SequencedBakeProperties
+from .properties import (
+    SequencedBakeRenderProfile,
+    SequencedBakeResolution,
+    SequencedBakeEncoding,
+    SequencedBakeProperties,
+)
 
 from .ui import (
     SequencedBakePanel,
     SequencedBakeNode,
     SequencedBakeSocket,
 )
-from .operator import SequencedBakeOperator
+from .operator import (
+    SequencedBakeOperator,
+    SequencedBakeExportFrameStoreOperator,
+    SequencedBakeBenchmarkEncodingOperator,
+)
+from .watch import (
+    stop_watch,
+    watch_load_post,
+)
 
 __all__ = (
+    "SequencedBakeRenderProfile",
+    "SequencedBakeResolution",
+    "SequencedBakeEncoding",
     "SequencedBakeProperties",
     "SequencedBakePanel",
     "SequencedBakeNode",
     "SequencedBakeSocket",
     "SequencedBakeOperator",
+    "SequencedBakeExportFrameStoreOperator",
+    "SequencedBakeBenchmarkEncodingOperator",
+    "stop_watch",
+    "watch_load_post",
 )
\ No newline at end of file
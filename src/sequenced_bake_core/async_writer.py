@@ -0,0 +1,138 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .processing import write_pixels
+
+
+class AsyncImageWriter:
+    """
+    Bounded background stage that encodes and writes baked frames.
+
+    Pixels are copied out of Blender on the main thread; compression and
+    file I/O run on a small thread pool. Submitting blocks while the queue
+    depth limit is reached, so at most `max_pending` frames are held in
+    memory at once.
+
+    Attributes:
+        errors (list[str]): Write errors not yet reported to the user.
+        failed (set[str]): Output paths whose last write failed.
+    """
+
+    def __init__(self, max_workers=2, max_pending=4):
+        """
+        Args:
+            max_workers (int): Number of encoder threads.
+            max_pending (int): Maximum number of queued or running writes.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="SequencedBake")
+        self._max_pending = max(1, max_pending)
+        self._pending = {}
+        self.errors = []
+        self.failed = set()
+
+    def submit(self, pixels, filepath, **kwargs):
+        """
+        Queue a frame for encoding, waiting first if the queue is full.
+
+        Args:
+            pixels (np.ndarray): Pixels owned by the writer from now on.
+            filepath (str): Output file path.
+            **kwargs: Remaining write_pixels arguments.
+        """
+        self.collect()
+
+        while len(self._pending) >= self._max_pending:
+            wait(self._pending.values(), return_when=FIRST_COMPLETED)
+            self.collect()
+
+        self.failed.discard(filepath)
+        self._pending[filepath] = self._executor.submit(write_pixels, pixels, filepath, **kwargs)
+
+    def collect(self):
+        """
+        Drop finished writes from the queue and record their errors and
+        failed paths.
+        """
+        for filepath, future in list(self._pending.items()):
+            if not future.done():
+                continue
+
+            del self._pending[filepath]
+
+            error = None if future.cancelled() else future.exception()
+            if error is not None:
+                name = os.path.join(os.path.basename(os.path.dirname(filepath)), os.path.basename(filepath))
+                self.errors.append(f"{name}: {error}")
+                self.failed.add(filepath)
+
+    def is_written(self, filepaths):
+        """
+        Check whether none of the given files is still being written.
+
+        Args:
+            filepaths (list[str]): Output file paths.
+
+        Returns:
+            bool: True if every write for these paths has finished.
+        """
+        self.collect()
+        return not any(filepath in self._pending for filepath in filepaths)
+
+    def has_failed(self, filepaths):
+        """
+        Check whether the last write of any of the given files failed.
+
+        Args:
+            filepaths (list[str]): Output file paths.
+
+        Returns:
+            bool: True if at least one of these files was not written.
+        """
+        self.collect()
+        return any(filepath in self.failed for filepath in filepaths)
+
+    def pop_errors(self):
+        """
+        Return and clear the write errors collected so far.
+
+        Returns:
+            list[str]: Error messages.
+        """
+        self.collect()
+        errors, self.errors = self.errors, []
+        return errors
+
+    def wait(self):
+        """
+        Block until every queued write has finished.
+        """
+        wait(self._pending.values())
+        self.collect()
+
+    def shutdown(self, cancel=False):
+        """
+        Stop the encoder threads.
+
+        Args:
+            cancel (bool): Drop writes that have not started yet instead of
+                finishing them.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+        self.collect()
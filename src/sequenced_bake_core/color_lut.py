@@ -0,0 +1,201 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import os
+
+import bpy
+import numpy as np
+
+LUT_TEMP_TAG = "__SEQBAKE_LUT__"
+
+# Lattice size of float (scene-linear) inputs, sampled on a log2 shaper.
+FLOAT_LUT_SIZE = 65
+
+# Lattice size of byte inputs: 51 steps land exactly on 8-bit codes.
+BYTE_LUT_SIZE = 52
+
+# Scene-linear range covered by the float shaper, in stops.
+LOG_RANGE = (-12.0, 8.0)
+
+# Rows converted per chunk when applying a LUT, to bound temporary memory.
+LUT_CHUNK_ROWS = 256
+
+_lut_cache = {}
+
+
+def get_view_key(scene, image):
+    """
+    Identify the color-management transform save_render applies to an image.
+
+    Returns:
+        tuple: Display, view, look, exposure, gamma and input color space.
+    """
+    view = scene.view_settings
+    return (
+        scene.display_settings.display_device, view.view_transform, view.look, round(view.exposure, 6),
+        round(view.gamma, 6), image.is_float, image.colorspace_settings.name,
+    )
+
+
+def _lattice_values(size, is_float):
+    """
+    Input values of the lattice points along one axis.
+    """
+    t = np.linspace(0.0, 1.0, size, dtype=np.float64)
+
+    if not is_float:
+        return t
+
+    low, high = LOG_RANGE
+    return np.exp2(low + t * (high - low)) - np.exp2(low)
+
+
+def _lattice_coordinates(values, size, is_float):
+    """
+    Map input values to fractional lattice coordinates.
+    """
+    if is_float:
+        low, high = LOG_RANGE
+        values = (np.log2(np.maximum(values, 0.0) + np.exp2(low)) - low) / (high - low)
+
+    return np.clip(values, 0.0, 1.0) * (size - 1)
+
+
+def build_view_lut(scene, image):
+    """
+    Sample the scene view transform into a 3D LUT.
+
+    A lattice of input colors is stored in a temporary image with the color
+    space and buffer type of `image`, written with image.save_render as a
+    16-bit PNG (so display device, view transform, look, exposure and gamma
+    are applied exactly as for a real output) and read back raw.
+
+    Args:
+        scene (bpy.types.Scene): Scene whose color management is sampled.
+        image (bpy.types.Image): Baked image the LUT will be applied to.
+
+    Returns:
+        np.ndarray: (size, size, size, 3) float32 LUT indexed [r, g, b]
+        holding display-encoded values.
+    """
+    is_float = image.is_float
+    size = FLOAT_LUT_SIZE if is_float else BYTE_LUT_SIZE
+    axis = _lattice_values(size, is_float)
+
+    r, g, b = np.meshgrid(axis, axis, axis, indexing='ij')
+    lattice = np.ones((size ** 3, 4), dtype=np.float32)
+    lattice[:, 0], lattice[:, 1], lattice[:, 2] = r.ravel(), g.ravel(), b.ravel()
+
+    filepath = os.path.join(bpy.app.tempdir, f"{LUT_TEMP_TAG}{os.getpid()}.png")
+    settings = scene.render.image_settings
+    original = (
+        settings.file_format, settings.color_depth, settings.color_mode, settings.color_management,
+        scene.render.dither_intensity,
+    )
+
+    lut_image = bpy.data.images.new(LUT_TEMP_TAG, size * size, size, alpha=True, float_buffer=is_float)
+    result = None
+
+    try:
+        lut_image.colorspace_settings.name = image.colorspace_settings.name
+        lut_image.pixels.foreach_set(lattice.ravel())
+
+        settings.file_format = 'PNG'
+        settings.color_depth = '16'
+        settings.color_mode = 'RGB'
+        settings.color_management = 'FOLLOW_SCENE'
+        scene.render.dither_intensity = 0.0
+
+        lut_image.save_render(filepath, scene=scene)
+
+        result = bpy.data.images.load(filepath, check_existing=False)
+        result.colorspace_settings.name = "Non-Color"
+
+        pixels = np.empty(size ** 3 * 4, dtype=np.float32)
+        result.pixels.foreach_get(pixels)
+
+    finally:
+        (settings.file_format, settings.color_depth, settings.color_mode, settings.color_management,
+         scene.render.dither_intensity) = original
+
+        bpy.data.images.remove(lut_image)
+        if result is not None:
+            bpy.data.images.remove(result)
+
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+    return pixels.reshape((size, size, size, 4))[..., :3].copy()
+
+
+def get_view_lut(scene, image):
+    """
+    Return the cached view transform LUT for an image, building it once per
+    color-management configuration.
+    """
+    key = get_view_key(scene, image)
+
+    if key not in _lut_cache:
+        _lut_cache[key] = (build_view_lut(scene, image), image.is_float)
+
+    return _lut_cache[key]
+
+
+def clear_view_lut_cache():
+    """
+    Drop every cached LUT (e.g. after the OCIO configuration changed).
+    """
+    _lut_cache.clear()
+
+
+def apply_view_lut(pixels, view_lut):
+    """
+    Apply a view transform LUT with trilinear interpolation.
+
+    Pure NumPy, so it can run on a worker thread. Alpha is left unchanged.
+
+    Args:
+        pixels (np.ndarray): (height, width, C) float32 pixels, C >= 3.
+        view_lut (tuple[np.ndarray, bool]): Result of get_view_lut.
+
+    Returns:
+        np.ndarray: Display-encoded pixels (a new array).
+    """
+    lut, is_float = view_lut
+    size = lut.shape[0]
+    result = np.array(pixels, dtype=np.float32, copy=True)
+
+    for start in range(0, result.shape[0], LUT_CHUNK_ROWS):
+        rgb = result[start:start + LUT_CHUNK_ROWS, :, :3]
+        coords = _lattice_coordinates(rgb.astype(np.float64), size, is_float)
+
+        index = np.minimum(coords.astype(np.int64), size - 2)
+        fraction = (coords - index).astype(np.float32)
+        r0, g0, b0 = index[..., 0], index[..., 1], index[..., 2]
+        fr, fg, fb = fraction[..., 0:1], fraction[..., 1:2], fraction[..., 2:3]
+
+        c00 = lut[r0, g0, b0] * (1 - fr) + lut[r0 + 1, g0, b0] * fr
+        c10 = lut[r0, g0 + 1, b0] * (1 - fr) + lut[r0 + 1, g0 + 1, b0] * fr
+        c01 = lut[r0, g0, b0 + 1] * (1 - fr) + lut[r0 + 1, g0, b0 + 1] * fr
+        c11 = lut[r0, g0 + 1, b0 + 1] * (1 - fr) + lut[r0 + 1, g0 + 1, b0 + 1] * fr
+
+        c0 = c00 * (1 - fg) + c10 * fg
+        c1 = c01 * (1 - fg) + c11 * fg
+
+        rgb[...] = c0 * (1 - fb) + c1 * fb
+
+    return result
@@ -0,0 +1,166 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+from .processing import (
+    get_encoding_attributes,
+    write_pixels,
+)
+
+# PNG compression levels tried, in percent as in Blender's output settings.
+BENCHMARK_PNG_COMPRESSION = (0, 15, 50, 100)
+
+# EXR codecs tried, each at half and full float.
+BENCHMARK_EXR_CODECS = ("NONE", "ZIP", "ZIPS", "PIZ", "PXR24", "RLE", "DWAA", "DWAB", "B44", "B44A")
+
+# Name of the text datablock receiving the benchmark table.
+BENCHMARK_TEXT_NAME = "Sequenced Bake Encoding Benchmark"
+
+
+def get_benchmark_cases():
+    """
+    List the encodings the benchmark tries.
+
+    Returns:
+        list[dict]: Cases with a label, the add-on image format, the float
+        buffer flag selecting the sample type (None keeps the source's) and
+        the OpenImageIO attributes.
+    """
+    cases = [
+        {
+            "label": f"PNG {compression}%",
+            "image_format": "PNG",
+            "float_buffer": None,
+            "attributes": get_encoding_attributes("PNG", "NONE", compression),
+        }
+        for compression in BENCHMARK_PNG_COMPRESSION
+    ]
+
+    for codec in BENCHMARK_EXR_CODECS:
+        for depth, float_buffer in (("Half", False), ("Full", True)):
+            cases.append({
+                "label": f"EXR {codec} {depth}",
+                "image_format": "EXR",
+                "float_buffer": float_buffer,
+                "attributes": get_encoding_attributes("EXR", codec, 0),
+            })
+
+    return cases
+
+
+def run_encoding_benchmark(pixels, float_buffer, alpha, repeats=3):
+    """
+    Encode one baked frame with every benchmark case.
+
+    Each case is written `repeats` times to a temporary directory; the
+    fastest run is reported so that disk cache warm-up does not count.
+    Requires OpenImageIO.
+
+    Args:
+        pixels (np.ndarray): (height, width, 4) float32 pixels of the frame.
+        float_buffer (bool): Whether the frame comes from a float image.
+        alpha (bool): Whether to write the alpha channel.
+        repeats (int): Number of runs per case.
+
+    Returns:
+        list[dict]: One result per case with 'label', 'bytes' and 'ms', or
+        'error' if the case could not be written.
+    """
+    results = []
+    temp_dir = tempfile.mkdtemp(prefix="seqbake_benchmark_")
+
+    try:
+        for index, case in enumerate(get_benchmark_cases()):
+            filepath = os.path.join(temp_dir, f"{index}.{case['image_format'].lower()}")
+            result = {"label": case["label"]}
+            timings = []
+
+            try:
+                for _ in range(max(1, repeats)):
+                    start = time.perf_counter()
+                    write_pixels(
+                        pixels,
+                        filepath,
+                        image_format=case["image_format"],
+                        float_buffer=float_buffer if case["float_buffer"] is None else case["float_buffer"],
+                        alpha=alpha,
+                        encode_srgb=False,
+                        attributes=case["attributes"],
+                    )
+                    timings.append((time.perf_counter() - start) * 1000.0)
+
+                result["bytes"] = os.path.getsize(filepath)
+                result["ms"] = min(timings)
+            except RuntimeError as error:
+                result["error"] = str(error)
+
+            results.append(result)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return results
+
+
+def pick_fastest(results, max_bytes=0):
+    """
+    Pick the fastest encoding whose file fits a size budget.
+
+    Args:
+        results (list[dict]): Result of run_encoding_benchmark.
+        max_bytes (int): Size budget per frame; 0 for no budget.
+
+    Returns:
+        dict | None: The chosen result, or None if nothing fits.
+    """
+    fitting = [
+        result for result in results
+        if "error" not in result and (not max_bytes or result["bytes"] <= max_bytes)
+    ]
+    return min(fitting, key=lambda result: result["ms"], default=None)
+
+
+def format_benchmark_report(results, source, max_bytes=0):
+    """
+    Format benchmark results as a plain-text table, smallest files first.
+
+    Args:
+        results (list[dict]): Result of run_encoding_benchmark.
+        source (str): Name of the benchmarked frame.
+        max_bytes (int): Size budget per frame; 0 for no budget.
+
+    Returns:
+        str: The report.
+    """
+    lines = [f"Encoding benchmark: {source}", "", f"{'Encoding':<18}{'Size (KiB)':>12}{'Time (ms)':>12}"]
+
+    for result in sorted(results, key=lambda result: result.get("bytes", float("inf"))):
+        if "error" in result:
+            lines.append(f"{result['label']:<18}  failed: {result['error']}")
+        else:
+            lines.append(f"{result['label']:<18}{result['bytes'] / 1024:>12.1f}{result['ms']:>12.1f}")
+
+    best = pick_fastest(results, max_bytes)
+    budget = f" within {max_bytes / 1024:.0f} KiB" if max_bytes else ""
+
+    lines.append("")
+    lines.append(f"Fastest{budget}: {best['label']}" if best else f"No encoding fits{budget}")
+
+    return "\n".join(lines)
@@ -0,0 +1,610 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import bpy
+import hashlib
+import json
+import numpy as np
+import os
+
+# Fingerprints of the (material, pass) outputs of an output directory.
+MANIFEST_FILENAME = ".sequenced_bake_fingerprints.json"
+
+# Baked frames recorded before the fingerprint manifest is rewritten mid-bake.
+FINGERPRINT_SAVE_INTERVAL = 50
+
+# Add-on settings that do not change what a pass bakes.
+IGNORED_SETTINGS = {
+    "sequenced_bake_output_path",
+    "sequence_clear_baked_maps",
+    "show_material_manager",
+    "material_mode",
+    "frame_mode",
+    "frame_step",
+    "resume_bake",
+    "use_incremental_bake",
+    "preview_output_path",
+    "preview_then_full",
+}
+
+IGNORED_SETTING_PREFIXES = (
+    "ui_",
+    "sequenced_bake_normal",
+    "sequenced_bake_roughness",
+    "sequenced_bake_glossy",
+    "sequenced_bake_emission",
+    "sequenced_bake_ambient_occlusion",
+    "sequenced_bake_shadow",
+    "sequenced_bake_position",
+    "sequenced_bake_uv",
+    "sequenced_bake_environment",
+    "sequenced_bake_diffuse",
+    "sequenced_bake_transmission",
+    "sequenced_bake_combined",
+    "sequenced_bake_metallic",
+    "sequenced_bake_occlusion",
+    "sequenced_bake_sculpt",
+)
+
+# Settings that only apply to one pass; other passes ignore them.
+PER_PASS_SETTING_PREFIXES = ("resolution_", "render_profile_", "channel_layout_", "encoding_")
+
+# Status fields written during a bake.
+STATUS_SETTINGS = {
+    "bake_progress",
+    "bake_status",
+    "bake_current_material",
+    "bake_current_type",
+    "bake_frame_info",
+    "bake_fps",
+    "bake_estimated_time",
+    "bake_cpu_usage",
+    "bake_memory_usage",
+    "bake_vram_usage",
+    "bake_denoise_report",
+}
+
+# Base node properties that carry no shading information.
+IGNORED_NODE_PROPERTIES = {
+    "rna_type", "location", "location_absolute", "width", "height", "dimensions", "select", "show_options",
+    "show_preview", "hide", "show_texture", "color", "use_custom_color", "parent", "label", "internal_links",
+    "inputs", "outputs", "type", "bl_idname", "bl_label", "bl_description", "bl_icon", "bl_static_type",
+    "bl_width_default", "bl_width_min", "bl_width_max", "bl_height_default", "bl_height_min", "bl_height_max",
+    "is_active_output", "warning_propagation",
+}
+
+
+def _rna_value(value):
+    """
+    Convert an RNA property value into JSON-serializable data.
+    """
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+
+    if isinstance(value, bpy.types.Image):
+        return _image_state(value)
+
+    if isinstance(value, bpy.types.ID):
+        return value.name
+
+    if hasattr(value, "elements") and hasattr(value, "interpolation"):
+        # Color ramp
+        return {
+            "interpolation": value.interpolation,
+            "color_mode": value.color_mode,
+            "elements": [(element.position, element.color[:]) for element in value.elements],
+        }
+
+    if hasattr(value, "__len__") and not isinstance(value, bpy.types.bpy_struct):
+        try:
+            return [_rna_value(item) for item in value]
+        except TypeError:
+            return None
+
+    return None
+
+
+def _image_state(image):
+    """
+    Describe an image, including the modification time of its file.
+    """
+    state = {
+        "name": image.name,
+        "source": image.source,
+        "filepath": image.filepath,
+        "colorspace": image.colorspace_settings.name,
+        "size": tuple(image.size),
+    }
+
+    if image.source in {'FILE', 'SEQUENCE', 'MOVIE'} and image.filepath:
+        path = bpy.path.abspath(image.filepath, library=image.library)
+        state["mtime"] = os.path.getmtime(path) if os.path.exists(path) else None
+
+    return state
+
+
+def _struct_values(struct, ignored=()):
+    """
+    Collect the simple RNA properties of a struct.
+    """
+    values = {}
+
+    for prop in struct.bl_rna.properties:
+        name = prop.identifier
+
+        if name in ignored or name == "rna_type" or prop.is_readonly or prop.type == 'COLLECTION':
+            continue
+
+        if prop.type == 'POINTER' and not isinstance(getattr(struct, name, None), bpy.types.ID) \
+                and name != "color_ramp":
+            continue
+
+        values[name] = _rna_value(getattr(struct, name, None))
+
+    return values
+
+
+def get_animated_paths(id_data):
+    """
+    Collect the data paths driven by keyframes or drivers of an ID datablock.
+
+    Their current values depend on the frame the fingerprint is taken at,
+    so they are described by the animation data instead.
+    """
+    anim = getattr(id_data, "animation_data", None)
+
+    if anim is None:
+        return set()
+
+    return {fcurve.data_path for fcurve in list(anim.drivers) + _action_fcurves(anim)}
+
+
+def _action_fcurves(anim):
+    """
+    List the F-Curves of the action slot assigned to an animation data block.
+    """
+    fcurves = []
+    slot = getattr(anim, "action_slot", None)
+
+    if anim.action is not None and slot is not None:
+        for layer in anim.action.layers:
+            for strip in layer.strips:
+                channelbag = strip.channelbag(slot)
+                if channelbag is not None:
+                    fcurves.extend(channelbag.fcurves)
+
+    return fcurves
+
+
+def _animation_state(id_data):
+    """
+    Describe the keyframes and drivers of an ID datablock.
+    """
+    anim = getattr(id_data, "animation_data", None)
+
+    if anim is None:
+        return None
+
+    def fcurve_state(fcurve):
+        return {
+            "path": fcurve.data_path,
+            "index": fcurve.array_index,
+            "mute": fcurve.mute,
+            "extrapolation": fcurve.extrapolation,
+            "modifiers": [modifier.type for modifier in fcurve.modifiers],
+            "keys": [
+                (point.co[:], point.interpolation, point.handle_left[:], point.handle_right[:])
+                for point in fcurve.keyframe_points
+            ],
+        }
+
+    return {
+        "action": anim.action.name if anim.action else None,
+        "fcurves": [fcurve_state(fcurve) for fcurve in _action_fcurves(anim)],
+        "drivers": [
+            dict(fcurve_state(fcurve), expression=fcurve.driver.expression,
+                 variables=[(v.name, v.type, [(t.id.name if t.id else None, t.data_path) for t in v.targets])
+                            for v in fcurve.driver.variables])
+            for fcurve in anim.drivers
+        ],
+    }
+
+
+def describe_node(node, animated=frozenset(), visited=None):
+    """
+    Describe the settings, input values and input links of a shader node.
+
+    Args:
+        node (bpy.types.Node): Node to describe.
+        animated (set[str]): Animated data paths of the node tree; their
+            frame dependent values are left out.
+        visited (set[str], optional): Node groups already described.
+
+    Returns:
+        dict: JSON-serializable node description.
+    """
+    prefix = f'nodes["{node.name}"].'
+
+    state = {
+        "idname": node.bl_idname,
+        "name": node.name,
+        "mute": node.mute,
+        "settings": _struct_values(
+            node, IGNORED_NODE_PROPERTIES | {
+                path.rsplit(".", 1)[-1] for path in animated if path.startswith(prefix)
+            }
+        ),
+        "inputs": [
+            (
+                socket.identifier,
+                None if f'{prefix}inputs[{index}].default_value' in animated
+                else _rna_value(getattr(socket, "default_value", None)),
+                [(link.from_node.name, link.from_socket.identifier, link.is_muted) for link in socket.links],
+            )
+            for index, socket in enumerate(node.inputs)
+        ],
+    }
+
+    if getattr(node, "node_tree", None) is not None:
+        state["group"] = _node_tree_state(node.node_tree, set() if visited is None else visited)
+
+    return state
+
+
+def _node_tree_state(node_tree, visited):
+    """
+    Describe the structure, node settings and animation of a node tree.
+    """
+    if node_tree is None or node_tree.name in visited:
+        return node_tree.name if node_tree else None
+
+    visited.add(node_tree.name)
+    animated = get_animated_paths(node_tree)
+
+    return {
+        "nodes": [describe_node(node, animated, visited) for node in sorted(node_tree.nodes, key=lambda n: n.name)],
+        "animation": _animation_state(node_tree),
+    }
+
+
+def _settings_state(props, bake_type):
+    """
+    Describe the add-on settings that affect a pass.
+    """
+    settings = {}
+
+    for prop in props.bl_rna.properties:
+        name = prop.identifier
+
+        if (name == "rna_type" or name in IGNORED_SETTINGS or name in STATUS_SETTINGS
+                or name.startswith(IGNORED_SETTING_PREFIXES)):
+            continue
+
+        if name.startswith(PER_PASS_SETTING_PREFIXES):
+            if not name.endswith(f"_{bake_type.lower()}"):
+                continue
+            value = getattr(props, name)
+            settings[name] = _struct_values(value) if hasattr(value, "bl_rna") else _rna_value(value)
+            continue
+
+        settings[name] = _rna_value(getattr(props, name))
+
+    return settings
+
+
+def compute_pass_fingerprint(scene, props, obj, material, bake_type):
+    """
+    Fingerprint everything a (material, pass) output depends on.
+
+    Covers the relevant add-on settings, the Cycles and bake settings of the
+    scene, the material node tree (structure, node settings, socket values,
+    images and node groups) and the animation data of the material, its node
+    tree, the object and its shape keys. The frame range is not part of the
+    fingerprint; baked frames are tracked separately in the manifest.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        props (SequencedBakeProperties): Add-on settings.
+        obj (bpy.types.Object): Object being baked.
+        material (bpy.types.Material): Material being baked.
+        bake_type (str): The bake pass type.
+
+    Returns:
+        str: Hex digest of the fingerprint.
+    """
+    shape_keys = getattr(obj.data, "shape_keys", None)
+
+    state = {
+        "bake_type": bake_type,
+        "settings": _settings_state(props, bake_type),
+        "bake": _struct_values(scene.render.bake),
+        "cycles": _struct_values(scene.cycles),
+        "object": {
+            "name": obj.name,
+            "data": obj.data.name,
+            "modifiers": [_struct_values(modifier) for modifier in obj.modifiers],
+            "animation": _animation_state(obj),
+            "shape_keys": _animation_state(shape_keys) if shape_keys else None,
+        },
+        "material": {
+            "name": material.name,
+            "settings": _struct_values(material, get_animated_paths(material)),
+            "animation": _animation_state(material),
+            "node_tree": _node_tree_state(material.node_tree, set()),
+        },
+    }
+
+    encoded = json.dumps(state, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+# Passes whose result depends on lights, the world and other objects.
+LIGHTING_DEPENDENT_BAKE_TYPES = {"COMBINED", "DIFFUSE", "GLOSSY", "TRANSMISSION", "SHADOW", "AO", "ENVIRONMENT"}
+
+# Passes that trace other objects; the ORM occlusion channel bakes an Ambient Occlusion node.
+SCENE_DEPENDENT_BAKE_TYPES = LIGHTING_DEPENDENT_BAKE_TYPES | {"OCCLUSION"}
+
+# Shader nodes whose rays hit other objects.
+SCENE_DEPENDENT_NODE_TYPES = {'AMBIENT_OCCLUSION', 'BEVEL'}
+
+# Shader nodes that can change over time on their own.
+TIME_DEPENDENT_NODE_TYPES = {'SCRIPT', 'TEX_POINTDENSITY'}
+
+# Image sources whose pixels follow the scene frame without any keyframes.
+TIME_DEPENDENT_IMAGE_SOURCES = {'SEQUENCE', 'MOVIE'}
+
+
+def _animated_values(id_data):
+    """
+    Read the current values of every animated or driven path of an ID datablock.
+    """
+    values = []
+
+    for path in sorted(get_animated_paths(id_data)):
+        try:
+            value = id_data.path_resolve(path)
+        except ValueError:
+            continue
+        values.append((path, _rna_value(value)))
+
+    return values
+
+
+def _node_tree_animated_values(node_tree, visited=None):
+    """
+    Read the animated values of a node tree and of the node groups it uses,
+    keyed by node tree name.
+    """
+    visited = set() if visited is None else visited
+    values = {}
+
+    if node_tree is None or node_tree.name in visited:
+        return values
+
+    visited.add(node_tree.name)
+    values[node_tree.name] = _animated_values(node_tree)
+
+    for node in node_tree.nodes:
+        group = getattr(node, "node_tree", None)
+        if group is not None:
+            values.update(_node_tree_animated_values(group, visited))
+
+    return values
+
+
+def _has_time_dependent_nodes(node_tree, visited=None):
+    """
+    Check whether a node tree (or a node group in it) holds an image
+    sequence, a movie or a node that changes over time without animation.
+    """
+    visited = set() if visited is None else visited
+
+    if node_tree is None:
+        return False
+
+    for node in node_tree.nodes:
+        if node.type in TIME_DEPENDENT_NODE_TYPES:
+            return True
+
+        image = getattr(node, "image", None)
+        if image is not None and image.source in TIME_DEPENDENT_IMAGE_SOURCES:
+            return True
+
+        group = getattr(node, "node_tree", None)
+        if group is not None and group.name not in visited:
+            visited.add(group.name)
+            if _has_time_dependent_nodes(group, visited):
+                return True
+
+    return False
+
+
+def _has_scene_dependent_nodes(node_tree, visited=None):
+    """
+    Check whether a node tree (or a node group in it) holds a node that
+    traces other objects.
+    """
+    visited = set() if visited is None else visited
+
+    if node_tree is None:
+        return False
+
+    for node in node_tree.nodes:
+        if node.type in SCENE_DEPENDENT_NODE_TYPES:
+            return True
+
+        group = getattr(node, "node_tree", None)
+        if group is not None and group.name not in visited:
+            visited.add(group.name)
+            if _has_scene_dependent_nodes(group, visited):
+                return True
+
+    return False
+
+
+def _object_state_digest(obj, depsgraph):
+    """
+    Hash the world transform and the deformed vertex positions of an object.
+    """
+    digest = hashlib.sha256()
+    obj_eval = obj.evaluated_get(depsgraph)
+    digest.update(np.array(obj_eval.matrix_world, dtype=np.float32).tobytes())
+
+    if obj_eval.type == 'MESH':
+        mesh = obj_eval.data
+        positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", positions)
+        digest.update(positions.tobytes())
+
+    return digest.hexdigest()
+
+
+def compute_frame_digest(scene, props, obj, material, bake_type, object_digests=None):
+    """
+    Hash the evaluated inputs that drive a (material, pass) output at the current frame.
+
+    Covers the current values of animated/driven material and node tree
+    properties (including node groups) and the deformed vertex buffer and transform of the baked
+    object (and selected-to-active sources). Passes that trace the scene
+    (lighting passes, occlusion, or node trees with Ambient Occlusion or
+    Bevel nodes) also include the animated values and transforms of every
+    other visible object; lighting passes add the world. Node trees with image sequences, movies or other time
+    dependent nodes add the scene frame, so their frames never match.
+    Frames with equal digests bake to identical images.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked, already at the frame.
+        props (SequencedBakeProperties): Add-on settings.
+        obj (bpy.types.Object): Object being baked.
+        material (bpy.types.Material): Material being baked.
+        bake_type (str): The bake pass type.
+        object_digests (dict[str, str], optional): Per-frame cache of object
+            digests keyed by object name.
+
+    Returns:
+        str: Hex digest of the frame inputs.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    object_digests = {} if object_digests is None else object_digests
+
+    def object_digest(target):
+        if target.name not in object_digests:
+            object_digests[target.name] = _object_state_digest(target, depsgraph)
+        return object_digests[target.name]
+
+    objects = [obj]
+    if props.sequenced_selected_to_active:
+        objects += [o for o in bpy.context.selected_objects if o != obj]
+
+    if bake_type in SCENE_DEPENDENT_BAKE_TYPES or _has_scene_dependent_nodes(material.node_tree):
+        objects += [o for o in scene.objects if o not in objects and o.visible_get()]
+
+    state = {
+        "material": _animated_values(material),
+        "node_tree": _node_tree_animated_values(material.node_tree),
+        "objects": [(o.name, object_digest(o), _animated_values(o.data) if o.data else None) for o in objects],
+    }
+
+    time_dependent = _has_time_dependent_nodes(material.node_tree)
+
+    if bake_type in LIGHTING_DEPENDENT_BAKE_TYPES and scene.world:
+        state["world"] = _animated_values(scene.world)
+        if scene.world.node_tree:
+            state["world_nodes"] = _node_tree_animated_values(scene.world.node_tree)
+            time_dependent = time_dependent or _has_time_dependent_nodes(scene.world.node_tree)
+
+    if time_dependent:
+        state["frame"] = scene.frame_current
+
+    encoded = json.dumps(state, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_manifest(output_root):
+    """
+    Read the fingerprint manifest of an output directory.
+
+    Args:
+        output_root (str): Output directory of the bake tier.
+
+    Returns:
+        dict[str, dict]: Entries keyed by "<material>/<bake_type>", each with
+        a "fingerprint" and the list of baked "frames".
+    """
+    path = os.path.join(output_root, MANIFEST_FILENAME)
+
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_root, manifest):
+    """
+    Atomically write the fingerprint manifest of an output directory.
+    """
+    os.makedirs(output_root, exist_ok=True)
+    path = os.path.join(output_root, MANIFEST_FILENAME)
+    temp_path = path + ".tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=1, sort_keys=True)
+
+    os.replace(temp_path, path)
+
+
+def get_manifest_key(material, bake_type):
+    """
+    Build the manifest key of a (material, pass) output.
+    """
+    return f"{material.name}/{bake_type}"
+
+
+def is_frame_current(manifest, material, bake_type, fingerprint, frame):
+    """
+    Check whether a frame of a pass was baked with the current fingerprint.
+    """
+    entry = manifest.get(get_manifest_key(material, bake_type))
+    return bool(entry) and entry.get("fingerprint") == fingerprint and int(frame) in entry.get("frames", [])
+
+
+def mark_frame_baked(manifest, material, bake_type, fingerprint, frame):
+    """
+    Record a baked frame; a changed fingerprint discards the older frames.
+    """
+    key = get_manifest_key(material, bake_type)
+    entry = manifest.get(key)
+
+    if not entry or entry.get("fingerprint") != fingerprint:
+        entry = manifest[key] = {"fingerprint": fingerprint, "frames": []}
+
+    if int(frame) not in entry["frames"]:
+        entry["frames"].append(int(frame))
+
+
+def discard_pass(manifest, material, bake_type):
+    """
+    Forget the baked frames of a (material, pass) output.
+
+    Returns:
+        bool: True if the manifest had an entry for the output.
+    """
+    return manifest.pop(get_manifest_key(material, bake_type), None) is not None
@@ -0,0 +1,412 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import json
+import os
+
+import bpy
+import numpy as np
+
+from .processing import (
+    convert_channel_layout,
+    save_pixels,
+)
+
+# Extension of the raw frame array; the JSON header sits next to it.
+FRAME_STORE_EXTENSION = "seqraw"
+FRAME_STORE_HEADER_EXTENSION = "json"
+
+FRAME_STORE_VERSION = 1
+
+# Stored sample types per frame store precision setting.
+FRAME_STORE_DTYPES = {"HALF": "float16", "BYTE": "uint8"}
+
+
+def get_frame_store_path(output_root, obj, mat, bake_type):
+    """
+    Build the raw array path of a (object, material, pass) frame store.
+    """
+    return os.path.join(output_root, f"{obj.name}_{mat.name}_{bake_type}.{FRAME_STORE_EXTENSION}")
+
+
+def get_header_path(path):
+    """
+    Return the JSON header path of a frame store.
+    """
+    return f"{os.path.splitext(path)[0]}.{FRAME_STORE_HEADER_EXTENSION}"
+
+
+def get_frame_store_frames(path, frames, height, width, precision):
+    """
+    List the frames an earlier bake wrote into a frame store that
+    FrameStoreWriter would reopen for the given bake.
+
+    Args:
+        path (str): Raw array path.
+        frames (list[int]): Frames of the bake, in order.
+        height (int): Frame height in pixels.
+        width (int): Frame width in pixels.
+        precision (str): Key of FRAME_STORE_DTYPES.
+
+    Returns:
+        set[int]: Written frames; empty if the store is missing or would be
+        replaced.
+    """
+    if not os.path.exists(path):
+        return set()
+
+    try:
+        with open(get_header_path(path), "r", encoding="utf-8") as handle:
+            header = json.load(handle)
+
+        if (header["frames"] != list(frames) or header["shape"][1:3] != [height, width]
+                or header["dtype"] != FRAME_STORE_DTYPES[precision]):
+            return set()
+
+        return {int(frame) for frame in header["written"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return set()
+
+
+def quantize_pixels(pixels, dtype):
+    """
+    Convert float pixels to the stored sample type.
+    """
+    if dtype == "uint8":
+        return np.rint(np.clip(pixels, 0.0, 1.0) * 255.0).astype(np.uint8)
+
+    return np.asarray(pixels, dtype=dtype)
+
+
+def to_rgba_float(pixels, dtype):
+    """
+    Expand stored (height, width, C) samples to (height, width, 4) float32
+    RGBA pixels. One channel is grayscale, two are grayscale + alpha.
+    """
+    pixels = np.asarray(pixels, dtype=np.float32)
+
+    if dtype == "uint8":
+        pixels = pixels / 255.0
+
+    height, width, channels = pixels.shape
+    rgba = np.ones((height, width, 4), dtype=np.float32)
+
+    if channels <= 2:
+        rgba[:, :, :3] = pixels[:, :, 0:1]
+        if channels == 2:
+            rgba[:, :, 3] = pixels[:, :, 1]
+    else:
+        rgba[:, :, :channels] = pixels
+
+    return rgba
+
+
+class FrameStore:
+    """
+    One preallocated, memory-mapped array holding every frame of a pass.
+
+    The array has the shape (frame count, height, width, channels) with row 0
+    at the bottom, as in Blender's pixel buffers. The JSON header records the
+    shape, sample type, color space, channel layout and which frames have
+    been written, so readers get zero-copy access to any frame.
+    """
+
+    def __init__(self, path, header, array):
+        self.path = path
+        self.header = header
+        self._array = array
+        self._index = {int(frame): index for index, frame in enumerate(header["frames"])}
+
+    @classmethod
+    def create(cls, path, frames, height, width, channels, dtype, colorspace, channel_layout='DEFAULT'):
+        """
+        Preallocate a new frame store, replacing any existing one.
+
+        Args:
+            path (str): Raw array path.
+            frames (list[int]): Frames the store has slots for.
+            height (int): Frame height in pixels.
+            width (int): Frame width in pixels.
+            channels (int): Channels per pixel.
+            dtype (str): 'float16' or 'uint8'.
+            colorspace (str): Color space of the stored pixels.
+            channel_layout (str): Channel layout the frames were reduced to.
+
+        Returns:
+            FrameStore: Writable store.
+        """
+        header = {
+            "version": FRAME_STORE_VERSION,
+            "shape": [len(frames), height, width, channels],
+            "dtype": dtype,
+            "colorspace": colorspace,
+            "channel_layout": channel_layout,
+            "frames": list(frames),
+            "written": [],
+        }
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        array = np.memmap(path, dtype=dtype, mode='w+', shape=tuple(header["shape"]))
+
+        store = cls(path, header, array)
+        store.write_header()
+        return store
+
+    @classmethod
+    def open(cls, path, writable=False):
+        """
+        Open an existing frame store.
+
+        Args:
+            path (str): Raw array path.
+            writable (bool): Map the array for writing.
+
+        Returns:
+            FrameStore: The opened store.
+        """
+        with open(get_header_path(path), "r", encoding="utf-8") as handle:
+            header = json.load(handle)
+
+        array = np.memmap(path, dtype=header["dtype"], mode='r+' if writable else 'r', shape=tuple(header["shape"]))
+        return cls(path, header, array)
+
+    @property
+    def frames(self):
+        """
+        list[int]: Frames written so far, in order.
+        """
+        return sorted(self.header["written"])
+
+    @property
+    def channels(self):
+        """
+        int: Channels per pixel.
+        """
+        return self.header["shape"][3]
+
+    @property
+    def colorspace(self):
+        """
+        str: Color space of the stored pixels.
+        """
+        return self.header["colorspace"]
+
+    @property
+    def channel_layout(self):
+        """
+        str: Channel layout the frames were reduced to.
+        """
+        return self.header["channel_layout"]
+
+    def __contains__(self, frame):
+        return frame in self.header["written"]
+
+    def __len__(self):
+        return len(self.header["written"])
+
+    def matches(self, frames, height, width, channels, dtype):
+        """
+        Check whether the store can take the frames of a bake unchanged.
+        """
+        return (
+            self.header["frames"] == list(frames)
+            and self.header["shape"] == [len(frames), height, width, channels]
+            and self.header["dtype"] == dtype
+        )
+
+    def get(self, frame):
+        """
+        Return a frame without copying it.
+
+        Args:
+            frame (int): Frame number.
+
+        Returns:
+            np.ndarray: (height, width, channels) view into the mapped file.
+
+        Raises:
+            KeyError: If the frame has not been written.
+        """
+        if frame not in self:
+            raise KeyError(f"frame {frame} is not in {os.path.basename(self.path)}")
+
+        return self._array[self._index[frame]]
+
+    def get_float(self, frame):
+        """
+        Return a frame as (height, width, 4) float32 RGBA pixels.
+        """
+        return to_rgba_float(self.get(frame), self.header["dtype"])
+
+    def write(self, frame, pixels):
+        """
+        Store the pixels of a frame and flush it to disk.
+
+        Args:
+            frame (int): Frame number.
+            pixels (np.ndarray): (height, width, channels) float pixels.
+        """
+        self._array[self._index[frame]] = quantize_pixels(pixels, self.header["dtype"])
+        self._array.flush()
+
+        if frame not in self.header["written"]:
+            self.header["written"].append(frame)
+
+        self.write_header()
+
+    def write_header(self):
+        """
+        Atomically rewrite the JSON header.
+        """
+        path = get_header_path(self.path)
+        temp_path = f"{path}.tmp"
+
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(self.header, handle, indent=2)
+
+        os.replace(temp_path, path)
+
+    def close(self):
+        """
+        Release the memory map.
+        """
+        if self._array is not None and self._array.mode != 'r':
+            self._array.flush()
+
+        self._array = None
+
+
+class FrameStoreWriter:
+    """
+    Routes baked frames into one frame store per pass.
+
+    Stores are created on the first frame of a pass, once its resolution is
+    known. A store left by an earlier bake with the same frames and shape is
+    reopened so resumed and incremental bakes keep its frames.
+    """
+
+    def __init__(self, frames, precision):
+        """
+        Args:
+            frames (list[int]): Frames of the bake, in order.
+            precision (str): Key of FRAME_STORE_DTYPES.
+        """
+        self._frames = list(frames)
+        self._dtype = FRAME_STORE_DTYPES[precision]
+        self._stores = {}
+
+    def add(self, path, frame, pixels, colorspace, alpha, channel_layout='DEFAULT'):
+        """
+        Append the baked pixels of one frame to the store of its pass.
+
+        Args:
+            path (str): Raw array path of the pass.
+            frame (int): Frame number.
+            pixels (np.ndarray): (height, width, 4) baked pixels.
+            colorspace (str): Color space of the baked image.
+            alpha (bool): Whether the default layout keeps alpha.
+            channel_layout (str): Channel layout of the pass.
+        """
+        pixels = convert_channel_layout(pixels, channel_layout, alpha)
+        height, width, channels = pixels.shape
+
+        store = self._stores.get(path)
+
+        if store is None and os.path.exists(path) and os.path.exists(get_header_path(path)):
+            try:
+                store = FrameStore.open(path, writable=True)
+            except (OSError, ValueError, KeyError):
+                store = None
+
+            if store is not None and not store.matches(self._frames, height, width, channels, self._dtype):
+                store.close()
+                store = None
+
+        if store is None:
+            store = FrameStore.create(
+                path, self._frames, height, width, channels, self._dtype, colorspace, channel_layout
+            )
+
+        self._stores[path] = store
+        store.write(frame, pixels)
+
+    def close(self):
+        """
+        Flush and release every open store.
+        """
+        for store in self._stores.values():
+            store.close()
+
+        self._stores.clear()
+
+
+def export_frame_store(path, output_dir=None, image_format=None):
+    """
+    Write the frames of a store as individual images, in the same
+    `<object>_<material>_<pass>/<frame>.<ext>` layout a regular bake uses.
+
+    Images are saved with the scene's output settings.
+
+    Args:
+        path (str): Raw array path.
+        output_dir (str, optional): Target directory. Defaults to the
+            per-frame directory next to the store.
+        image_format (str, optional): File extension. Defaults to the
+            scene's output format.
+
+    Returns:
+        int: Number of frames written.
+    """
+    store = FrameStore.open(path)
+
+    try:
+        return export_frames(store, output_dir or os.path.splitext(path)[0], image_format)
+    finally:
+        store.close()
+
+
+def export_frames(reader, output_dir, image_format=None):
+    """
+    Save every frame of a frame reader as `<output_dir>/<frame>.<ext>`.
+
+    Args:
+        reader: Object with `frames`, `channels`, `colorspace`,
+            `channel_layout` and `get_float(frame)` (e.g. FrameStore).
+        output_dir (str): Target directory.
+        image_format (str, optional): File extension. Defaults to the
+            scene's output format.
+
+    Returns:
+        int: Number of frames written.
+    """
+    if image_format is None:
+        image_format = bpy.context.scene.sequenced_bake_props.sequenced_bake_image_format
+
+    os.makedirs(output_dir, exist_ok=True)
+    name = os.path.basename(os.path.normpath(output_dir))
+
+    for frame in reader.frames:
+        save_pixels(
+            reader.get_float(frame),
+            name=f"{name}_{frame}",
+            filepath=os.path.join(output_dir, f"{frame}.{image_format}"),
+            alpha=reader.channels in {2, 4},
+            colorspace=reader.colorspace,
+            channel_layout=reader.channel_layout,
+        )
+
+    return len(reader.frames)
@@ -0,0 +1,161 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import hashlib
+import json
+import os
+
+# Journal of completed tasks, one JSON object per line, in the output root.
+JOURNAL_FILENAME = ".sequenced_bake_journal.jsonl"
+
+
+def get_task_key(obj, mat, bake_type, frame):
+    """
+    Build the journal key of a task.
+
+    One output root holds the outputs of every object baked into it, so
+    the key includes the object.
+
+    Args:
+        obj (bpy.types.Object): Object being baked.
+        mat (bpy.types.Material | None): Material of the task (None for
+            tasks covering all materials).
+        bake_type (str): The bake pass type or task marker.
+        frame (int): Frame number.
+
+    Returns:
+        tuple[str, str, str, int]: (object name, material name, bake_type, frame).
+    """
+    return (obj.name, mat.name if mat else "", bake_type, int(frame))
+
+
+def file_digest(filepath, chunk_size=1 << 20):
+    """
+    Compute the SHA-256 hex digest of a file.
+    """
+    digest = hashlib.sha256()
+
+    with open(filepath, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def reset_journal(output_root):
+    """
+    Delete the journal of an output directory, if any.
+    """
+    path = os.path.join(output_root, JOURNAL_FILENAME)
+
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def load_journal(output_root):
+    """
+    Read the completed tasks recorded in an output directory.
+
+    Truncated trailing lines (e.g. from a crash while writing) and records
+    without an object name, written by older versions, are ignored.
+
+    Args:
+        output_root (str): Output directory of the bake tier.
+
+    Returns:
+        dict[tuple[str, str, str, int], list[dict]]: Output files per task key.
+    """
+    path = os.path.join(output_root, JOURNAL_FILENAME)
+    entries = {}
+
+    if not os.path.exists(path):
+        return entries
+
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+                obj_name, material, bake_type, frame = record["task"]
+                entries[(obj_name, material, bake_type, int(frame))] = record["files"]
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    return entries
+
+
+def record_task(output_root, key, filepaths, digests=None):
+    """
+    Append a completed task and the size and hash of its outputs to the journal.
+
+    Args:
+        output_root (str): Output directory of the bake tier.
+        key (tuple[str, str, str, int]): Task key (see get_task_key).
+        filepaths (list[str]): Absolute paths of the files the task wrote.
+        digests (list[str], optional): Known SHA-256 digests of the files,
+            in the same order (e.g. of the frame a replica links to).
+
+    Returns:
+        dict[str, str]: SHA-256 digest per given file path, so callers can
+        reuse the hashes; empty if an output is missing.
+    """
+    files = []
+
+    for index, filepath in enumerate(filepaths):
+        if not os.path.exists(filepath):
+            # Missing outputs leave the task unverified so it is baked again.
+            return {}
+
+        files.append({
+            "path": os.path.relpath(filepath, output_root),
+            "size": os.path.getsize(filepath),
+            "sha256": digests[index] if digests else file_digest(filepath),
+        })
+
+    os.makedirs(output_root, exist_ok=True)
+
+    with open(os.path.join(output_root, JOURNAL_FILENAME), "a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"task": list(key), "files": files}) + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+
+    return {filepath: entry["sha256"] for filepath, entry in zip(filepaths, files)}
+
+
+def verify_task(output_root, files):
+    """
+    Check that the recorded outputs of a task are still intact on disk.
+
+    Args:
+        output_root (str): Output directory of the bake tier.
+        files (list[dict]): Recorded files of the task (see load_journal).
+
+    Returns:
+        bool: True if every file exists with the recorded size and hash.
+    """
+    if not files:
+        return False
+
+    for entry in files:
+        filepath = os.path.join(output_root, entry["path"])
+
+        if not os.path.exists(filepath) or os.path.getsize(filepath) != entry["size"]:
+            return False
+
+        if file_digest(filepath) != entry["sha256"]:
+            return False
+
+    return True
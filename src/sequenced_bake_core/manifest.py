@@ -0,0 +1,224 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import json
+import os
+import time
+
+from .journal import file_digest
+
+# Output index written to the root of every bake tier.
+BAKE_MANIFEST_FILENAME = "bake_manifest.json"
+
+BAKE_MANIFEST_VERSION = 1
+
+# New entries recorded before the manifest is rewritten mid-bake.
+MANIFEST_SAVE_INTERVAL = 50
+
+
+def get_shard_name(frame, shard_size):
+    """
+    Name of the shard subdirectory holding a frame.
+
+    Args:
+        frame (int): Frame number.
+        shard_size (int): Frames per shard.
+
+    Returns:
+        str: Zero-padded first frame of the shard (e.g. '001000').
+    """
+    return f"{frame // shard_size * shard_size:06d}"
+
+
+def is_shard_name(name):
+    """
+    Check whether a directory name is a shard subdirectory (see get_shard_name).
+    """
+    return len(name) >= 6 and name.isdigit()
+
+
+class BakeManifest:
+    """
+    Index of every file written under an output root.
+
+    Each entry records the frame, object, material, pass, resolution, size
+    and SHA-256 checksum of one output, so consumers can open files
+    directly instead of listing and sorting directories. Entries of earlier
+    runs into the same root are kept while their file exists; each frame of
+    a directory keeps one entry, so re-baking a frame to another path
+    (sharding toggled, another format) replaces the older entry.
+    """
+
+    def __init__(self, output_root, obj, image_format, shard_size=0):
+        """
+        Args:
+            output_root (str): Root output directory of the bake tier.
+            obj (bpy.types.Object): Object being baked.
+            image_format (str): File extension of the outputs.
+            shard_size (int): Frames per shard subdirectory; 0 when not sharded.
+        """
+        self.output_root = output_root
+        self._header = {
+            "version": BAKE_MANIFEST_VERSION,
+            "object": obj.name,
+            "image_format": image_format,
+            "shard_size": shard_size,
+        }
+        self._files = {}
+        self._unsaved = 0
+        self._frames = {}
+
+        for entry in _get_current_entries(output_root, load_bake_manifest(output_root).get("files", [])):
+            self._files[entry["path"]] = entry
+            self._frames[(entry["directory"], entry["frame"])] = entry["path"]
+
+    def add(self, filepath, mat, bake_type, frame, width, height, sha256=None):
+        """
+        Record a written output.
+
+        Args:
+            filepath (str): Absolute path of the file.
+            mat (bpy.types.Material): Material of the output.
+            bake_type (str): The bake pass type.
+            frame (int): Frame number.
+            width (int): Image width in pixels.
+            height (int): Image height in pixels.
+            sha256 (str, optional): Digest already computed for the file
+                (e.g. by the journal); hashed here otherwise.
+        """
+        path = os.path.relpath(filepath, self.output_root).replace(os.sep, "/")
+        directory = path.split("/", 1)[0]
+
+        previous = self._frames.get((directory, frame))
+        if previous is not None and previous != path:
+            del self._files[previous]
+
+        self._frames[(directory, frame)] = path
+        self._files[path] = {
+            "path": path,
+            "directory": directory,
+            "frame": frame,
+            "material": mat.name,
+            "pass": bake_type,
+            "width": width,
+            "height": height,
+            "bytes": os.path.getsize(filepath),
+            "sha256": sha256 or file_digest(filepath),
+        }
+
+        self._unsaved += 1
+        if self._unsaved >= MANIFEST_SAVE_INTERVAL:
+            self.save()
+
+    def save(self):
+        """
+        Atomically write the manifest, ordered by directory and frame.
+        """
+        manifest = dict(self._header)
+        manifest["updated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        manifest["files"] = sorted(self._files.values(), key=lambda entry: (entry["directory"], entry["frame"]))
+
+        path = os.path.join(self.output_root, BAKE_MANIFEST_FILENAME)
+        temp_path = f"{path}.tmp"
+
+        os.makedirs(self.output_root, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=1)
+
+        os.replace(temp_path, path)
+        self._unsaved = 0
+
+
+def load_bake_manifest(output_root):
+    """
+    Read the bake manifest of an output root.
+
+    Returns:
+        dict: The manifest, or an empty dict if missing or unreadable.
+    """
+    path = os.path.join(output_root, BAKE_MANIFEST_FILENAME)
+
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _get_current_entries(output_root, entries):
+    """
+    Drop manifest entries whose file no longer exists and keep the most
+    recently written entry of each (directory, frame).
+
+    Args:
+        output_root (str): Output root the entry paths are relative to.
+        entries (list[dict]): Manifest file entries.
+
+    Returns:
+        list[dict]: Remaining entries.
+    """
+    current = {}
+
+    for entry in entries:
+        try:
+            filepath = os.path.join(output_root, *entry["path"].split("/"))
+            key = (entry["directory"], entry["frame"])
+        except (KeyError, TypeError, AttributeError):
+            continue
+
+        if not os.path.exists(filepath):
+            continue
+
+        mtime = os.path.getmtime(filepath)
+        if key not in current or mtime >= current[key][0]:
+            current[key] = (mtime, entry)
+
+    return [entry for _, entry in current.values()]
+
+
+def find_manifest_files(directory):
+    """
+    List the outputs of a pass directory from the bake manifest of its
+    output root, without scanning the directory.
+
+    Args:
+        directory (str): A pass directory (`<object>_<material>_<pass>`).
+
+    Files that no longer exist are skipped, and a frame listed under
+    several paths (e.g. before and after sharding was toggled) yields only
+    its most recently written file.
+
+    Returns:
+        list[str] | None: Absolute file paths ordered by frame, or None when
+        no manifest lists the directory.
+    """
+    directory = os.path.normpath(os.path.abspath(directory))
+    output_root = os.path.dirname(directory)
+    name = os.path.basename(directory)
+
+    entries = _get_current_entries(output_root, [
+        entry for entry in load_bake_manifest(output_root).get("files", [])
+        if isinstance(entry, dict) and entry.get("directory") == name
+    ])
+
+    if not entries:
+        return None
+
+    entries.sort(key=lambda entry: entry["frame"])
+    return [os.path.join(output_root, *entry["path"].split("/")) for entry in entries]
@@ -0,0 +1,272 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import os
+
+import numpy as np
+
+from .processing import (
+    DATA_BAKE_TYPES,
+    LINEAR_IMAGE_FORMATS,
+    _linear_to_srgb,
+    get_frame_filepath,
+    resolve_channel_layout,
+    resolve_encoding,
+    save_pixels,
+)
+from .temporal import load_output_pixels
+
+# Passes holding vectors rather than colors; they are filtered as stored.
+MIP_DATA_BAKE_TYPES = DATA_BAKE_TYPES | {"SCULPT", "POSITION", "UV"}
+
+# Kaiser-windowed sinc: support radius in output pixels and window shape.
+KAISER_RADIUS = 3
+KAISER_BETA = 4.0
+
+# np.pad modes per texture extension, so edge texels filter like the texture samples.
+EXTENSION_PAD_MODES = {"Repeat": "wrap", "Mirror": "symmetric"}
+
+
+def get_mip_dir(output_dir, width, height):
+    """
+    Build the sibling directory of a pyramid level of a pass.
+
+    Args:
+        output_dir (str): Full resolution pass directory.
+        width (int): Level width in pixels.
+        height (int): Level height in pixels.
+
+    Returns:
+        str: `<output_dir>_<width>x<height>`.
+    """
+    return f"{os.path.normpath(output_dir)}_{width}x{height}"
+
+
+def get_mip_sizes(width, height, levels):
+    """
+    List the resolutions of the pyramid levels below a full resolution.
+
+    Each level halves both dimensions (rounding down); a dimension of one
+    pixel stays at one. Stops early once both dimensions reach one pixel.
+
+    Args:
+        width (int): Full resolution width in pixels.
+        height (int): Full resolution height in pixels.
+        levels (int): Number of levels.
+
+    Returns:
+        list[tuple[int, int]]: (width, height) of each level, largest first.
+    """
+    sizes = []
+
+    for _ in range(levels):
+        if width < 2 and height < 2:
+            break
+
+        width = max(1, width // 2)
+        height = max(1, height // 2)
+        sizes.append((width, height))
+
+    return sizes
+
+
+def get_filter_weights(mip_filter):
+    """
+    Weights of a 2:1 reduction filter.
+
+    Tap k (from -n to n - 1) reads input texel 2j + 1 + k for output texel j,
+    so the taps are centered between input texels 2j and 2j + 1.
+
+    Args:
+        mip_filter (str): 'BOX' or 'KAISER'.
+
+    Returns:
+        np.ndarray: 2n normalized weights.
+    """
+    if mip_filter == 'BOX':
+        return np.array([0.5, 0.5], dtype=np.float32)
+
+    taps = 2 * KAISER_RADIUS * 2
+    # Distance of each tap from the output texel center, in output texels.
+    x = (np.arange(taps) - taps // 2 + 0.5) / 2.0
+
+    window = np.i0(KAISER_BETA * np.sqrt(np.clip(1.0 - (x / KAISER_RADIUS) ** 2, 0.0, 1.0))) / np.i0(KAISER_BETA)
+    weights = np.sinc(x) * window
+
+    return (weights / weights.sum()).astype(np.float32)
+
+
+def downsample_axis(pixels, axis, weights, pad_mode='edge'):
+    """
+    Halve one axis of a pixel buffer with a separable filter.
+
+    Odd sizes are rounded down; an axis of size 1 is left unchanged.
+
+    Args:
+        pixels (np.ndarray): (height, width, channels) float32 pixels.
+        axis (int): 0 for rows, 1 for columns.
+        weights (np.ndarray): Result of get_filter_weights.
+        pad_mode (str): np.pad mode used beyond the image edges.
+
+    Returns:
+        np.ndarray: The reduced buffer.
+    """
+    size = pixels.shape[axis]
+    if size < 2:
+        return pixels
+
+    count = size // 2
+    half = len(weights) // 2
+
+    padding = [(0, 0)] * pixels.ndim
+    padding[axis] = (half, half)
+    padded = np.pad(pixels, padding, mode=pad_mode)
+
+    result = np.zeros(pixels.shape[:axis] + (count,) + pixels.shape[axis + 1:], dtype=np.float32)
+    index = [slice(None)] * pixels.ndim
+
+    for tap, weight in enumerate(weights):
+        start = tap + 1
+        index[axis] = slice(start, start + 2 * count, 2)
+        result += weight * padded[tuple(index)]
+
+    return result
+
+
+def _srgb_to_linear(rgb):
+    """
+    Decode sRGB transfer function values to linear.
+    """
+    return np.where(rgb <= 0.04045, rgb / 12.92, np.power((np.maximum(rgb, 0.04045) + 0.055) / 1.055, 2.4))
+
+
+def _normalize_normals(pixels):
+    """
+    Renormalize encoded ([0, 1] mapped) normal vectors in place.
+    """
+    vectors = pixels[:, :, :3] * 2.0 - 1.0
+    length = np.linalg.norm(vectors, axis=2, keepdims=True)
+    vectors /= np.maximum(length, 1e-8)
+    pixels[:, :, :3] = vectors * 0.5 + 0.5
+
+
+def build_mip_pyramid(pixels, levels, mip_filter='BOX', display_encoded=False, normals=False, pad_mode='edge',
+                      clip=True):
+    """
+    Reduce a full resolution frame into successive half resolution levels.
+
+    Each level is filtered from the previous one. Color is averaged in
+    linear light and normal maps are renormalized after every reduction.
+
+    Args:
+        pixels (np.ndarray): (height, width, 4) float32 pixels as stored in the output file.
+        levels (int): Number of levels below full resolution.
+        mip_filter (str): 'BOX' or 'KAISER'.
+        display_encoded (bool): Whether the color channels hold sRGB encoded values.
+        normals (bool): Whether the pixels hold encoded normal vectors.
+        pad_mode (str): np.pad mode used beyond the image edges.
+        clip (bool): Clamp levels to [0, 1] (filter ringing) for integer formats.
+
+    Returns:
+        list[np.ndarray]: Levels from largest to smallest. Stops early once
+        both dimensions reach one pixel.
+    """
+    weights = get_filter_weights(mip_filter)
+    level = np.array(pixels, dtype=np.float32)
+
+    if display_encoded:
+        level[:, :, :3] = _srgb_to_linear(level[:, :, :3])
+
+    pyramid = []
+
+    for _ in range(levels):
+        if level.shape[0] < 2 and level.shape[1] < 2:
+            break
+
+        level = downsample_axis(downsample_axis(level, 0, weights, pad_mode), 1, weights, pad_mode)
+
+        if normals:
+            _normalize_normals(level)
+
+        output = level.copy()
+
+        if display_encoded:
+            output[:, :, :3] = _linear_to_srgb(output[:, :, :3])
+
+        if clip:
+            np.clip(output, 0.0, 1.0, out=output)
+
+        pyramid.append(output)
+
+    return pyramid
+
+
+def write_mip_levels(filepath, output_dir, frame, bake_type, props):
+    """
+    Build the pyramid of a written frame and save every level.
+
+    The frame is read back from its output file, so every producer (Cycles,
+    UV render, shader evaluation, tiled bakes, interpolated frames) gets the
+    same levels. Levels are written without color management, keeping the
+    value encoding of the full resolution file.
+
+    Args:
+        filepath (str): Full resolution output file.
+        output_dir (str): Full resolution pass directory.
+        frame (int): Frame number.
+        bake_type (str): The bake pass type.
+        props: Property group containing Sequenced Bake settings.
+
+    Returns:
+        list[tuple[str, int, int]]: (path, width, height) of each written level.
+    """
+    image_format = props.sequenced_bake_image_format
+    linear_format = image_format in LINEAR_IMAGE_FORMATS
+
+    pyramid = build_mip_pyramid(
+        load_output_pixels(filepath),
+        levels=props.mip_levels,
+        mip_filter=props.mip_filter,
+        display_encoded=(
+            not linear_format and bake_type not in MIP_DATA_BAKE_TYPES and props.colorspace != "Non-Color"
+        ),
+        normals=bake_type == "NORMAL",
+        pad_mode=EXTENSION_PAD_MODES.get(props.extension, 'edge'),
+        clip=not linear_format,
+    )
+
+    channel_layout = resolve_channel_layout(bake_type, props)
+    encoding = resolve_encoding(bake_type, props)
+    written = []
+
+    for level in pyramid:
+        height, width = level.shape[:2]
+        level_path = get_frame_filepath(get_mip_dir(output_dir, width, height), frame, props)
+
+        save_pixels(
+            level,
+            name=f"{os.path.basename(output_dir)}_{width}x{height}_{frame}",
+            filepath=level_path,
+            alpha=props.sequence_is_alpha,
+            colorspace="Non-Color",
+            channel_layout=channel_layout,
+            encoding=encoding,
+        )
+
+        written.append((level_path, width, height))
+
+    return written
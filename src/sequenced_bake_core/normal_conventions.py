@@ -0,0 +1,120 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import os
+
+import numpy as np
+
+from .processing import (
+    link_or_copy,
+    resolve_channel_layout,
+    resolve_encoding,
+    save_pixels,
+)
+from .temporal import load_output_pixels
+
+# Swizzle the normal bake runs with when conventions are derived from it.
+CANONICAL_NORMAL_SWIZZLE = ("POS_X", "POS_Y", "POS_Z")
+
+# (R, G, B) swizzle of each normal map convention, as in Blender's bake settings.
+NORMAL_CONVENTION_SWIZZLES = {
+    'OPENGL': ("POS_X", "POS_Y", "POS_Z"),
+    'DIRECTX': ("POS_X", "NEG_Y", "POS_Z"),
+    'BLENDER': ("POS_X", "POS_Y", "POS_Z"),
+    'UNITY': ("POS_X", "POS_Y", "POS_Z"),
+    'UNREAL': ("POS_X", "NEG_Y", "POS_Z"),
+    'SUBSTANCE': ("POS_X", "POS_Y", "POS_Z"),
+}
+
+SWIZZLE_AXES = {"X": 0, "Y": 1, "Z": 2}
+
+
+def get_convention_dir(output_dir, convention):
+    """
+    Build the sibling directory of a normal map convention.
+
+    Args:
+        output_dir (str): Canonical normal pass directory.
+        convention (str): Key of NORMAL_CONVENTION_SWIZZLES.
+
+    Returns:
+        str: `<output_dir>_<convention>`.
+    """
+    return f"{os.path.normpath(output_dir)}_{convention}"
+
+
+def swizzle_normals(pixels, swizzle):
+    """
+    Reorder and flip the axes of a canonical (+X, +Y, +Z) normal map.
+
+    Normals are stored mapped to [0, 1], so negating an axis is 1 - value.
+
+    Args:
+        pixels (np.ndarray): (height, width, 4) canonical normal pixels.
+        swizzle (tuple[str, str, str]): Target (R, G, B) swizzle, e.g.
+            ('POS_X', 'NEG_Y', 'POS_Z').
+
+    Returns:
+        np.ndarray: New pixel buffer in the target convention.
+    """
+    axes = [SWIZZLE_AXES[channel[-1]] for channel in swizzle]
+    negate = np.array([channel.startswith("NEG") for channel in swizzle])
+
+    result = pixels.copy()
+    source = pixels[:, :, axes]
+    result[:, :, :3] = np.where(negate, 1.0 - source, source)
+
+    return result
+
+
+def write_normal_conventions(filepath, targets, props):
+    """
+    Derive normal map conventions from a written canonical normal map.
+
+    The canonical file is read once; conventions sharing a swizzle are
+    computed once and linked, and conventions matching the canonical
+    swizzle link the canonical file itself.
+
+    Args:
+        filepath (str): Canonical (+X, +Y, +Z) normal map file.
+        targets (list[tuple[str, str]]): (convention, output path) pairs.
+        props: Property group containing Sequenced Bake settings.
+    """
+    pixels = None
+    written = {CANONICAL_NORMAL_SWIZZLE: filepath}
+
+    for convention, path in targets:
+        swizzle = NORMAL_CONVENTION_SWIZZLES[convention]
+
+        if swizzle in written:
+            link_or_copy(written[swizzle], path)
+            continue
+
+        if pixels is None:
+            pixels = load_output_pixels(filepath)
+
+        save_pixels(
+            swizzle_normals(pixels, swizzle),
+            name=f"{os.path.splitext(os.path.basename(filepath))[0]}_{convention}",
+            filepath=path,
+            alpha=props.sequence_is_alpha,
+            colorspace="Non-Color",
+            channel_layout=resolve_channel_layout("NORMAL", props),
+            encoding=resolve_encoding("NORMAL", props),
+        )
+
+        written[swizzle] = path
@@ -16,6 +16,7 @@
 """
 
 import bpy
+import functools
 import os
 import time
 
@@ -25,8 +26,94 @@ from .processing import (
     connect_occlusion_node,
     reconnect_node,
     create_image_texture,
+    resolve_bake_resolution,
     bake_frame,
+    bake_packed_scalars,
+    get_packed_scalar_types,
+    get_enabled_bake_types,
+    resolve_channel_layout,
+    DATA_BAKE_TYPES,
+    PACKED_SCALAR_TASK,
     calculate_sculpt_bounds,
+    compute_uv_coverage,
+    compute_margin_index,
+    has_render_only_geometry,
+    link_or_copy,
+    get_frame_filepath,
+    get_image_pixels,
+    oiio,
+)
+from .fingerprint import (
+    FINGERPRINT_SAVE_INTERVAL,
+    compute_frame_digest,
+    compute_pass_fingerprint,
+    discard_pass,
+    is_frame_current,
+    load_manifest,
+    mark_frame_baked,
+    save_manifest,
+)
+from .journal import (
+    get_task_key,
+    load_journal,
+    record_task,
+    reset_journal,
+    verify_task,
+)
+from .static_passes import is_pass_static
+from .watch import pause_watch
+from .async_writer import AsyncImageWriter
+from .temporal_pack import (
+    TEMPORAL_PACK_BAKE_TYPES,
+    TemporalChannelPacker,
+    get_frame_groups,
+    get_packed_frames,
+    get_packed_output_dir,
+)
+from .frame_store import (
+    FrameStoreWriter,
+    export_frame_store,
+    get_frame_store_frames,
+    get_frame_store_path,
+)
+from .tile_delta import (
+    TileDeltaWriter,
+    export_tile_delta_store,
+    get_delta_store_dir,
+    get_delta_store_frames,
+)
+from .encoding_benchmark import (
+    BENCHMARK_TEXT_NAME,
+    format_benchmark_report,
+    pick_fastest,
+    run_encoding_benchmark,
+)
+from .manifest import BakeManifest
+from .mip_pyramid import (
+    get_mip_dir,
+    get_mip_sizes,
+    write_mip_levels,
+)
+from .normal_conventions import (
+    get_convention_dir,
+    write_normal_conventions,
+)
+from .color_lut import clear_view_lut_cache
+from .temporal import (
+    get_coarse_indices,
+    load_output_pixels,
+    measure_difference,
+    write_interpolated_frames,
+)
+from .shader_eval import (
+    EVALUATED_BAKE_TYPES,
+    UnsupportedNodeError,
+    bake_evaluated_frame,
+)
+from .uv_render import (
+    UV_RENDER_TASK,
+    get_uv_render_targets,
+    render_uv_frame,
 )
 
 
@@ -84,12 +171,118 @@ class SequencedBakeOperator(bpy.types.Operator):
 
         _scene (bpy.types.Scene):
             Active scene used during baking.
+
+        _denoise_stats (dict):
+            Timing statistics of the low-sample + denoise pipeline used to
+            report the time saved against the full-sample baseline.
+
+        _active_tier (str):
+            Tier currently being processed ('PREVIEW' or 'FULL'). A preview
+            run may continue into the full tier when enabled.
+
+        _output_root (str):
+            Absolute output directory of the active tier.
+
+        _uv_render_targets (list[tuple[bpy.types.Material, str]]):
+            (material, bake_type) outputs produced by the UV-space render.
+
+        _packed_scalar_types (dict[str, list[str]]):
+            Scalar bake types baked together by one packed Emission bake,
+            keyed by material name.
+
+        _resumed_task_count (int):
+            Number of tasks skipped because the journal shows them completed.
+
+        _fingerprints (dict[tuple[str, str], str]):
+            Fingerprint of each (material name, bake_type) output.
+
+        _fingerprint_manifest (dict[str, dict]):
+            Fingerprint manifest of the output directory, updated after
+            every task of an incremental bake and saved every
+            FINGERPRINT_SAVE_INTERVAL frames.
+
+        _unsaved_fingerprint_count (int):
+            Frames recorded in the fingerprint manifest since it was saved.
+
+        _sink_frames (dict[tuple[str, str], set[int]]):
+            Frames an earlier bake left in the pixel sink of each
+            (material name, bake_type) output, read while building the queue.
+
+        _skipped_task_count (int):
+            Number of tasks skipped because their fingerprint is unchanged.
+
+        _static_passes (set[tuple[str, str]]):
+            (material name, bake_type) outputs that cannot change over the
+            frame range; they are baked once and replicated.
+
+        _adaptive_baked (dict[tuple[str, str], set[int]]):
+            Indices into _frames already baked per (material name, bake_type)
+            task in adaptive frame mode.
+
+        _interpolated_frame_count (int):
+            Number of frames filled by interpolation in adaptive frame mode.
+
+        _frame_outputs (dict[tuple[str, str, str], str]):
+            First output file baked for each (material name, bake_type,
+            frame digest); later frames with the same digest reuse it.
+
+        _object_digests (tuple[int, dict[str, str]]):
+            Object state digests of the current frame.
+
+        _reused_frame_count (int):
+            Number of outputs linked from an identical earlier frame.
+
+        _coverage_cache (dict[tuple[str, int, int], np.ndarray]):
+            UV coverage masks keyed by (material name, width, height).
+
+        _margin_cache (dict[tuple[str, int, int, int], tuple[np.ndarray, np.ndarray]]):
+            Cached margin indices keyed by (material name, width, height, margin).
+
+        _unsupported_evaluations (set[tuple[str, str]]):
+            (material name, bake_type) pairs whose node graph the NumPy
+            evaluator cannot handle; these always use the Cycles bake.
+
+        _writer (AsyncImageWriter | None):
+            Background encoder used when asynchronous writing is enabled.
+
+        _pending_completions (list[tuple]):
+            (material, bake_type, frame, digests) of baked tasks whose
+            bookkeeping waits for their files to be written, in bake order.
+
+        _write_error_count (int):
+            Number of outputs the background writer failed to write.
+
+        _temporal_packer (TemporalChannelPacker | None):
+            Accumulates consecutive frames of scalar passes into the
+            channels of one image when temporal channel packing is enabled.
+
+        _frame_store_writer (FrameStoreWriter | None):
+            Appends baked frames to one memory-mapped array per pass when
+            the frame store backend is enabled.
+
+        _tile_delta_writer (TileDeltaWriter | None):
+            Stores keyframes and changed tiles per pass when the tile delta
+            store is enabled.
+
+        _bake_manifest (BakeManifest | None):
+            Index of the written files of the current tier when the bake
+            manifest is enabled.
     """
 
     bl_idname = "sequenced_bake.bake"
     bl_label = "Sequenced Bake"
     bl_options = {'REGISTER', 'UNDO'}
 
+    tier: bpy.props.EnumProperty(
+        name="Tier",
+        description="Bake tier to run",
+        items=[
+            ('FULL', "Full", "Bake at the final resolution and sample count"),
+            ('PREVIEW', "Preview", "Bake at a fraction of the resolution with minimal samples into the preview path"),
+        ],
+        default='FULL',
+    )
+
     _timer = None
     _materials = None
     _bake_map = None
@@ -103,6 +296,33 @@ class SequencedBakeOperator(bpy.types.Operator):
     _props = None
     _scene = None
     _sculpt_normalization_bounds = None
+    _denoise_stats = None
+    _active_tier = 'FULL'
+    _output_root = None
+    _uv_render_targets = None
+    _packed_scalar_types = None
+    _resumed_task_count = 0
+    _fingerprints = None
+    _fingerprint_manifest = None
+    _unsaved_fingerprint_count = 0
+    _sink_frames = None
+    _skipped_task_count = 0
+    _static_passes = None
+    _adaptive_baked = None
+    _interpolated_frame_count = 0
+    _frame_outputs = None
+    _object_digests = None
+    _reused_frame_count = 0
+    _coverage_cache = None
+    _margin_cache = None
+    _unsupported_evaluations = None
+    _writer = None
+    _pending_completions = None
+    _write_error_count = 0
+    _temporal_packer = None
+    _frame_store_writer = None
+    _tile_delta_writer = None
+    _bake_manifest = None
 
     def invoke(self, context, event):
         """
@@ -133,7 +353,18 @@ class SequencedBakeOperator(bpy.types.Operator):
         self._obj = context.active_object
         self._props.bake_progress = 0.0
         self._props.bake_status = "Starting bake..."
+        self._props.bake_denoise_report = ""
         self._start_time = time.time()
+        self._denoise_stats = {
+            "frames": 0,
+            "bake_time": 0.0,
+            "denoise_time": 0.0,
+            "baseline_time": 0.0,
+            "calibration": {},
+        }
+        self._coverage_cache = {}
+        self._margin_cache = {}
+        self._unsupported_evaluations = set()
 
         # validation (moved from execute)
         scene = self._scene
@@ -151,6 +382,34 @@ class SequencedBakeOperator(bpy.types.Operator):
             self.report({'ERROR'}, "Active object with material required")
             return {'CANCELLED'}
 
+        if props.use_tiled_bake and oiio is None:
+            self.report({'ERROR'}, "Tiled baking requires the OpenImageIO module bundled with Blender")
+            return {'CANCELLED'}
+
+        if props.bake_engine == 'UV_RENDER' and oiio is None:
+            self.report({'ERROR'}, "UV-space rendering requires the OpenImageIO module bundled with Blender")
+            return {'CANCELLED'}
+
+        if props.use_temporal_channel_packing and props.frame_mode == 'ADAPTIVE':
+            self.report({'ERROR'}, "Temporal channel packing needs every frame; use a regular frame sequence")
+            return {'CANCELLED'}
+
+        if props.use_frame_store and props.frame_mode == 'ADAPTIVE':
+            self.report({'ERROR'}, "The frame store needs every frame; use a regular frame sequence")
+            return {'CANCELLED'}
+
+        if props.use_tile_delta_store and props.frame_mode == 'ADAPTIVE':
+            self.report({'ERROR'}, "The tile delta store needs every frame; use a regular frame sequence")
+            return {'CANCELLED'}
+
+        if props.use_tile_delta_store and props.use_frame_store:
+            self.report({'ERROR'}, "Enable either the frame store or the tile delta store, not both")
+            return {'CANCELLED'}
+
+        if (props.use_async_write or props.use_direct_write) and oiio is None:
+            self.report({'ERROR'}, "Direct and background writing require the OpenImageIO module bundled with Blender")
+            return {'CANCELLED'}
+
         # materials
         if props.material_mode == 'ALL':
             self._materials = [
@@ -163,24 +422,7 @@ class SequencedBakeOperator(bpy.types.Operator):
             self.report({'ERROR'}, "No materials found")
             return {'CANCELLED'}
 
-        # bake map (same as before)
-        self._bake_map = {
-            "NORMAL": props.sequenced_bake_normal,
-            "ROUGHNESS": props.sequenced_bake_roughness,
-            "GLOSSY": props.sequenced_bake_glossy,
-            "EMIT": props.sequenced_bake_emission,
-            "AO": props.sequenced_bake_ambient_occlusion,
-            "SHADOW": props.sequenced_bake_shadow,
-            "POSITION": props.sequenced_bake_position,
-            "UV": props.sequenced_bake_uv,
-            "ENVIRONMENT": props.sequenced_bake_environment,
-            "DIFFUSE": props.sequenced_bake_diffuse,
-            "TRANSMISSION": props.sequenced_bake_transmission,
-            "COMBINED": props.sequenced_bake_combined,
-            "METALLIC": props.sequenced_bake_metallic,
-            "OCCLUSION": props.sequenced_bake_occlusion,
-            "SCULPT": props.sequenced_bake_sculpt,
-        }
+        self._bake_map = get_enabled_bake_types(props)
 
         if props.frame_mode == 'CURRENT':
             self._frames = [scene.frame_current]
@@ -200,7 +442,7 @@ class SequencedBakeOperator(bpy.types.Operator):
 
         if self._bake_map.get("SCULPT"):
 
-            if props.frame_mode == 'SEQUENCE':
+            if props.frame_mode != 'CURRENT':
                 bounds_frame = scene.frame_start
             else:
                 bounds_frame = scene.frame_current
@@ -215,8 +457,34 @@ class SequencedBakeOperator(bpy.types.Operator):
             scene.frame_set(current_frame)
             bpy.context.view_layer.update()
 
+        # Static-pass analysis: outputs that cannot change are baked once.
+        self._static_passes = set()
+
+        if props.use_static_pass_detection and len(self._frames) > 1:
+            for mat in self._materials:
+                for bake_type, enabled in self._bake_map.items():
+                    if self.has_pixel_sink(bake_type):
+                        continue
+
+                    if enabled and is_pass_static(scene, props, self._obj, mat, bake_type):
+                        self._static_passes.add((mat.name, bake_type))
+
+            if self._static_passes:
+                self.report({'INFO'}, f"{len(self._static_passes)} static passes will be baked once and replicated")
+
+        self._pending_completions = []
+        self._write_error_count = 0
+        clear_view_lut_cache()
+        self._writer = (
+            AsyncImageWriter(props.async_write_threads, props.async_write_queue_depth)
+            if props.use_async_write else None
+        )
+
+        # Watch mode re-bakes would fight the sequence bake for the scene.
+        pause_watch(True)
+
         # build task queue
-        self._build_tasks()
+        self.start_tier(self.tier)
 
         wm = context.window_manager
         self._timer = wm.event_timer_add(0.01, window=context.window)
@@ -224,6 +492,73 @@ class SequencedBakeOperator(bpy.types.Operator):
 
         return {'RUNNING_MODAL'}
 
+    def start_tier(self, tier):
+        """
+        Prepares the task queue and output location for a bake tier.
+
+        The preview tier runs the same task queue as the full bake, at a
+        fraction of the resolution and a minimal sample count, into a
+        separate preview directory.
+
+        Args:
+            tier (str): 'PREVIEW' or 'FULL'.
+
+        Side Effects:
+            - Resets the task index and timing metrics
+            - Deletes the task journal unless resuming
+            - Rebuilds self._tasks
+        """
+
+        props = self._props
+        output_root = bpy.path.abspath(props.sequenced_bake_output_path)
+
+        if tier == 'PREVIEW':
+            if props.preview_output_path:
+                output_root = bpy.path.abspath(props.preview_output_path)
+            else:
+                output_root = os.path.join(output_root, "preview")
+
+        self._active_tier = tier
+        self._output_root = output_root
+        self._task_index = 0
+        self._frame_durations = []
+        self._frame_outputs = {}
+        self._object_digests = (None, {})
+        self._reused_frame_count = 0
+        self._adaptive_baked = {}
+        self._interpolated_frame_count = 0
+        self._temporal_packer = (
+            TemporalChannelPacker(self._frames, props.sequenced_bake_image_format)
+            if props.use_temporal_channel_packing else None
+        )
+        self._frame_store_writer = (
+            FrameStoreWriter(self._frames, props.frame_store_precision) if props.use_frame_store else None
+        )
+        self._tile_delta_writer = (
+            TileDeltaWriter(
+                self._frames, props.frame_store_precision, props.delta_tile_size, props.delta_keyframe_interval
+            )
+            if props.use_tile_delta_store else None
+        )
+        self._bake_manifest = (
+            BakeManifest(
+                output_root, self._obj, props.sequenced_bake_image_format,
+                props.shard_size if props.use_sharded_output else 0
+            )
+            if props.use_bake_manifest else None
+        )
+
+        if not props.resume_bake:
+            reset_journal(output_root)
+
+        self._build_tasks()
+
+        if self._skipped_task_count:
+            self.report({'INFO'}, f"Incremental bake: {self._skipped_task_count} unchanged tasks skipped")
+
+        if self._resumed_task_count:
+            self.report({'INFO'}, f"Resuming bake: {self._resumed_task_count} completed tasks skipped")
+
     def _build_tasks(self):
         """
         Constructs the internal bake task queue.
@@ -234,6 +569,29 @@ class SequencedBakeOperator(bpy.types.Operator):
 
             (material, bake_type, frame)
 
+        When the UV-space render engine is selected, eligible passes are
+        replaced by one (None, UV_RENDER_TASK, frame) task per frame.
+
+        With packed scalar baking enabled, the scalar passes of a material
+        that can share one Emission bake are replaced by one
+        (material, PACKED_SCALAR_TASK, frame) task per frame.
+
+        Tasks whose outputs are all static are queued for the first frame
+        only; their output is replicated to the other frames afterwards.
+
+        Temporally packed scalar passes always use one Cycles bake per frame
+        and are left out of the UV-space render and packed scalar bakes.
+
+        In adaptive frame mode the remaining tasks are queued at a coarse
+        stride only; refine_adaptive_task adds midpoints where needed.
+
+        When resuming, tasks whose outputs the journal records and which
+        are still intact on disk are left out. Passes with a pixel sink are
+        checked against the frames their packed images or stores hold.
+
+        For incremental bakes, tasks whose outputs were already baked with
+        the current settings/scene fingerprint are left out as well.
+
         This queue is processed sequentially during modal execution.
 
         Side Effects:
@@ -242,14 +600,109 @@ class SequencedBakeOperator(bpy.types.Operator):
 
         self._tasks = []
 
+        # UV-space render: one task per frame covers every eligible output.
+        self._uv_render_targets = get_uv_render_targets(
+            self._materials,
+            {
+                bake_type: enabled and not self.has_pixel_sink(bake_type)
+                for bake_type, enabled in self._bake_map.items()
+            },
+            self._props,
+        )
+        rendered = set(self._uv_render_targets)
+
+        if self._uv_render_targets:
+            for frame in self._frames:
+                self._tasks.append((None, UV_RENDER_TASK, frame))
+
+        self._packed_scalar_types = {}
+
         for mat in self._materials:
-            for bake_type, enabled in self._bake_map.items():
-                if not enabled:
-                    continue
+            bake_types = [
+                bake_type for bake_type, enabled in self._bake_map.items()
+                if enabled and (mat, bake_type) not in rendered
+            ]
 
-                for frame in self._frames:
+            packed = get_packed_scalar_types(
+                [bake_type for bake_type in bake_types if not self.has_pixel_sink(bake_type)], self._props, mat
+            )
+            self._packed_scalar_types[mat.name] = packed
+
+            for bake_type in bake_types:
+                if bake_type in packed:
+                    if bake_type != packed[0]:
+                        continue
+                    bake_type = PACKED_SCALAR_TASK
+
+                if self.is_task_static(mat, bake_type):
+                    frames = self._frames[:1]
+                elif self.is_adaptive():
+                    frames = [
+                        self._frames[i]
+                        for i in get_coarse_indices(len(self._frames), self._props.temporal_stride)
+                    ]
+                else:
+                    frames = self._frames
+
+                for frame in frames:
                     self._tasks.append((mat, bake_type, frame))
 
+        self._fingerprints = {}
+        self._sink_frames = {}
+        self._fingerprint_manifest = load_manifest(self._output_root)
+        self._unsaved_fingerprint_count = 0
+        self._skipped_task_count = 0
+
+        targets = {
+            (target.name, target_type): target
+            for mat, bake_type, _ in self._tasks
+            for target, target_type in self.get_task_targets(mat, bake_type)
+        }
+
+        if self._props.use_incremental_bake:
+            for (name, target_type), target in targets.items():
+                self._fingerprints[(name, target_type)] = compute_pass_fingerprint(
+                    self._scene, self._props, self._obj, target, target_type
+                )
+
+            remaining = [task for task in self._tasks if not self.is_task_current(*task)]
+            self._skipped_task_count = len(self._tasks) - len(remaining)
+            self._tasks = remaining
+        else:
+            # Untracked re-bakes invalidate the frames an earlier incremental bake recorded.
+            discarded = [
+                discard_pass(self._fingerprint_manifest, target, target_type)
+                for (_, target_type), target in targets.items()
+            ]
+            if any(discarded):
+                save_manifest(self._output_root, self._fingerprint_manifest)
+
+        queued_tasks = list(self._tasks)
+
+        self._resumed_task_count = 0
+
+        if self._props.resume_bake:
+            journal = load_journal(self._output_root)
+            remaining = [
+                task for task in self._tasks
+                if not (
+                    self.is_sink_task_written(*task) if self.has_pixel_sink(task[1])
+                    else verify_task(self._output_root, journal.get(get_task_key(self._obj, *task), []))
+                )
+            ]
+            self._resumed_task_count = len(self._tasks) - len(remaining)
+            self._tasks = remaining
+
+        # Coarse frames skipped above still bound the adaptive intervals.
+        if self.is_adaptive():
+            remaining = set(self._tasks)
+            frame_indices = {frame: index for index, frame in enumerate(self._frames)}
+
+            for mat, bake_type, frame in queued_tasks:
+                if (mat, bake_type, frame) not in remaining and not self.is_task_static(mat, bake_type):
+                    key = (mat.name if mat else "", bake_type)
+                    self._adaptive_baked.setdefault(key, set()).add(frame_indices[frame])
+
     def modal(self, context, event):
         """
         Handles modal event processing for the bake operation.
@@ -262,6 +715,7 @@ class SequencedBakeOperator(bpy.types.Operator):
         - ESC key cancels the operation
         - TIMER events trigger processing of the next task
         - Completes when all tasks are processed
+        - A task that raises cancels the operation and reports the error
 
         Args:
             context (bpy.types.Context): Current Blender context.
@@ -283,10 +737,42 @@ class SequencedBakeOperator(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         if self._task_index >= len(self._tasks):
+            # Outstanding writes may still queue adaptive refinement tasks.
+            try:
+                self.complete_written_tasks(wait=True)
+            except Exception as error:
+                return self.abort(context, error)
+
+            if self._task_index < len(self._tasks):
+                return {'RUNNING_MODAL'}
+
+            if self._temporal_packer is not None:
+                self._temporal_packer.flush()
+
+            if self._frame_store_writer is not None:
+                self._frame_store_writer.close()
+
+            if self._tile_delta_writer is not None:
+                self._tile_delta_writer.close()
+
+            if self._bake_manifest is not None:
+                self._bake_manifest.save()
+
+            self.save_fingerprints()
+
+            if self._active_tier == 'PREVIEW' and self._props.preview_then_full:
+                clear_generated_textures(self._props)
+                self.report({'INFO'}, "Sequenced Bake preview completed, starting full bake")
+                self.start_tier('FULL')
+                return {'RUNNING_MODAL'}
+
             self.finish(context)
             return {'FINISHED'}
 
-        self.process_next_task(context)
+        try:
+            self.process_next_task(context)
+        except Exception as error:
+            return self.abort(context, error)
 
         if context.area:
             context.area.tag_redraw()
@@ -328,67 +814,31 @@ class SequencedBakeOperator(bpy.types.Operator):
         self._task_index += 1
 
         # UI STATE UPDATE
-        self._props.bake_current_material = mat.name
-        self._props.bake_current_type = bake_type
+        self._props.bake_current_material = mat.name if mat else "All"
+        self._props.bake_current_type = (
+            " + ".join(self._packed_scalar_types[mat.name]) if bake_type == PACKED_SCALAR_TASK else bake_type
+        )
         self._props.bake_frame_info = f"{frame} / {len(self._frames)}"
-        self._props.bake_status = "Baking"
+        self._props.bake_status = self.get_status_text()
 
         # FRAME SETUP
         scene = self._scene
         scene.frame_set(frame)
         bpy.context.view_layer.update()
 
-        # METALLIC NODE PREP
-        if bake_type == "METALLIC":
-            connect_metallic_node(mat)
-
-        # Occlusion  NODE PREP
-        if bake_type == "OCCLUSION":
-            connect_occlusion_node(mat)
-
-        bake_dir = os.path.join(
-            bpy.path.abspath(props.sequenced_bake_output_path),
-            f"{self._obj.name}_{mat.name}_{bake_type}"
-        )
-        os.makedirs(bake_dir, exist_ok=True)
-
-        # Color space override for data maps
-        colorspace = props.colorspace
-
-        if bake_type in {"NORMAL", "ROUGHNESS", "METALLIC", "OCCLUSION"}:
-            colorspace = "Non-Color"
-
-        image_node, image = create_image_texture(
-            material=mat,
-            name=f"{self._obj.name}_{mat.name}_{bake_type}_{frame}",
-            width=props.sequenced_bake_width,
-            height=props.sequenced_bake_height,
-            alpha=props.sequence_is_alpha,
-            float_buffer=props.sequence_use_float,
-            interpolation=props.interpolation,
-            projection=props.projection,
-            extension=props.extension,
-            colorspace=colorspace,
-        )
-
-        # BAKING
-        bake_frame(
-            bake_type=bake_type,
-            props=props,
-            frame=frame,
-            obj=self._obj,
-            mat=mat,
-            image_node=image_node,
-            image=image,
-            output_dir=bake_dir,
-            sculpt_bounds=self._sculpt_normalization_bounds,
-        )
+        digests = self.get_frame_digests(mat, bake_type, frame)
 
-        if bake_type == "METALLIC":
-            reconnect_node(mat)
+        if self.reuse_identical_frame(mat, bake_type, frame, digests):
+            self._reused_frame_count += 1
+        elif bake_type == UV_RENDER_TASK:
+            self.render_uv_task(frame)
+        elif bake_type == PACKED_SCALAR_TASK:
+            self.bake_packed_task(mat, frame)
+        else:
+            self.bake_task(mat, bake_type, frame)
 
-        if bake_type == "OCCLUSION":
-            reconnect_node(mat)
+        self._pending_completions.append((mat, bake_type, frame, digests))
+        self.complete_written_tasks()
 
         # FRAME TIMING 
         frame_end_time = time.time()
@@ -424,121 +874,1209 @@ class SequencedBakeOperator(bpy.types.Operator):
         # STATUS (clean lifecycle only)
         self._props.bake_status = self.get_status_text()
 
-    def get_effective_fps(self):
+    def complete_written_tasks(self, wait=False):
         """
-        Calculates the effective frames-per-second of the bake process.
+        Runs the bookkeeping of baked tasks whose output files are written.
 
-        Uses the average duration of processed frames to estimate
-        throughput.
+        Tasks complete in bake order. Without a background writer every
+        task completes immediately. Tasks with a failed write are dropped
+        without bookkeeping, so they are baked again by a resumed or
+        incremental bake.
 
-        Returns:
-            float: Calculated FPS value. Returns 0.0 if insufficient data
-            or invalid timing values are present.
+        Args:
+            wait (bool): Block until every outstanding write has finished.
         """
 
-        if not self._frame_durations:
-            return 0.0
+        if self._writer is not None:
+            if wait:
+                self._writer.wait()
 
-        avg = sum(self._frame_durations) / len(self._frame_durations)
+            for error in self._writer.pop_errors():
+                self._write_error_count += 1
+                self.report({'ERROR'}, f"Sequenced Bake write failed: {error}")
 
-        if avg <= 0:
-            return 0.0
+        while self._pending_completions:
+            mat, bake_type, frame, digests = self._pending_completions[0]
 
-        return 1.0 / avg
+            outputs = self.get_task_outputs(mat, bake_type, frame)
 
-    def format_time(self, seconds: float) -> str:
-        """
-        Formats a time duration into a human-readable string.
+            if self._writer is not None and not self._writer.is_written(outputs):
+                break
 
-        Converts seconds into either:
-        - HH:MM:SS.mmm format (if duration >= 1 hour)
-        - MM:SS.mmm format (otherwise)
+            self._pending_completions.pop(0)
 
-        Args:
-            seconds (float): Time duration in seconds.
+            if self._writer is not None and self._writer.has_failed(outputs):
+                continue
 
-        Returns:
-            str: Formatted time string. Returns "00:00:00" for invalid input.
+            self.complete_task(mat, bake_type, frame, digests)
+
+    def complete_task(self, mat, bake_type, frame, digests):
         """
+        Records a baked task once its outputs are on disk.
 
-        if seconds is None or seconds < 0:
-            return "00:00:00"
+        Registers the outputs for frame reuse, replicates static outputs or
+        refines adaptive intervals, and updates the journal and the
+        fingerprint manifest. Passes with a pixel sink write no per-frame
+        files, so only the fingerprint manifest records them; their sinks
+        keep track of the frames they hold.
 
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame number.
+            digests (list[str] | None): Result of get_frame_digests.
+        """
 
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
-        else:
-            return f"{minutes:02d}:{secs:06.3f}"
+        self.register_frame_outputs(mat, bake_type, frame, digests)
 
-    def get_progress(self):
-        """
-        Computes overall progress of the bake operation.
+        completed_frames = [frame]
+        is_static = self.is_task_static(mat, bake_type)
 
-        Progress is calculated as the ratio of completed tasks
-        to total tasks.
+        if is_static:
+            completed_frames += self.replicate_static_task(mat, bake_type, frame)
+        elif self.is_adaptive():
+            completed_frames += self.refine_adaptive_task(mat, bake_type, frame)
 
-        Returns:
-            float: Progress value in range [0.0, 1.0].
-                   Returns 0.0 if no tasks exist.
-        """
+        has_files = not self.has_pixel_sink(bake_type)
 
-        if not self._tasks:
-            return 0.0
-        return self._task_index / len(self._tasks)
+        # Static replicas are links of the baked frame and share its file digests.
+        source_digests = None
 
-    def get_status_text(self):
-        """
-        Determines the current status label for the bake process.
+        for completed_frame in completed_frames:
+            if self._props.use_incremental_bake:
+                for target, target_type in self.get_task_targets(mat, bake_type):
+                    mark_frame_baked(
+                        self._fingerprint_manifest, target, target_type,
+                        self._fingerprints[(target.name, target_type)], completed_frame
+                    )
+                    self._unsaved_fingerprint_count += 1
 
-        Returns:
-            str: Status string:
-                - "Idle" if no tasks exist
-                - "Baking" while tasks are being processed
-        """
+            if not has_files:
+                continue
 
-        if not self._tasks:
-            return "Idle"
+            outputs = self.get_task_outputs(mat, bake_type, completed_frame)
+            file_digests = record_task(
+                self._output_root, get_task_key(self._obj, mat, bake_type, completed_frame), outputs,
+                source_digests if is_static else None
+            )
 
-        return "Baking"
+            if completed_frame == frame and file_digests:
+                source_digests = [file_digests[output] for output in outputs]
 
-    def finish(self, context):
-        """
-        Finalizes the bake operation after all tasks are completed.
+            if self._props.use_mip_pyramid:
+                self.write_task_mips(
+                    mat, bake_type, completed_frame,
+                    source_frame=frame if is_static and completed_frame != frame else None
+                )
 
-        Responsibilities:
-        - Stops the modal timer
-        - Cleans up generated textures (if enabled)
-        - Updates UI state to completed
-        - Reports completion to the user
+            if self._props.use_normal_conventions:
+                self.write_task_normal_conventions(
+                    mat, bake_type, completed_frame,
+                    source_frame=frame if is_static and completed_frame != frame else None
+                )
 
-        Args:
-            context (bpy.types.Context): Current Blender context.
+            if self._bake_manifest is not None:
+                self.record_outputs(mat, bake_type, completed_frame, file_digests)
 
-        Side Effects:
-            - Removes timer from window manager
-            - Updates bake progress and status
-        """
+        if self._unsaved_fingerprint_count >= FINGERPRINT_SAVE_INTERVAL:
+            self.save_fingerprints()
 
-        wm = context.window_manager
-        wm.event_timer_remove(self._timer)
-        clear_generated_textures(self._props)
+    def save_fingerprints(self):
+        """
+        Writes the frames recorded in the fingerprint manifest since the last save.
+        """
 
-        self._props.bake_progress = 1.0
-        self._props.bake_status = "Completed"
-        self.report({'INFO'}, "Sequenced Bake completed")
+        if self._unsaved_fingerprint_count:
+            save_manifest(self._output_root, self._fingerprint_manifest)
+            self._unsaved_fingerprint_count = 0
 
-    def cancel(self, context):
+    def record_outputs(self, mat, bake_type, frame, digests=None):
         """
-        Cancels the bake operation prematurely.
+        Adds the written files of a task to the bake manifest.
 
-        Performs cleanup similar to finish(), but sets the status
-        to indicate cancellation instead of completion.
+        Outputs that are not plain image files (packed or stored passes)
+        are skipped.
 
         Args:
-            context (bpy.types.Context): Current Blender context.
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame number.
+            digests (dict[str, str], optional): SHA-256 per output path
+                already computed by record_task.
+        """
+
+        digests = digests or {}
+
+        targets = self.get_task_targets(mat, bake_type)
+
+        for (target, target_type), output in zip(targets, self.get_task_outputs(mat, bake_type, frame)):
+            if os.path.exists(output):
+                width, height = self.get_output_resolution(target, target_type)
+                self._bake_manifest.add(output, target, target_type, frame, width, height, digests.get(output))
+
+                levels = self.get_mip_outputs(target, target_type, frame)
+
+                for level_path, level_width, level_height in levels:
+                    if os.path.exists(level_path):
+                        self._bake_manifest.add(level_path, target, target_type, frame, level_width, level_height)
+
+                sizes = [(width, height)] + [(level_width, level_height) for _, level_width, level_height in levels]
+
+                for (_, conventions), (size_width, size_height) in zip(
+                    self.get_normal_convention_outputs(target, target_type, frame), sizes
+                ):
+                    for _, path in conventions:
+                        if os.path.exists(path):
+                            self._bake_manifest.add(path, target, target_type, frame, size_width, size_height)
+
+    def write_task_mips(self, mat, bake_type, frame, source_frame=None):
+        """
+        Writes the mip pyramid levels of the outputs of a task.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame number.
+            source_frame (int, optional): Frame whose levels are linked
+                instead of rebuilt (replicas of static passes).
+        """
+
+        targets = self.get_task_targets(mat, bake_type)
+
+        for (target, target_type), output in zip(targets, self.get_task_outputs(mat, bake_type, frame)):
+            if not os.path.exists(output):
+                continue
+
+            if source_frame is not None:
+                for (source, _, _), (level_path, _, _) in zip(
+                    self.get_mip_outputs(target, target_type, source_frame),
+                    self.get_mip_outputs(target, target_type, frame)
+                ):
+                    if os.path.exists(source):
+                        link_or_copy(source, level_path)
+                continue
+
+            write_mip_levels(
+                output,
+                os.path.join(self._output_root, f"{self._obj.name}_{target.name}_{target_type}"),
+                frame,
+                target_type,
+                self._props,
+            )
+
+    def write_task_normal_conventions(self, mat, bake_type, frame, source_frame=None):
+        """
+        Derives the selected normal map conventions of the outputs of a task.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame number.
+            source_frame (int, optional): Frame whose conventions are linked
+                instead of derived (replicas of static passes).
+        """
+
+        for target, target_type in self.get_task_targets(mat, bake_type):
+            outputs = self.get_normal_convention_outputs(target, target_type, frame)
+
+            if source_frame is not None:
+                sources = self.get_normal_convention_outputs(target, target_type, source_frame)
+
+                for (_, source_paths), (_, paths) in zip(sources, outputs):
+                    for (_, source), (_, path) in zip(source_paths, paths):
+                        if os.path.exists(source):
+                            link_or_copy(source, path)
+                continue
+
+            for canonical, conventions in outputs:
+                if os.path.exists(canonical):
+                    write_normal_conventions(canonical, conventions, self._props)
+
+    def get_normal_convention_outputs(self, mat, bake_type, frame):
+        """
+        Lists the derived normal map convention files of a pass output.
+
+        Mip pyramid levels get their own conventions, derived from the
+        canonical level.
+
+        Args:
+            mat (bpy.types.Material): Material of the output.
+            bake_type (str): The bake pass type.
+            frame (int): Frame number.
+
+        Returns:
+            list[tuple[str, list[tuple[str, str]]]]: Canonical file with its
+            (convention, path) outputs, full resolution first.
+        """
+
+        if bake_type != "NORMAL" or not self._props.use_normal_conventions:
+            return []
+
+        props = self._props
+        output_dir = os.path.join(self._output_root, f"{self._obj.name}_{mat.name}_{bake_type}")
+        conventions = sorted(props.normal_conventions)
+
+        outputs = [(
+            get_frame_filepath(output_dir, frame, props),
+            [
+                (convention, get_frame_filepath(get_convention_dir(output_dir, convention), frame, props))
+                for convention in conventions
+            ]
+        )]
+
+        for level_path, width, height in self.get_mip_outputs(mat, bake_type, frame):
+            outputs.append((
+                level_path,
+                [
+                    (convention, get_frame_filepath(
+                        get_mip_dir(get_convention_dir(output_dir, convention), width, height), frame, props
+                    ))
+                    for convention in conventions
+                ]
+            ))
+
+        return outputs
+
+    def get_mip_outputs(self, mat, bake_type, frame):
+        """
+        Lists the mip pyramid level files of a pass output.
+
+        Args:
+            mat (bpy.types.Material): Material of the output.
+            bake_type (str): The bake pass type.
+            frame (int): Frame number.
+
+        Returns:
+            list[tuple[str, int, int]]: (path, width, height) of each level.
+        """
+
+        if not self._props.use_mip_pyramid:
+            return []
+
+        output_dir = os.path.join(self._output_root, f"{self._obj.name}_{mat.name}_{bake_type}")
+        width, height = self.get_output_resolution(mat, bake_type)
+
+        return [
+            (get_frame_filepath(get_mip_dir(output_dir, level_width, level_height), frame, self._props),
+             level_width, level_height)
+            for level_width, level_height in get_mip_sizes(width, height, self._props.mip_levels)
+        ]
+
+    def get_output_resolution(self, mat, bake_type):
+        """
+        Resolves the output resolution of a pass in the active tier.
+
+        Args:
+            mat (bpy.types.Material): Material being baked.
+            bake_type (str): The bake pass type.
+
+        Returns:
+            tuple[int, int]: (width, height) in pixels.
+        """
+
+        width, height = resolve_bake_resolution(bake_type, self._props, mat)
+
+        if self._active_tier == 'PREVIEW':
+            width = max(1, round(width * self._props.preview_resolution_scale))
+            height = max(1, round(height * self._props.preview_resolution_scale))
+
+        return width, height
+
+    def get_task_targets(self, mat, bake_type):
+        """
+        Lists the (material, bake_type) outputs a task produces.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+
+        Returns:
+            list[tuple[bpy.types.Material, str]]: Produced outputs.
+        """
+
+        if bake_type == UV_RENDER_TASK:
+            return list(self._uv_render_targets)
+
+        if bake_type == PACKED_SCALAR_TASK:
+            return [(mat, packed_type) for packed_type in self._packed_scalar_types[mat.name]]
+
+        return [(mat, bake_type)]
+
+    def get_task_outputs(self, mat, bake_type, frame):
+        """
+        Lists the files a task writes.
+
+        Passes with a pixel sink write no per-frame file.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame number.
+
+        Returns:
+            list[str]: Absolute output file paths.
+        """
+
+        if self.has_pixel_sink(bake_type):
+            return []
+
+        return [
+            get_frame_filepath(
+                os.path.join(self._output_root, f"{self._obj.name}_{target.name}_{target_type}"), frame, self._props
+            )
+            for target, target_type in self.get_task_targets(mat, bake_type)
+        ]
+
+    def is_task_current(self, mat, bake_type, frame):
+        """
+        Checks whether every output of a task was baked with its current fingerprint.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame number.
+
+        Returns:
+            bool: True if the task can be skipped.
+        """
+
+        if self.has_pixel_sink(bake_type):
+            fingerprint = self._fingerprints[(mat.name, bake_type)]
+
+            return all(
+                is_frame_current(self._fingerprint_manifest, mat, bake_type, fingerprint, sink_frame)
+                for sink_frame in self.get_sink_frames(bake_type, frame)
+            ) and self.is_sink_task_written(mat, bake_type, frame)
+
+        return all(
+            is_frame_current(
+                self._fingerprint_manifest, target, target_type,
+                self._fingerprints[(target.name, target_type)], frame
+            ) and os.path.exists(output)
+            for (target, target_type), output in zip(
+                self.get_task_targets(mat, bake_type), self.get_task_outputs(mat, bake_type, frame)
+            )
+        )
+
+    def is_task_static(self, mat, bake_type):
+        """
+        Checks whether every output of a task is static over the frame range.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+
+        Returns:
+            bool: True if the task only needs to be baked once.
+        """
+
+        if not self._static_passes or bake_type == UV_RENDER_TASK:
+            return False
+
+        return all(
+            (target.name, target_type) in self._static_passes
+            for target, target_type in self.get_task_targets(mat, bake_type)
+        )
+
+    def replicate_static_task(self, mat, bake_type, frame):
+        """
+        Links the outputs of a static task to every other frame of the range.
+
+        Args:
+            mat (bpy.types.Material): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame the task was baked at.
+
+        Returns:
+            list[int]: Frames that received a replica.
+        """
+
+        sources = self.get_task_outputs(mat, bake_type, frame)
+
+        if not all(os.path.exists(source) for source in sources):
+            return []
+
+        replicated = [other for other in self._frames if other != frame]
+
+        for other in replicated:
+            for source, output in zip(sources, self.get_task_outputs(mat, bake_type, other)):
+                link_or_copy(source, output)
+
+        return replicated
+
+    def is_temporal_packed(self, bake_type):
+        """
+        Checks whether a bake type is written by temporal channel packing.
+
+        Args:
+            bake_type (str): The bake pass type or task marker.
+
+        Returns:
+            bool: True if four consecutive frames share one packed image.
+        """
+
+        return self._props.use_temporal_channel_packing and bake_type in TEMPORAL_PACK_BAKE_TYPES
+
+    def has_pixel_sink(self, bake_type):
+        """
+        Checks whether a bake type is written somewhere other than one image
+        file per frame (temporal channel packing, the frame store or the tile
+        delta store).
+
+        Such passes are always Cycles-baked per frame, without the UV-space
+        render, packed scalar bakes, static replication or tiling.
+
+        Args:
+            bake_type (str): The bake pass type or task marker.
+
+        Returns:
+            bool: True if the pass uses get_pixel_sink.
+        """
+
+        if self.is_temporal_packed(bake_type):
+            return True
+
+        return (
+            (self._props.use_frame_store or self._props.use_tile_delta_store)
+            and bake_type not in {"SCULPT", UV_RENDER_TASK, PACKED_SCALAR_TASK}
+        )
+
+    def get_pixel_sink(self, mat, bake_type, frame, colorspace):
+        """
+        Builds the callable receiving the baked pixels of a task.
+
+        Args:
+            mat (bpy.types.Material): Material being baked.
+            bake_type (str): The bake pass type.
+            frame (int): Frame number.
+            colorspace (str): Color space of the bake target.
+
+        Returns:
+            callable | None: Pixel sink for bake_frame, or None to write a
+            regular image file.
+        """
+
+        if self.is_temporal_packed(bake_type):
+            return functools.partial(
+                self._temporal_packer.add,
+                get_packed_output_dir(self._output_root, self._obj, mat, bake_type),
+                frame,
+                name=f"{self._obj.name}_{mat.name}_{bake_type}_packed",
+            )
+
+        if not self.has_pixel_sink(bake_type):
+            return None
+
+        options = {
+            "colorspace": colorspace,
+            "alpha": self._props.sequence_is_alpha,
+            "channel_layout": resolve_channel_layout(bake_type, self._props),
+        }
+
+        if self._tile_delta_writer is not None:
+            return functools.partial(
+                self._tile_delta_writer.add,
+                get_delta_store_dir(self._output_root, self._obj, mat, bake_type),
+                frame,
+                **options,
+            )
+
+        if self._frame_store_writer is not None:
+            return functools.partial(
+                self._frame_store_writer.add,
+                get_frame_store_path(self._output_root, self._obj, mat, bake_type),
+                frame,
+                **options,
+            )
+
+        return None
+
+    def get_sink_frames(self, bake_type, frame):
+        """
+        Lists the frames a pixel sink task is resumed or skipped together with.
+
+        A packed image is rewritten as a whole, so temporally packed frames
+        are only skipped when their entire group is.
+
+        Args:
+            bake_type (str): The bake pass type.
+            frame (int): Frame number.
+
+        Returns:
+            list[int]: Frames that must all be held by the sink.
+        """
+
+        if self.is_temporal_packed(bake_type):
+            return next(group for group in get_frame_groups(self._frames) if frame in group)
+
+        return [frame]
+
+    def is_sink_task_written(self, mat, bake_type, frame):
+        """
+        Checks whether the pixel sink of a pass already holds a task's frames.
+
+        Reads the channel mapping of packed passes, the header of a frame
+        store or the index of a tile delta store. Stores that the writers
+        would replace (other frames, resolution or precision) hold nothing.
+
+        Args:
+            mat (bpy.types.Material): Material of the task.
+            bake_type (str): The bake pass type.
+            frame (int): Frame number.
+
+        Returns:
+            bool: True if the task's frames are stored.
+        """
+
+        key = (mat.name, bake_type)
+
+        if key not in self._sink_frames:
+            props = self._props
+            width, height = self.get_output_resolution(mat, bake_type)
+
+            if self.is_temporal_packed(bake_type):
+                stored = get_packed_frames(get_packed_output_dir(self._output_root, self._obj, mat, bake_type))
+            elif props.use_tile_delta_store:
+                stored = get_delta_store_frames(
+                    get_delta_store_dir(self._output_root, self._obj, mat, bake_type),
+                    height, width, props.frame_store_precision, props.delta_tile_size
+                )
+            else:
+                stored = get_frame_store_frames(
+                    get_frame_store_path(self._output_root, self._obj, mat, bake_type),
+                    self._frames, height, width, props.frame_store_precision
+                )
+
+            self._sink_frames[key] = stored
+
+        return all(sink_frame in self._sink_frames[key] for sink_frame in self.get_sink_frames(bake_type, frame))
+
+    def is_adaptive(self):
+        """
+        Checks whether adaptive temporal sampling is active.
+
+        Returns:
+            bool: True in adaptive frame mode with more than two frames.
+        """
+
+        return self._props.frame_mode == 'ADAPTIVE' and len(self._frames) > 2
+
+    def refine_adaptive_task(self, mat, bake_type, frame):
+        """
+        Refines the adaptive intervals next to a baked frame.
+
+        Each interval between two baked frames is compared with the chosen
+        error metric. Intervals above the threshold get their midpoint
+        queued next; the others are filled by linear interpolation.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame that was just baked.
+
+        Returns:
+            list[int]: Frames written by interpolation.
+        """
+
+        key = (mat.name if mat else "", bake_type)
+        index = self._frames.index(frame)
+        baked = self._adaptive_baked.setdefault(key, set())
+        baked.add(index)
+
+        lower = max((i for i in baked if i < index), default=None)
+        upper = min((i for i in baked if i > index), default=None)
+
+        filled = []
+        for start, end in ((lower, index), (index, upper)):
+            if start is not None and end is not None and end - start > 1:
+                filled += self.refine_interval(mat, bake_type, start, end)
+
+        return filled
+
+    def refine_interval(self, mat, bake_type, start, end):
+        """
+        Bakes the midpoint of an interval or interpolates across it.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            start (int): Index of the earlier baked frame in _frames.
+            end (int): Index of the later baked frame in _frames.
+
+        Returns:
+            list[int]: Frames written by interpolation.
+        """
+
+        props = self._props
+        start_outputs = self.get_task_outputs(mat, bake_type, self._frames[start])
+        end_outputs = self.get_task_outputs(mat, bake_type, self._frames[end])
+
+        if not all(os.path.exists(path) for path in start_outputs + end_outputs):
+            return []
+
+        start_pixels = [load_output_pixels(path) for path in start_outputs]
+        end_pixels = [load_output_pixels(path) for path in end_outputs]
+
+        error = max(
+            measure_difference(a, b, props.temporal_error_metric) for a, b in zip(start_pixels, end_pixels)
+        )
+
+        if error > props.temporal_error_threshold:
+            self._tasks.insert(self._task_index, (mat, bake_type, self._frames[(start + end) // 2]))
+            return []
+
+        in_between = self._frames[start + 1:end]
+        outputs = [self.get_task_outputs(mat, bake_type, other) for other in in_between]
+
+        targets = self.get_task_targets(mat, bake_type)
+
+        for target_index, (a, b) in enumerate(zip(start_pixels, end_pixels)):
+            write_interpolated_frames(
+                a, b,
+                filepaths=[paths[target_index] for paths in outputs],
+                name=f"{self._obj.name}_{bake_type}_interpolated",
+                alpha=props.sequence_is_alpha,
+                channel_layout=resolve_channel_layout(targets[target_index][1], props),
+            )
+
+        self._interpolated_frame_count += len(in_between)
+        return in_between
+
+    def get_frame_digests(self, mat, bake_type, frame):
+        """
+        Hashes the evaluated inputs of every output of a task at the current frame.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame number (the scene is already at this frame).
+
+        Returns:
+            list[str] | None: One digest per task target, or None when frame
+            deduplication does not apply.
+        """
+
+        if not self._props.use_frame_dedup or bake_type == UV_RENDER_TASK or self.has_pixel_sink(bake_type):
+            return None
+
+        if self._object_digests[0] != frame:
+            self._object_digests = (frame, {})
+
+        return [
+            compute_frame_digest(self._scene, self._props, self._obj, target, target_type, self._object_digests[1])
+            for target, target_type in self.get_task_targets(mat, bake_type)
+        ]
+
+    def reuse_identical_frame(self, mat, bake_type, frame, digests):
+        """
+        Links the outputs of an earlier frame with identical inputs.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame number.
+            digests (list[str] | None): Result of get_frame_digests.
+
+        Returns:
+            bool: True if every output was reused and no bake is needed.
+        """
+
+        if digests is None:
+            return False
+
+        targets = self.get_task_targets(mat, bake_type)
+        sources = [
+            self._frame_outputs.get((target.name, target_type, digest))
+            for (target, target_type), digest in zip(targets, digests)
+        ]
+
+        if not all(source and os.path.exists(source) for source in sources):
+            return False
+
+        for source, output in zip(sources, self.get_task_outputs(mat, bake_type, frame)):
+            link_or_copy(source, output)
+
+        return True
+
+    def register_frame_outputs(self, mat, bake_type, frame, digests):
+        """
+        Remembers the outputs of a frame for reuse by identical later frames.
+
+        Args:
+            mat (bpy.types.Material | None): Material of the task.
+            bake_type (str): The bake pass type or task marker.
+            frame (int): Frame number.
+            digests (list[str] | None): Result of get_frame_digests.
+        """
+
+        if digests is None:
+            return
+
+        targets = self.get_task_targets(mat, bake_type)
+        outputs = self.get_task_outputs(mat, bake_type, frame)
+
+        for (target, target_type), digest, output in zip(targets, digests, outputs):
+            if os.path.exists(output):
+                self._frame_outputs.setdefault((target.name, target_type, digest), output)
+
+    def bake_task(self, mat, bake_type, frame):
+        """
+        Bakes a single (material, bake_type, frame) task with Cycles.
+
+        Prepares material nodes (if required), creates the image texture
+        target, executes the bake and restores the node state.
+
+        Args:
+            mat (bpy.types.Material): Material being baked.
+            bake_type (str): The bake pass type.
+            frame (int): Frame number to bake.
+        """
+
+        props = self._props
+
+        bake_dir = os.path.join(
+            self._output_root,
+            f"{self._obj.name}_{mat.name}_{bake_type}"
+        )
+
+        # Color space override for data maps
+        colorspace = props.colorspace
+
+        if bake_type in DATA_BAKE_TYPES:
+            colorspace = "Non-Color"
+
+        # Packed and frame store passes hand their pixels over instead of writing a file.
+        pixel_sink = self.get_pixel_sink(mat, bake_type, frame, colorspace)
+
+        if pixel_sink is None:
+            os.makedirs(bake_dir, exist_ok=True)
+
+        width, height = self.get_output_resolution(mat, bake_type)
+
+        preview_samples = None
+        if self._active_tier == 'PREVIEW':
+            preview_samples = props.preview_samples
+
+        # Tiled baking: bake into a single tile-sized target and stream tiles to disk.
+        tiled_size = None
+        if (props.use_tiled_bake and bake_type != "SCULPT" and pixel_sink is None
+                and max(width, height) > props.bake_tile_size):
+            tiled_size = (width, height)
+            width = height = props.bake_tile_size
+
+        # Procedural scalar passes can be evaluated without a Cycles bake.
+        if (tiled_size is None and pixel_sink is None
+                and self.evaluate_task(mat, bake_type, frame, width, height, bake_dir)):
+            return
+
+        # METALLIC NODE PREP
+        if bake_type == "METALLIC":
+            connect_metallic_node(mat)
+
+        # Occlusion  NODE PREP
+        if bake_type == "OCCLUSION":
+            connect_occlusion_node(mat)
+
+        image_node, image = create_image_texture(
+            material=mat,
+            name=f"{self._obj.name}_{mat.name}_{bake_type}_{frame}",
+            width=width,
+            height=height,
+            alpha=props.sequence_is_alpha,
+            float_buffer=props.sequence_use_float,
+            interpolation=props.interpolation,
+            projection=props.projection,
+            extension=props.extension,
+            colorspace=colorspace,
+        )
+
+        # BAKING
+        bake_frame(
+            bake_type=bake_type,
+            props=props,
+            frame=frame,
+            obj=self._obj,
+            mat=mat,
+            image_node=image_node,
+            image=image,
+            output_dir=bake_dir,
+            sculpt_bounds=self._sculpt_normalization_bounds,
+            denoise_stats=self._denoise_stats,
+            tiled_size=tiled_size,
+            preview_samples=preview_samples,
+            margin_index=(
+                self.get_margin_index(mat, width, height)
+                if tiled_size is None and bake_type != "SCULPT" else None
+            ),
+            writer=self._writer,
+            pixel_sink=pixel_sink,
+        )
+
+        if bake_type == "METALLIC":
+            reconnect_node(mat)
+
+        if bake_type == "OCCLUSION":
+            reconnect_node(mat)
+
+    def bake_packed_task(self, mat, frame):
+        """
+        Bakes the packed scalar passes of a material with one Emission bake.
+
+        Falls back to one bake per pass when the packed bake would need
+        tiling.
+
+        Args:
+            mat (bpy.types.Material): Material being baked.
+            frame (int): Frame number to bake.
+        """
+
+        props = self._props
+        bake_types = self._packed_scalar_types[mat.name]
+
+        width, height = self.get_output_resolution(mat, bake_types[0])
+
+        preview_samples = None
+        if self._active_tier == 'PREVIEW':
+            preview_samples = props.preview_samples
+
+        if props.use_tiled_bake and max(width, height) > props.bake_tile_size:
+            for bake_type in bake_types:
+                self.bake_task(mat, bake_type, frame)
+            return
+
+        connect_occlusion_node(mat, include_occlusion="OCCLUSION" in bake_types)
+
+        try:
+            image_node, image = create_image_texture(
+                material=mat,
+                name=f"{self._obj.name}_{mat.name}_{PACKED_SCALAR_TASK}_{frame}",
+                width=width,
+                height=height,
+                alpha=props.sequence_is_alpha,
+                float_buffer=props.sequence_use_float,
+                interpolation=props.interpolation,
+                projection=props.projection,
+                extension=props.extension,
+                colorspace="Non-Color",
+            )
+
+            bake_packed_scalars(
+                bake_types=bake_types,
+                props=props,
+                frame=frame,
+                obj=self._obj,
+                mat=mat,
+                image_node=image_node,
+                image=image,
+                output_root=self._output_root,
+                denoise_stats=self._denoise_stats,
+                preview_samples=preview_samples,
+                margin_index=self.get_margin_index(mat, width, height),
+            )
+        finally:
+            reconnect_node(mat)
+
+    def get_coverage(self, mat, width, height):
+        """
+        Returns the cached UV coverage mask of a material.
+
+        The UV layout is constant over a sequence, so the mask is rasterized
+        once per material and resolution.
+
+        Args:
+            mat (bpy.types.Material): Material being baked.
+            width (int): Image width in pixels.
+            height (int): Image height in pixels.
+
+        Returns:
+            np.ndarray: (height, width) boolean coverage mask.
+        """
+
+        key = (mat.name, width, height)
+        if key not in self._coverage_cache:
+            self._coverage_cache[key] = compute_uv_coverage(self._obj, mat, width, height)
+
+        return self._coverage_cache[key]
+
+    def get_margin_index(self, mat, width, height, required=False):
+        """
+        Returns the cached margin index of a material, if one is used.
+
+        The cached margin reproduces the 'Extend' margin type on the viewport
+        mesh. Cycles bakes keep their own margin for other margin types and
+        when render-only modifiers change the UV layout.
+
+        Args:
+            mat (bpy.types.Material): Material being baked.
+            width (int): Image width in pixels.
+            height (int): Image height in pixels.
+            required (bool): Build the index even when cached margins are
+                disabled (for outputs that are not baked by Cycles).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray] | None: Margin index, or None to
+            let Cycles compute the margin.
+        """
+
+        bake = self._scene.render.bake
+        margin = bake.margin
+
+        if margin <= 0 or not (required or self._props.use_cached_margin):
+            return None
+
+        if not required and (bake.margin_type != 'EXTEND' or has_render_only_geometry(self._obj)):
+            return None
+
+        key = (mat.name, width, height, margin)
+        if key not in self._margin_cache:
+            self._margin_cache[key] = compute_margin_index(self.get_coverage(mat, width, height), margin)
+
+        return self._margin_cache[key]
+
+    def evaluate_task(self, mat, bake_type, frame, width, height, bake_dir):
+        """
+        Evaluates a scalar pass with the NumPy shader interpreter.
+
+        The interpreter evaluates the active material on the active mesh's
+        UVs, so selected-to-active bakes always use Cycles.
+
+        Args:
+            mat (bpy.types.Material): Material being baked.
+            bake_type (str): The bake pass type.
+            frame (int): Frame number to bake.
+            width (int): Output width in pixels.
+            height (int): Output height in pixels.
+            bake_dir (str): Output directory of the pass.
+
+        Returns:
+            bool: True if the frame was written, False if it must be baked.
+        """
+
+        key = (mat.name, bake_type)
+
+        if (not self._props.use_shader_interpreter
+                or self._props.sequenced_selected_to_active
+                or bake_type not in EVALUATED_BAKE_TYPES
+                or key in self._unsupported_evaluations):
+            return False
+
+        try:
+            bake_evaluated_frame(
+                obj=self._obj,
+                mat=mat,
+                bake_type=bake_type,
+                props=self._props,
+                frame=frame,
+                width=width,
+                height=height,
+                output_dir=bake_dir,
+                coverage=self.get_coverage(mat, width, height),
+                margin_index=self.get_margin_index(mat, width, height, required=True),
+            )
+        except UnsupportedNodeError as error:
+            self._unsupported_evaluations.add(key)
+            self.report({'INFO'}, f"{mat.name} {bake_type.title()}: {error}, using Cycles bake")
+            return False
+
+        return True
+
+    def render_uv_task(self, frame):
+        """
+        Produces every UV-space render target of a frame with a single render.
+
+        Args:
+            frame (int): Frame number to render.
+        """
+
+        props = self._props
+        width = props.sequenced_bake_width
+        height = props.sequenced_bake_height
+
+        preview_samples = None
+        if self._active_tier == 'PREVIEW':
+            width = max(1, round(width * props.preview_resolution_scale))
+            height = max(1, round(height * props.preview_resolution_scale))
+            preview_samples = props.preview_samples
+
+        render_uv_frame(
+            obj=self._obj,
+            targets=self._uv_render_targets,
+            props=props,
+            frame=frame,
+            width=width,
+            height=height,
+            output_root=self._output_root,
+            preview_samples=preview_samples,
+        )
+
+    def get_effective_fps(self):
+        """
+        Calculates the effective frames-per-second of the bake process.
+
+        Uses the average duration of processed frames to estimate
+        throughput.
+
+        Returns:
+            float: Calculated FPS value. Returns 0.0 if insufficient data
+            or invalid timing values are present.
+        """
+
+        if not self._frame_durations:
+            return 0.0
+
+        avg = sum(self._frame_durations) / len(self._frame_durations)
+
+        if avg <= 0:
+            return 0.0
+
+        return 1.0 / avg
+
+    def format_time(self, seconds: float) -> str:
+        """
+        Formats a time duration into a human-readable string.
+
+        Converts seconds into either:
+        - HH:MM:SS.mmm format (if duration >= 1 hour)
+        - MM:SS.mmm format (otherwise)
+
+        Args:
+            seconds (float): Time duration in seconds.
+
+        Returns:
+            str: Formatted time string. Returns "00:00:00" for invalid input.
+        """
+
+        if seconds is None or seconds < 0:
+            return "00:00:00"
+
+        hours = int(seconds // 3600)
+        minutes = int((seconds % 3600) // 60)
+        secs = seconds % 60
+
+        if hours > 0:
+            return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+        else:
+            return f"{minutes:02d}:{secs:06.3f}"
+
+    def get_progress(self):
+        """
+        Computes overall progress of the bake operation.
+
+        Progress is calculated as the ratio of completed tasks
+        to total tasks.
+
+        Returns:
+            float: Progress value in range [0.0, 1.0].
+                   Returns 0.0 if no tasks exist.
+        """
+
+        if not self._tasks:
+            return 0.0
+        return self._task_index / len(self._tasks)
+
+    def get_status_text(self):
+        """
+        Determines the current status label for the bake process.
+
+        Returns:
+            str: Status string:
+                - "Idle" if no tasks exist
+                - "Previewing" while preview tasks are being processed
+                - "Baking" while tasks are being processed
+        """
+
+        if not self._tasks:
+            return "Idle"
+
+        if self._active_tier == 'PREVIEW':
+            return "Previewing"
+
+        return "Baking"
+
+    def get_denoise_report(self):
+        """
+        Summarizes the low-sample + denoise pipeline timings.
+
+        Returns:
+            str: Time spent baking and denoising against the full-sample
+                baseline, or an empty string if no frame was denoised.
+        """
+
+        stats = self._denoise_stats
+
+        if not stats or not stats["frames"]:
+            return ""
+
+        actual = stats["bake_time"] + stats["denoise_time"]
+        saved = stats["baseline_time"] - actual
+        percent = (saved / stats["baseline_time"] * 100.0) if stats["baseline_time"] > 0 else 0.0
+        source = "measured" if stats["calibration"] else "estimated"
+
+        return (
+            f"Denoised {stats['frames']} frames in {self.format_time(actual)} "
+            f"(bake {self.format_time(stats['bake_time'])}, denoise {self.format_time(stats['denoise_time'])}); "
+            f"{source} full-sample baseline {self.format_time(stats['baseline_time'])}, "
+            f"saved {self.format_time(max(saved, 0.0))} ({percent:.1f}%)"
+        )
+
+    def finish(self, context):
+        """
+        Finalizes the bake operation after all tasks are completed.
+
+        Responsibilities:
+        - Stops the modal timer
+        - Cleans up generated textures (if enabled)
+        - Updates UI state to completed
+        - Reports completion to the user
+
+        Args:
+            context (bpy.types.Context): Current Blender context.
+
+        Side Effects:
+            - Removes timer from window manager
+            - Updates bake progress and status
+        """
+
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        clear_generated_textures(self._props)
+        pause_watch(False)
+
+        if self._writer is not None:
+            self._writer.shutdown()
+
+        self._props.bake_progress = 1.0
+
+        if self._active_tier == 'PREVIEW':
+            self._props.bake_status = "Preview Completed"
+            self.report({'INFO'}, f"Sequenced Bake preview completed: {self._output_root}")
+        else:
+            self._props.bake_status = "Completed"
+            self.report({'INFO'}, "Sequenced Bake completed")
+
+        if self._interpolated_frame_count:
+            self.report({'INFO'}, f"{self._interpolated_frame_count} frames interpolated by adaptive sampling")
+
+        if self._reused_frame_count:
+            self.report({'INFO'}, f"{self._reused_frame_count} identical frames reused without baking")
+
+        if self._write_error_count:
+            self.report({'ERROR'}, f"{self._write_error_count} outputs failed to write")
+
+        denoise_report = self.get_denoise_report()
+        if denoise_report:
+            self._props.bake_denoise_report = denoise_report
+            self.report({'INFO'}, denoise_report)
+
+    def cancel(self, context):
+        """
+        Cancels the bake operation prematurely.
+
+        Performs cleanup similar to finish(), but sets the status
+        to indicate cancellation instead of completion.
+
+        Args:
+            context (bpy.types.Context): Current Blender context.
 
         Side Effects:
             - Stops modal timer
@@ -549,5 +2087,177 @@ class SequencedBakeOperator(bpy.types.Operator):
         wm = context.window_manager
         wm.event_timer_remove(self._timer)
         clear_generated_textures(self._props)
+        pause_watch(False)
+
+        if self._writer is not None:
+            # Frames already being encoded finish; queued ones are dropped.
+            self._writer.shutdown(cancel=True)
+
+        if self._temporal_packer is not None:
+            # Frames baked into a partially filled group are written with it.
+            self._temporal_packer.flush()
+
+        if self._frame_store_writer is not None:
+            # Frames written so far stay readable; the header lists them.
+            self._frame_store_writer.close()
+
+        if self._tile_delta_writer is not None:
+            self._tile_delta_writer.close()
+
+        if self._bake_manifest is not None:
+            self._bake_manifest.save()
+
+        self.save_fingerprints()
+
         self._props.bake_status = "Cancelled"
         self.report({'WARNING'}, "Sequenced Bake cancelled")
+
+    def abort(self, context, error):
+        """
+        Cancels the bake after a task raised an error.
+
+        Runs the regular cancel cleanup, so watch mode resumes, the timer is
+        removed and the background writer threads stop.
+
+        Args:
+            context (bpy.types.Context): Current Blender context.
+            error (Exception): The error that stopped the bake.
+
+        Returns:
+            set[str]: {'CANCELLED'}
+        """
+
+        self.cancel(context)
+        self._props.bake_status = "Failed"
+        self.report({'ERROR'}, f"Sequenced Bake failed: {error}")
+        return {'CANCELLED'}
+
+
+class SequencedBakeExportFrameStoreOperator(bpy.types.Operator):
+    """
+    Exports a frame store (.seqraw) or tile delta store (index.seqdelta) to
+    individual images in the regular per-frame
+    `<object>_<material>_<pass>/<frame>.<ext>` layout, using the scene's
+    output settings.
+    """
+
+    bl_idname = "sequenced_bake.export_frame_store"
+    bl_label = "Export Frame Store"
+    bl_description = "Write the frames of a frame store (.seqraw) or tile delta store (.seqdelta) as individual images"
+
+    filepath: bpy.props.StringProperty(
+        name="Frame Store",
+        subtype='FILE_PATH',
+    )
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.seqraw;*.seqdelta",
+        options={'HIDDEN'},
+    )
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = bpy.path.abspath(context.scene.sequenced_bake_props.sequenced_bake_output_path)
+
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        filepath = bpy.path.abspath(self.filepath)
+
+        if not os.path.isfile(filepath):
+            self.report({'ERROR'}, f"Frame store not found: {filepath}")
+            return {'CANCELLED'}
+
+        try:
+            if filepath.endswith(".seqdelta"):
+                count = export_tile_delta_store(os.path.dirname(filepath))
+            else:
+                count = export_frame_store(filepath)
+        except (OSError, ValueError, KeyError) as error:
+            self.report({'ERROR'}, f"Frame store export failed: {error}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Exported {count} frames from {os.path.basename(filepath)}")
+        return {'FINISHED'}
+
+
+class SequencedBakeBenchmarkEncodingOperator(bpy.types.Operator):
+    """
+    Encodes a baked frame with every PNG compression level and EXR codec /
+    depth combination and reports file size and encode time, so the
+    per-pass encoding can be chosen against a storage budget.
+
+    The table is written to the "Sequenced Bake Encoding Benchmark" text
+    datablock.
+    """
+
+    bl_idname = "sequenced_bake.benchmark_encoding"
+    bl_label = "Benchmark Encodings"
+    bl_description = "Encode a baked frame with each codec and compression level and report size and time"
+
+    filepath: bpy.props.StringProperty(
+        name="Sample Frame",
+        subtype='FILE_PATH',
+    )
+
+    filter_image: bpy.props.BoolProperty(
+        default=True,
+        options={'HIDDEN'},
+    )
+
+    size_budget: bpy.props.IntProperty(
+        name="Size Budget (KiB)",
+        description="Largest acceptable file per frame; 0 picks the fastest encoding regardless of size",
+        default=0,
+        min=0,
+    )
+
+    def invoke(self, context, event):
+        if oiio is None:
+            self.report({'ERROR'}, "The encoding benchmark requires the OpenImageIO module bundled with Blender")
+            return {'CANCELLED'}
+
+        if not self.filepath:
+            self.filepath = bpy.path.abspath(context.scene.sequenced_bake_props.sequenced_bake_output_path)
+
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        filepath = bpy.path.abspath(self.filepath)
+
+        if oiio is None:
+            self.report({'ERROR'}, "The encoding benchmark requires the OpenImageIO module bundled with Blender")
+            return {'CANCELLED'}
+
+        if not os.path.isfile(filepath):
+            self.report({'ERROR'}, f"Sample frame not found: {filepath}")
+            return {'CANCELLED'}
+
+        image = bpy.data.images.load(filepath, check_existing=False)
+
+        try:
+            pixels = get_image_pixels(image)
+            float_buffer = image.is_float
+        finally:
+            bpy.data.images.remove(image)
+
+        results = run_encoding_benchmark(pixels, float_buffer, context.scene.sequenced_bake_props.sequence_is_alpha)
+        max_bytes = self.size_budget * 1024
+        report = format_benchmark_report(results, os.path.basename(filepath), max_bytes)
+
+        text = bpy.data.texts.get(BENCHMARK_TEXT_NAME) or bpy.data.texts.new(BENCHMARK_TEXT_NAME)
+        text.from_string(report)
+
+        best = pick_fastest(results, max_bytes)
+        if best is None:
+            self.report({'WARNING'}, f"No encoding fits the size budget; see the '{BENCHMARK_TEXT_NAME}' text")
+        else:
+            self.report(
+                {'INFO'},
+                f"Fastest: {best['label']} ({best['bytes'] / 1024:.1f} KiB, {best['ms']:.1f} ms); "
+                f"full table in the '{BENCHMARK_TEXT_NAME}' text"
+            )
+
+        return {'FINISHED'}
@@ -20,6 +20,437 @@ import bmesh
 import numpy as np
 from mathutils import Vector
 import os
+import shutil
+import time
+
+from .color_lut import (
+    apply_view_lut,
+    get_view_lut,
+)
+from .manifest import get_shard_name
+
+try:
+    import OpenImageIO as oiio
+except ImportError:
+    oiio = None
+
+
+# Built-in Cycles render profiles per bake type.
+# A value of None leaves the corresponding scene setting untouched.
+# Data passes are deterministic, so a single sample with no bounces is exact.
+RENDER_PROFILE_DEFAULTS = {
+    "NORMAL": {"samples": 1, "max_bounces": 0, "adaptive_threshold": 0.0, "use_denoising": False},
+    "ROUGHNESS": {"samples": 1, "max_bounces": 0, "adaptive_threshold": 0.0, "use_denoising": False},
+    "POSITION": {"samples": 1, "max_bounces": 0, "adaptive_threshold": 0.0, "use_denoising": False},
+    "UV": {"samples": 1, "max_bounces": 0, "adaptive_threshold": 0.0, "use_denoising": False},
+    "EMIT": {"samples": 1, "max_bounces": 0, "adaptive_threshold": 0.0, "use_denoising": False},
+    "ENVIRONMENT": {"samples": 1, "max_bounces": 0, "adaptive_threshold": 0.0, "use_denoising": False},
+    "METALLIC": {"samples": 1, "max_bounces": 0, "adaptive_threshold": 0.0, "use_denoising": False},
+    # ORM packs an Ambient Occlusion node into the red channel, which traces rays.
+    "OCCLUSION": {"samples": 64, "max_bounces": 0, "adaptive_threshold": 0.0, "use_denoising": False},
+    "AO": {"samples": None, "max_bounces": 0, "adaptive_threshold": None, "use_denoising": None},
+    "SHADOW": {"samples": None, "max_bounces": 0, "adaptive_threshold": None, "use_denoising": None},
+    "DIFFUSE": {"samples": None, "max_bounces": None, "adaptive_threshold": None, "use_denoising": None},
+    "GLOSSY": {"samples": None, "max_bounces": None, "adaptive_threshold": None, "use_denoising": None},
+    "TRANSMISSION": {"samples": None, "max_bounces": None, "adaptive_threshold": None, "use_denoising": None},
+    "COMBINED": {"samples": None, "max_bounces": None, "adaptive_threshold": None, "use_denoising": None},
+}
+
+
+def resolve_render_profile(bake_type, props):
+    """
+    Resolve the Cycles render profile to use for a bake type.
+
+    User overrides stored on `props.render_profile_<type>` take precedence
+    over the built-in defaults in RENDER_PROFILE_DEFAULTS.
+
+    Args:
+        bake_type (str): The bake pass type (e.g. NORMAL, COMBINED).
+        props: Property group containing Sequenced Bake settings.
+
+    Returns:
+        dict | None: Profile with samples, max_bounces, adaptive_threshold
+            and use_denoising keys (None values are left untouched), or None
+            if profiles are disabled or the bake type has no profile.
+    """
+    if not props.use_render_profiles:
+        return None
+
+    override = getattr(props, f"render_profile_{bake_type.lower()}", None)
+
+    if override is not None and override.use_override:
+        return {
+            "samples": override.samples,
+            "max_bounces": override.max_bounces,
+            "adaptive_threshold": override.adaptive_threshold,
+            "use_denoising": override.use_denoising,
+        }
+
+    return RENDER_PROFILE_DEFAULTS.get(bake_type)
+
+
+def apply_render_profile(scene, profile):
+    """
+    Apply a render profile to the scene's Cycles settings.
+
+    Args:
+        scene (bpy.types.Scene): Scene whose Cycles settings are modified.
+        profile (dict | None): Profile returned by resolve_render_profile.
+
+    Returns:
+        dict: The original Cycles settings, to be passed to
+            restore_render_profile once the bake is done.
+    """
+    cycles = scene.cycles
+
+    original = {
+        "samples": cycles.samples,
+        "max_bounces": cycles.max_bounces,
+        "use_adaptive_sampling": cycles.use_adaptive_sampling,
+        "adaptive_threshold": cycles.adaptive_threshold,
+        "use_denoising": cycles.use_denoising,
+    }
+
+    if not profile:
+        return original
+
+    if profile["samples"] is not None:
+        cycles.samples = profile["samples"]
+
+    if profile["max_bounces"] is not None:
+        cycles.max_bounces = profile["max_bounces"]
+
+    if profile["adaptive_threshold"] is not None:
+        cycles.use_adaptive_sampling = profile["adaptive_threshold"] > 0.0
+        if profile["adaptive_threshold"] > 0.0:
+            cycles.adaptive_threshold = profile["adaptive_threshold"]
+
+    if profile["use_denoising"] is not None:
+        cycles.use_denoising = profile["use_denoising"]
+
+    return original
+
+
+def restore_render_profile(scene, original):
+    """
+    Restore Cycles settings saved by apply_render_profile.
+
+    Args:
+        scene (bpy.types.Scene): Scene whose Cycles settings are restored.
+        original (dict): Settings returned by apply_render_profile.
+    """
+    cycles = scene.cycles
+
+    for key, value in original.items():
+        setattr(cycles, key, value)
+
+
+# Lit passes handled by the low-sample + denoise pipeline.
+DENOISE_BAKE_TYPES = {"COMBINED", "DIFFUSE", "GLOSSY", "SHADOW", "AO"}
+
+DENOISE_TEMP_TAG = "__SEQBAKE_DENOISE__"
+
+
+def _set_node_option(node, attr, socket_name, value):
+    """
+    Set a compositor node option that may be exposed either as a node
+    property or, in newer Blender versions, as an input socket.
+    """
+    if hasattr(node, attr):
+        setattr(node, attr, value)
+        return
+
+    socket = node.inputs.get(socket_name)
+    if socket is None:
+        return
+
+    try:
+        socket.default_value = value
+    except (TypeError, ValueError):
+        pass
+
+
+def _linear_to_srgb(rgb):
+    """
+    Encode scene-linear values with the sRGB transfer function.
+    """
+    rgb = np.clip(rgb, 0.0, 1.0)
+    return np.where(
+        rgb <= 0.0031308,
+        rgb * 12.92,
+        1.055 * np.power(rgb, 1.0 / 2.4) - 0.055
+    )
+
+
+def _srgb_to_linear(rgb):
+    """
+    Decode sRGB transfer function values to scene-linear.
+    """
+    return np.where(
+        rgb <= 0.04045,
+        rgb / 12.92,
+        np.power((np.maximum(rgb, 0.0) + 0.055) / 1.055, 2.4)
+    )
+
+
+def denoise_image(image, albedo=None, normal=None, prefilter='ACCURATE'):
+    """
+    Denoise a baked image in place with OpenImageDenoise.
+
+    Blender only exposes its bundled OpenImageDenoise through the compositor
+    Denoise node, so this builds a throwaway scene whose compositor feeds the
+    baked image (and optional guide passes) through a Denoise node, renders
+    it to a temporary EXR and copies the result back into `image`.
+
+    Byte images in the sRGB color space are re-encoded from the linear
+    compositor result; all other images receive the linear values as-is.
+
+    Args:
+        image (bpy.types.Image): Baked image to denoise.
+        albedo (bpy.types.Image, optional): Albedo guide pass.
+        normal (bpy.types.Image, optional): Normal guide pass in [-1, 1].
+            Ignored when no albedo guide is provided.
+        prefilter (str): Denoise prefilter mode (NONE, FAST, ACCURATE).
+
+    Raises:
+        RuntimeError: If the compositor fails to produce a result.
+    """
+    width, height = image.size
+    temp_scene = bpy.data.scenes.new(DENOISE_TEMP_TAG)
+    tree = bpy.data.node_groups.new(DENOISE_TEMP_TAG, 'CompositorNodeTree')
+    result_image = None
+    filepath = os.path.join(bpy.app.tempdir, f"{DENOISE_TEMP_TAG}{image.name}.exr")
+
+    try:
+        temp_scene.render.engine = 'BLENDER_WORKBENCH'
+        temp_scene.render.resolution_x = width
+        temp_scene.render.resolution_y = height
+        temp_scene.render.resolution_percentage = 100
+        temp_scene.render.use_compositing = True
+        temp_scene.render.image_settings.file_format = 'OPEN_EXR'
+        temp_scene.render.image_settings.color_depth = '32'
+        temp_scene.render.filepath = filepath
+        temp_scene.compositing_node_group = tree
+
+        tree.interface.new_socket(name="Image", in_out='OUTPUT', socket_type='NodeSocketColor')
+
+        nodes = tree.nodes
+        links = tree.links
+
+        source = nodes.new('CompositorNodeImage')
+        source.image = image
+
+        denoise = nodes.new('CompositorNodeDenoise')
+        _set_node_option(denoise, "prefilter", "Prefilter", prefilter)
+        _set_node_option(denoise, "use_hdr", "HDR", image.is_float)
+
+        output = nodes.new('NodeGroupOutput')
+
+        links.new(source.outputs['Image'], denoise.inputs['Image'])
+
+        if albedo is not None:
+            albedo_node = nodes.new('CompositorNodeImage')
+            albedo_node.image = albedo
+            links.new(albedo_node.outputs['Image'], denoise.inputs['Albedo'])
+
+            if normal is not None:
+                normal_node = nodes.new('CompositorNodeImage')
+                normal_node.image = normal
+                links.new(normal_node.outputs['Image'], denoise.inputs['Normal'])
+
+        links.new(denoise.outputs['Image'], output.inputs[0])
+
+        bpy.ops.render.render(write_still=True, scene=temp_scene.name)
+
+        if not os.path.exists(filepath):
+            raise RuntimeError(f"Compositor denoise produced no output for image: {image.name}")
+
+        result_image = bpy.data.images.load(filepath)
+
+        denoised = np.empty(width * height * 4, dtype=np.float32)
+        result_image.pixels.foreach_get(denoised)
+        denoised = denoised.reshape((height, width, 4))
+
+        if not image.is_float and image.colorspace_settings.name == 'sRGB':
+            denoised[:, :, :3] = _linear_to_srgb(denoised[:, :, :3])
+
+        # Keep the baked alpha, the denoiser only operates on color.
+        original = np.empty(width * height * 4, dtype=np.float32)
+        image.pixels.foreach_get(original)
+        denoised[:, :, 3] = original.reshape((height, width, 4))[:, :, 3]
+
+        image.pixels.foreach_set(denoised.ravel())
+
+    finally:
+        if result_image is not None:
+            bpy.data.images.remove(result_image)
+
+        bpy.data.scenes.remove(temp_scene)
+        bpy.data.node_groups.remove(tree)
+
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+
+def bake_denoise_guides(scene, props, image_node, image, bake_kwargs):
+    """
+    Bake the albedo and normal guide passes for the denoiser.
+
+    Guides are baked into temporary float images through the same image
+    node as the main pass, at a single sample since both are deterministic.
+    The normal guide is remapped from [0, 1] to [-1, 1] as expected by
+    OpenImageDenoise.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        props: Property group containing Sequenced Bake settings.
+        image_node (bpy.types.Node): Active Image Texture node used for baking.
+        image (bpy.types.Image): Main bake target, restored on the node afterward.
+        bake_kwargs (dict): Keyword arguments of the main bpy.ops.object.bake call.
+
+    Returns:
+        tuple[bpy.types.Image | None, bpy.types.Image | None]:
+            The albedo and normal guide images (None when not requested).
+    """
+    if props.denoise_guides == 'NONE':
+        return None, None
+
+    width, height = image.size
+    bake = scene.render.bake
+    guide_profile = {"samples": 1, "max_bounces": 0, "adaptive_threshold": 0.0, "use_denoising": False}
+
+    original_bake = {
+        "use_pass_direct": bake.use_pass_direct,
+        "use_pass_indirect": bake.use_pass_indirect,
+        "use_pass_color": bake.use_pass_color,
+        "normal_space": bake.normal_space,
+        "normal_r": bake.normal_r,
+        "normal_g": bake.normal_g,
+        "normal_b": bake.normal_b,
+    }
+    original_profile = apply_render_profile(scene, guide_profile)
+
+    albedo = None
+    normal = None
+
+    try:
+        albedo = bpy.data.images.new(
+            name=f"{DENOISE_TEMP_TAG}albedo", width=width, height=height, alpha=False, float_buffer=True
+        )
+        albedo.colorspace_settings.name = "Non-Color"
+        image_node.image = albedo
+
+        bake.use_pass_direct = False
+        bake.use_pass_indirect = False
+        bake.use_pass_color = True
+        bpy.ops.object.bake(**dict(bake_kwargs, type="DIFFUSE"))
+
+        if props.denoise_guides == 'ALBEDO_NORMAL':
+            normal = bpy.data.images.new(
+                name=f"{DENOISE_TEMP_TAG}normal", width=width, height=height, alpha=False, float_buffer=True
+            )
+            normal.colorspace_settings.name = "Non-Color"
+            image_node.image = normal
+
+            bake.normal_space = 'OBJECT'
+            bake.normal_r = 'POS_X'
+            bake.normal_g = 'POS_Y'
+            bake.normal_b = 'POS_Z'
+            bpy.ops.object.bake(**dict(bake_kwargs, type="NORMAL"))
+
+            pixels = np.empty(width * height * 4, dtype=np.float32)
+            normal.pixels.foreach_get(pixels)
+            pixels = pixels.reshape((height, width, 4))
+            pixels[:, :, :3] = pixels[:, :, :3] * 2.0 - 1.0
+            normal.pixels.foreach_set(pixels.ravel())
+
+    finally:
+        image_node.image = image
+        restore_render_profile(scene, original_profile)
+
+        for key, value in original_bake.items():
+            setattr(bake, key, value)
+
+    return albedo, normal
+
+
+def bake_and_denoise(scene, props, bake_type, profile, bake_kwargs, image_node, image, mat, denoise_stats=None):
+    """
+    Bake a lit pass at low samples and denoise the result.
+
+    Timing is accumulated into `denoise_stats` so the operator can report
+    the time saved against a full-sample bake. The full-sample baseline
+    is either measured once per (material, bake type) on its first frame
+    or extrapolated linearly from the sample counts.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        props: Property group containing Sequenced Bake settings.
+        bake_type (str): The bake pass type.
+        profile (dict | None): Full-sample render profile for the pass.
+        bake_kwargs (dict): Keyword arguments for bpy.ops.object.bake.
+        image_node (bpy.types.Node): Active Image Texture node used for baking.
+        image (bpy.types.Image): Image datablock receiving the baked result.
+        mat (bpy.types.Material): Material being baked.
+        denoise_stats (dict, optional): Accumulated timing statistics with
+            frames, bake_time, denoise_time, baseline_time and calibration keys.
+    """
+    full_profile = dict(profile) if profile else {
+        "samples": None, "max_bounces": None, "adaptive_threshold": None, "use_denoising": None
+    }
+    full_samples = full_profile["samples"] or scene.cycles.samples
+    low_samples = min(props.denoise_samples, full_samples)
+
+    low_profile = dict(full_profile, samples=low_samples, use_denoising=False)
+
+    calibration_key = (mat.name, bake_type)
+    measure = (
+        denoise_stats is not None
+        and props.denoise_measure_baseline
+        and calibration_key not in denoise_stats["calibration"]
+    )
+
+    if measure:
+        original_profile = apply_render_profile(scene, full_profile)
+        try:
+            start = time.perf_counter()
+            bpy.ops.object.bake(**bake_kwargs)
+            denoise_stats["calibration"][calibration_key] = time.perf_counter() - start
+        finally:
+            restore_render_profile(scene, original_profile)
+
+    original_profile = apply_render_profile(scene, low_profile)
+    try:
+        start = time.perf_counter()
+        bpy.ops.object.bake(**bake_kwargs)
+        bake_time = time.perf_counter() - start
+    finally:
+        restore_render_profile(scene, original_profile)
+
+    start = time.perf_counter()
+    albedo, normal = bake_denoise_guides(scene, props, image_node, image, bake_kwargs)
+
+    try:
+        denoise_image(image, albedo=albedo, normal=normal, prefilter=props.denoise_prefilter)
+    finally:
+        for guide in (albedo, normal):
+            if guide is not None:
+                bpy.data.images.remove(guide)
+
+    denoise_time = time.perf_counter() - start
+
+    if denoise_stats is None:
+        return
+
+    if calibration_key in denoise_stats["calibration"]:
+        baseline_time = denoise_stats["calibration"][calibration_key]
+    else:
+        baseline_time = bake_time * (full_samples / low_samples)
+
+    denoise_stats["frames"] += 1
+    denoise_stats["bake_time"] += bake_time
+    denoise_stats["denoise_time"] += denoise_time
+    denoise_stats["baseline_time"] += baseline_time
 
 
 def clear_generated_textures(props):
@@ -75,10 +506,14 @@ def connect_metallic_node(material):
         links.new(src, output.inputs['Surface'])
 
 
-def connect_occlusion_node(material):
+def connect_occlusion_node(material, include_occlusion=True):
     """
     Temporarily reroute the Occlusio input for baking.
 
+    With include_occlusion disabled the Red channel is left at 0 and no
+    Ambient Occlusion node is created, which turns the graph into a plain
+    Metallic/Roughness channel pack (see bake_packed_scalars).
+
     steps:
     1: Add Combine Color Node set to RGB.
     2: Add Ambient Occlusion Node set to 16 samples with color set to white and connect the AO output socket to the Red input socket of the Combine Color Node.
@@ -109,16 +544,19 @@ def connect_occlusion_node(material):
     # ✅ INSERT HERE
     combine.label = "__SEQBAKE_TEMP__"
 
-    # --- Create Ambient Occlusion ---
-    ao = nodes.new(type='ShaderNodeAmbientOcclusion')
-    ao.samples = 16
-    ao.inputs['Color'].default_value = (1, 1, 1, 1)
+    if include_occlusion:
+        # --- Create Ambient Occlusion ---
+        ao = nodes.new(type='ShaderNodeAmbientOcclusion')
+        ao.samples = 16
+        ao.inputs['Color'].default_value = (1, 1, 1, 1)
 
-    # ✅ INSERT HERE
-    ao.label = "__SEQBAKE_TEMP__"
+        # ✅ INSERT HERE
+        ao.label = "__SEQBAKE_TEMP__"
 
-    # AO → R
-    links.new(ao.outputs['Color'], combine.inputs['Red'])
+        # AO → R
+        links.new(ao.outputs['Color'], combine.inputs['Red'])
+    else:
+        combine.inputs['Red'].default_value = 0.0
 
     # Metallic → G
     if bsdf.inputs['Metallic'].is_linked:
@@ -413,6 +851,47 @@ def reconnect_node(material, temp_tag="__SEQBAKE_TEMP__"):
             nodes.remove(node)
 
 
+# Channel of each packable scalar pass in the ORM-style packed bake. None keeps
+# the full packed image (ORM itself). The first present type is the carrier
+# whose render profile drives the bake.
+PACKED_SCALAR_CHANNELS = {
+    "OCCLUSION": None,
+    "METALLIC": 1,
+    "ROUGHNESS": 2,
+}
+
+# Task marker used in the operator queue for a packed scalar bake.
+PACKED_SCALAR_TASK = "PACKED_SCALARS"
+
+
+def resolve_bake_resolution(bake_type, props, material):
+    """
+    Resolve the output resolution for a bake type and material.
+
+    Precedence (highest first):
+    - Per-bake-type override (`props.resolution_<type>`)
+    - Per-material override (`material.sequenced_bake_resolution`)
+    - Global `sequenced_bake_width` / `sequenced_bake_height`
+
+    Args:
+        bake_type (str): The bake pass type (e.g. NORMAL, ROUGHNESS).
+        props: Property group containing Sequenced Bake settings.
+        material (bpy.types.Material): Material being baked.
+
+    Returns:
+        tuple[int, int]: The (width, height) to bake at.
+    """
+    pass_override = getattr(props, f"resolution_{bake_type.lower()}", None)
+    if pass_override is not None and pass_override.use_override:
+        return pass_override.width, pass_override.height
+
+    material_override = getattr(material, "sequenced_bake_resolution", None)
+    if material_override is not None and material_override.use_override:
+        return material_override.width, material_override.height
+
+    return props.sequenced_bake_width, props.sequenced_bake_height
+
+
 def create_image_texture(material, name, width, height, alpha, float_buffer, interpolation, projection, extension,
                          colorspace):
     """
@@ -462,107 +941,1433 @@ def create_image_texture(material, name, width, height, alpha, float_buffer, int
     return node, image
 
 
-def bake_frame(bake_type, props, frame, obj, mat, image_node, image, output_dir, sculpt_bounds=None,):
+def run_bake_pass(scene, props, bake_type, bake_kwargs, image_node, image, mat, denoise_stats=None,
+                  preview_samples=None):
     """
-    Bake a single frame for a specific bake pass and material.
+    Run a single Cycles bake into the active image node.
 
-    This function configures bake settings based on the bake type,
-    updates the scene to the requested frame, performs the bake
-    operation, and saves the resulting image to disk.
+    Applies the render profile for the bake type around the bake, or
+    routes the pass through the low-sample + denoise pipeline.
 
     Args:
-        bake_type (str): The bake pass type (e.g. NORMAL, DIFFUSE, METALLIC).
+        scene (bpy.types.Scene): Scene being baked.
         props: Property group containing Sequenced Bake settings.
-        frame (int): Frame number to bake.
-        obj (bpy.types.Object): Object being baked.
-        mat (bpy.types.Material): Material being baked.
+        bake_type (str): The bake pass type.
+        bake_kwargs (dict): Keyword arguments for bpy.ops.object.bake.
         image_node (bpy.types.Node): Active Image Texture node used for baking.
         image (bpy.types.Image): Image datablock receiving the baked result.
-        output_dir (str): Directory where the baked image will be saved.
-        sculpt_bounds: defines the bounding box area of the sculpted object.
+        mat (bpy.types.Material): Material being baked.
+        denoise_stats (dict, optional): Timing statistics of the denoise pipeline.
+        preview_samples (int, optional): Sample cap for preview bakes. Preview
+            bakes skip adaptive sampling and the denoise pipeline.
     """
+    profile = resolve_render_profile(bake_type, props)
+
+    if preview_samples is not None:
+        samples = (profile or {}).get("samples") or bpy.context.scene.cycles.samples
+        profile = dict(
+            profile or {"max_bounces": None},
+            samples=min(samples, preview_samples),
+            adaptive_threshold=0.0,
+            use_denoising=False,
+        )
 
-    scene = bpy.context.scene
-    scene.frame_set(frame)
-    bpy.context.view_layer.update()
+    elif props.use_denoise_pipeline and bake_type in DENOISE_BAKE_TYPES:
+        bake_and_denoise(scene, props, bake_type, profile, bake_kwargs, image_node, image, mat, denoise_stats)
+        return
 
-    bake = scene.render.bake
+    original_profile = apply_render_profile(scene, profile)
 
-    if bake_type == "DIFFUSE":
-        bake.use_pass_direct = props.diffuse_lighting_direct
-        bake.use_pass_indirect = props.diffuse_lighting_indirect
-        bake.use_pass_color = props.diffuse_lighting_color
+    try:
+        bpy.ops.object.bake(**bake_kwargs)
+    finally:
+        restore_render_profile(scene, original_profile)
 
-    elif bake_type == "GLOSSY":
-        bake.use_pass_direct = props.glossy_lighting_direct
-        bake.use_pass_indirect = props.glossy_lighting_indirect
-        bake.use_pass_color = props.glossy_lighting_color
 
-    elif bake_type == "TRANSMISSION":
-        bake.use_pass_direct = props.transmission_lighting_direct
-        bake.use_pass_indirect = props.transmission_lighting_indirect
-        bake.use_pass_color = props.transmission_lighting_color
+# OpenImageIO format names for the add-on image formats.
+OIIO_FORMATS = {
+    "PNG": "png",
+    "JPEG": "jpeg",
+    "BMP": "bmp",
+    "TIFF": "tiff",
+    "TGA": "targa",
+    "EXR": "openexr",
+    "HDR": "hdr",
+    "CINEON": "cineon",
+    "DPX": "dpx",
+}
 
-    elif bake_type == "COMBINED":
-        bake.use_pass_direct = props.combined_lighting_direct
-        bake.use_pass_indirect = props.combined_lighting_indirect
-        bake.use_pass_diffuse = props.combined_contribution_deffuse
-        bake.use_pass_glossy = props.combined_contribution_glossy
-        bake.use_pass_transmission = props.combined_contribution_transmission
-        bake.use_pass_emit = props.combined_contribution_emit
+# Formats that store scene-linear values rather than display-encoded values.
+LINEAR_IMAGE_FORMATS = {"EXR", "HDR"}
 
-    elif bake_type == "NORMAL":
-        bake.normal_space = props.normal_map_space
-        bake.normal_r = props.normal_map_red_channel
-        bake.normal_g = props.normal_map_green_channel
-        bake.normal_b = props.normal_map_blue_channel
+# Passes baked into Non-Color images regardless of the color space setting.
+DATA_BAKE_TYPES = {"NORMAL", "ROUGHNESS", "METALLIC", "OCCLUSION"}
 
-    scene.display_settings.display_device = props.display_device
-    scene.view_settings.view_transform = props.view_transform
-    scene.view_settings.look = props.look
-    scene.view_settings.exposure = props.exposure
-    scene.view_settings.gamma = props.gamma
+# Number of written channels per output channel layout.
+CHANNEL_LAYOUT_CHANNELS = {"L": 1, "L16": 1, "LA": 2, "RGB": 3, "RGBA": 4}
 
-    try:
-        scene.sequencer_colorspace_settings.name = props.sequencer
-    except Exception:
-        pass
+# Grayscale layouts reduce color to Rec.709 luminance, as Blender's BW mode does.
+GRAYSCALE_LAYOUTS = {"L", "L16", "LA"}
+LUMINANCE_WEIGHTS = (0.2126, 0.7152, 0.0722)
 
-    cage_name = (
-        props.selected_to_active_cage_object.name
-        if props.selected_to_active_cage and props.selected_to_active_cage_object
-        else ""
-    )
+# Save as Render color modes per layout; Blender has no grayscale + alpha mode.
+SAVE_RENDER_COLOR_MODES = {"L": 'BW', "L16": 'BW', "LA": 'RGBA', "RGB": 'RGB', "RGBA": 'RGBA'}
 
-    # Bake sculpt map rather than a shader.
-    if bake_type == "SCULPT":
-        scene.render.bake.use_clear = True
-        scene.render.bake.margin_type = 'EXTEND'
-        bake_sculpt_direct_to_buffer(obj, image, sculpt_bounds)
-        scene.render.image_settings.color_depth = '16'
+TILE_UV_NAME = "__SEQBAKE_TILE__"
 
-        if scene.render.image_settings.file_format == 'PNG':
-            scene.render.image_settings.compression = 0
 
-        # Save the result
-        filepath = os.path.join(output_dir, f"{frame}.{props.sequenced_bake_image_format}")
-        image.save_render(filepath)
+def get_tile_grid(width, height, tile_size):
+    """
+    Split an output resolution into a grid of tiles.
 
-    else:
-        bpy.ops.object.bake(
-            type=("EMIT" if bake_type in {"METALLIC", "OCCLUSION"} else bake_type),
-            use_selected_to_active=props.sequenced_selected_to_active,
-            cage_extrusion=props.selected_to_active_extrusion,
-            max_ray_distance=props.selected_to_active_max_ray_distance,
-            cage_object=cage_name,
-        )
+    Tiles are laid out from the top-left corner so they line up with the
+    tile grid of tiled image formats; the right column and bottom row may
+    be partially outside the image.
 
-        filepath = os.path.join(
-            output_dir,
-            f"{frame}.{props.sequenced_bake_image_format}"
-        )
+    Args:
+        width (int): Full output width in pixels.
+        height (int): Full output height in pixels.
+        tile_size (int): Tile edge length in pixels.
 
-        image.save_render(filepath)
+    Returns:
+        list[tuple[int, int]]: (column, row) tile indices, row 0 at the top.
+    """
+    columns = -(-width // tile_size)
+    rows = -(-height // tile_size)
+
+    return [(column, row) for row in range(rows) for column in range(columns)]
+
+
+def get_polygon_uv_bounds(mesh, uv_layer):
+    """
+    Compute per-polygon UV bounding boxes.
+
+    Args:
+        mesh (bpy.types.Mesh): Mesh to inspect.
+        uv_layer (bpy.types.MeshUVLoopLayer): UV layer to read.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (min_uv, max_uv) arrays of shape (polygons, 2).
+    """
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    uvs = uvs.reshape((-1, 2))
+
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int64)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+
+    if not len(loop_starts):
+        return np.empty((0, 2), dtype=np.float32), np.empty((0, 2), dtype=np.float32)
+
+    return np.minimum.reduceat(uvs, loop_starts, axis=0), np.maximum.reduceat(uvs, loop_starts, axis=0)
+
+
+def _shift(array, dy, dx):
+    """
+    Shift a 2D (or 2D + channels) array by whole pixels, filling with zeros.
+    """
+    shifted = np.zeros_like(array)
+    height, width = array.shape[:2]
+
+    src_y = slice(max(0, -dy), height - max(0, dy))
+    dst_y = slice(max(0, dy), height - max(0, -dy))
+    src_x = slice(max(0, -dx), width - max(0, dx))
+    dst_x = slice(max(0, dx), width - max(0, -dx))
+
+    shifted[dst_y, dst_x] = array[src_y, src_x]
+    return shifted
+
+
+def extend_margin(pixels, mask, margin):
+    """
+    Extend covered texels outward into uncovered texels.
+
+    Each iteration grows the covered region by one pixel, filling newly
+    covered texels with the average of their covered 8-neighbours, which
+    mirrors the Cycles 'Extend' bake margin.
+
+    Args:
+        pixels (np.ndarray): (height, width, 4) pixel buffer.
+        mask (np.ndarray): (height, width) boolean coverage mask.
+        margin (int): Margin size in pixels.
+
+    Returns:
+        np.ndarray: New pixel buffer with the margin filled in.
+    """
+    pixels = pixels.copy()
+    covered = mask.copy()
+    neighbours = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+    for _ in range(margin):
+        if covered.all() or not covered.any():
+            break
+
+        total = np.zeros_like(pixels)
+        count = np.zeros(covered.shape, dtype=np.float32)
+
+        for dy, dx in neighbours:
+            shifted_covered = _shift(covered, dy, dx)
+            total += _shift(pixels, dy, dx) * shifted_covered[:, :, None]
+            count += shifted_covered
+
+        grow = ~covered & (count > 0)
+        pixels[grow] = total[grow] / count[grow][:, None]
+        covered |= grow
+
+    return pixels
+
+
+def get_image_pixels(image):
+    """
+    Copy an image's pixels into a (height, width, 4) float32 array.
+    """
+    width, height = image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape((height, width, 4))
+
+
+def compute_uv_coverage(obj, material, width, height):
+    """
+    Rasterize which texels of the active UV map a material covers.
+
+    The evaluated mesh is rasterized, so modifiers that add or move UVs
+    (subdivision, UV project, ...) are taken into account.
+
+    Args:
+        obj (bpy.types.Object): Mesh object being baked.
+        material (bpy.types.Material): Material whose faces are rasterized.
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+
+    Returns:
+        np.ndarray: (height, width) boolean coverage mask (row 0 at the bottom).
+    """
+    mask = np.zeros((height, width), dtype=bool)
+    slots = [i for i, slot in enumerate(obj.material_slots) if slot.material == material]
+
+    obj_eval = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+    mesh = obj_eval.to_mesh()
+
+    try:
+        uv_layer = mesh.uv_layers.active
+
+        if uv_layer is None:
+            return mask
+
+        mesh.calc_loop_triangles()
+        triangle_count = len(mesh.loop_triangles)
+        loops = np.empty(triangle_count * 3, dtype=np.int64)
+        material_indices = np.empty(triangle_count, dtype=np.int64)
+        mesh.loop_triangles.foreach_get("loops", loops)
+        mesh.loop_triangles.foreach_get("material_index", material_indices)
+
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+        uvs = uvs.reshape((-1, 2)) * np.array([width, height], dtype=np.float32)
+    finally:
+        obj_eval.to_mesh_clear()
+
+    triangles = uvs[loops.reshape((-1, 3))[np.isin(material_indices, slots)]]
+
+    for (ax, ay), (bx, by), (cx, cy) in triangles:
+        x0 = max(int(np.floor(min(ax, bx, cx))), 0)
+        x1 = min(int(np.ceil(max(ax, bx, cx))), width)
+        y0 = max(int(np.floor(min(ay, by, cy))), 0)
+        y1 = min(int(np.ceil(max(ay, by, cy))), height)
+
+        area = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+        if x0 >= x1 or y0 >= y1 or area == 0.0:
+            continue
+
+        px, py = np.meshgrid(np.arange(x0, x1) + 0.5, np.arange(y0, y1) + 0.5)
+        w0 = ((bx - px) * (cy - py) - (by - py) * (cx - px)) / area
+        w1 = ((cx - px) * (ay - py) - (cy - py) * (ax - px)) / area
+        w2 = 1.0 - w0 - w1
+
+        mask[y0:y1, x0:x1] |= (w0 >= 0.0) & (w1 >= 0.0) & (w2 >= 0.0)
+
+    return mask
+
+
+def has_render_only_geometry(obj):
+    """
+    Check whether the render mesh can differ from the evaluated viewport mesh.
+
+    Cycles bakes the render mesh, while compute_uv_coverage rasterizes the
+    viewport evaluation. Modifiers enabled only for render, or subdivision
+    with different render levels, make the two UV layouts differ.
+
+    Args:
+        obj (bpy.types.Object): Object being baked.
+
+    Returns:
+        bool: True if a modifier changes the mesh only at render time.
+    """
+    for modifier in obj.modifiers:
+        if not modifier.show_render:
+            continue
+
+        if not modifier.show_viewport:
+            return True
+
+        if getattr(modifier, "render_levels", None) not in {None, getattr(modifier, "levels", None)}:
+            return True
+
+    return False
+
+
+def get_frame_filepath(output_dir, frame, props):
+    """
+    Build the output path of a frame inside a pass directory.
+
+    With sharded output, frames are grouped into subdirectories of
+    `shard_size` frames named after their first frame.
+
+    Args:
+        output_dir (str): Pass output directory.
+        frame (int): Frame number.
+        props: Property group containing Sequenced Bake settings.
+
+    Returns:
+        str: Output file path.
+    """
+    filename = f"{frame}.{props.sequenced_bake_image_format}"
+
+    if props.use_sharded_output:
+        return os.path.join(output_dir, get_shard_name(frame, props.shard_size), filename)
+
+    return os.path.join(output_dir, filename)
+
+
+def prepare_output_path(filepath):
+    """
+    Create the directory of an output and remove any existing file at it.
+
+    Outputs may be hardlinks shared with other frames (see link_or_copy);
+    writers that open the path in place would rewrite every linked frame,
+    so each write starts from a fresh file.
+
+    Args:
+        filepath (str): Output file path.
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+    if os.path.lexists(filepath):
+        os.remove(filepath)
+
+
+def link_or_copy(source, destination):
+    """
+    Hardlink a finished output to a new path, copying if linking fails.
+
+    Writers remove the path before writing (see prepare_output_path), so
+    re-baking one frame never changes the frames linked to it.
+
+    Args:
+        source (str): Existing output file.
+        destination (str): Path that should hold the same content.
+    """
+    if os.path.abspath(source) == os.path.abspath(destination):
+        return
+
+    prepare_output_path(destination)
+
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def compute_margin_index(mask, margin):
+    """
+    Map every margin texel to its nearest covered texel.
+
+    The map is computed once per UV layout so the bake margin can be
+    applied to each frame with a single gather (see apply_margin_index)
+    instead of being recomputed by every Cycles bake. Like the 'Extend'
+    margin type, margin texels repeat the closest covered texel.
+
+    Args:
+        mask (np.ndarray): (height, width) boolean coverage mask.
+        margin (int): Margin size in pixels.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (targets, sources) flat texel indices.
+    """
+    height, width = mask.shape
+    ys, xs = np.indices(mask.shape)
+    neighbours = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+    # Nearest covered texel index + 1 (0 = not reached yet).
+    nearest = np.where(mask, np.arange(mask.size).reshape(mask.shape) + 1, 0)
+
+    for _ in range(margin):
+        unresolved = nearest == 0
+        if not unresolved.any() or unresolved.all():
+            break
+
+        best = nearest.copy()
+        best_distance = np.full(mask.shape, np.inf)
+
+        for dy, dx in neighbours:
+            candidate = _shift(nearest, dy, dx)
+            source_y, source_x = np.divmod(candidate - 1, width)
+            distance = (source_y - ys) ** 2 + (source_x - xs) ** 2
+            better = unresolved & (candidate > 0) & (distance < best_distance)
+            best[better] = candidate[better]
+            best_distance[better] = distance[better]
+
+        if np.array_equal(best, nearest):
+            break
+
+        nearest = best
+
+    nearest = nearest.ravel()
+    targets = np.flatnonzero(~mask.ravel() & (nearest > 0))
+    return targets, nearest[targets] - 1
+
+
+def apply_margin_index(pixels, margin_index):
+    """
+    Fill the bake margin of a pixel buffer from a cached margin index.
+
+    Args:
+        pixels (np.ndarray): (height, width, 4) pixel buffer, modified in place.
+        margin_index (tuple[np.ndarray, np.ndarray]): Result of compute_margin_index.
+    """
+    targets, sources = margin_index
+    flat = pixels.reshape((-1, 4))
+    flat[targets] = flat[sources]
+
+
+def apply_image_margin(image, margin_index):
+    """
+    Fill the bake margin of an image datablock from a cached margin index.
+
+    Args:
+        image (bpy.types.Image): Image baked with a margin of 0.
+        margin_index (tuple[np.ndarray, np.ndarray]): Result of compute_margin_index.
+    """
+    pixels = get_image_pixels(image)
+    apply_margin_index(pixels, margin_index)
+    image.pixels.foreach_set(pixels.ravel())
+
+
+def save_pixels(pixels, name, filepath, alpha, colorspace=None, channel_layout='DEFAULT', encoding=None):
+    """
+    Save a (height, width, 4) float pixel buffer with the scene's output settings.
+
+    Args:
+        pixels (np.ndarray): Pixel buffer (row 0 at the bottom).
+        name (str): Name of the temporary image datablock.
+        filepath (str): Output file path.
+        alpha (bool): Whether the image has an alpha channel.
+        colorspace (str | None): Color space of the pixel data.
+        channel_layout (str): Output channel layout (see resolve_channel_layout).
+        encoding (SequencedBakeEncoding, optional): Encoding override applied
+            while saving (see resolve_encoding).
+    """
+    scene = bpy.context.scene
+    height, width = pixels.shape[:2]
+    image = bpy.data.images.new(name=name, width=width, height=height, alpha=alpha, float_buffer=True)
+    original_encoding = None
+
+    try:
+        if colorspace:
+            image.colorspace_settings.name = colorspace
+
+        image.pixels.foreach_set(np.ascontiguousarray(pixels, dtype=np.float32).ravel())
+        original_encoding = apply_encoding(scene, encoding)
+        save_render_with_layout(scene, image, filepath, channel_layout)
+    finally:
+        restore_encoding(scene, original_encoding)
+        bpy.data.images.remove(image)
+
+
+def open_stitched_output(filepath, image_format, width, height, tile_size, float_buffer, channel_layout='DEFAULT',
+                         attributes=None, color_depth=None):
+    """
+    Open an OpenImageIO output for streaming tiles into a single image.
+
+    EXR outputs are written as tiled EXR files, other formats as scanline
+    images written one tile row at a time. The default layout writes RGBA.
+    `attributes` (see get_write_attributes) set the compression and
+    `color_depth` (see get_output_color_depth) the sample type.
+
+    Returns:
+        tuple[oiio.ImageOutput, bool]: The opened output and whether it
+            accepts tiles directly.
+
+    Raises:
+        RuntimeError: If OpenImageIO is unavailable or the file cannot be opened.
+    """
+    if oiio is None:
+        raise RuntimeError("Tiled baking requires the OpenImageIO module bundled with Blender")
+
+    output = oiio.ImageOutput.create(OIIO_FORMATS.get(image_format, image_format.lower()))
+    if output is None:
+        raise RuntimeError(f"OpenImageIO cannot write {image_format}: {oiio.geterror()}")
+
+    channels = 4 if channel_layout == 'DEFAULT' else CHANNEL_LAYOUT_CHANNELS[channel_layout]
+    spec = oiio.ImageSpec(
+        width, height, channels, get_layout_pixel_format(channel_layout, image_format, float_buffer, color_depth)
+    )
+    use_tiles = output.supports("tiles") and image_format == "EXR"
+
+    if use_tiles:
+        spec.tile_width = tile_size
+        spec.tile_height = tile_size
+
+    for name, value in (attributes or {}).items():
+        spec.attribute(name, value)
+
+    prepare_output_path(filepath)
+
+    if not output.open(filepath, spec):
+        raise RuntimeError(f"Failed to open {filepath}: {output.geterror()}")
+
+    return output, use_tiles
+
+
+def resolve_channel_layout(bake_type, props):
+    """
+    Resolve the output channel layout of a bake type.
+
+    Args:
+        bake_type (str): The bake pass type.
+        props: Property group containing Sequenced Bake settings.
+
+    Returns:
+        str: 'DEFAULT', 'L', 'L16', 'LA', 'RGB' or 'RGBA'. Grayscale layouts
+        fall back to 'DEFAULT' for Radiance HDR, which only stores RGB.
+    """
+    layout = getattr(props, f"channel_layout_{bake_type.lower()}", 'DEFAULT')
+
+    if layout in GRAYSCALE_LAYOUTS and props.sequenced_bake_image_format == "HDR":
+        return 'DEFAULT'
+
+    return layout
+
+
+def convert_channel_layout(pixels, channel_layout, alpha):
+    """
+    Reduce (height, width, 4) pixels to the channels of a layout.
+
+    Args:
+        pixels (np.ndarray): RGBA pixels.
+        channel_layout (str): Output channel layout.
+        alpha (bool): Whether the default layout keeps alpha.
+
+    Returns:
+        np.ndarray: (height, width, C) pixels.
+    """
+    if channel_layout in GRAYSCALE_LAYOUTS:
+        channels = [pixels[:, :, :3] @ np.asarray(LUMINANCE_WEIGHTS, dtype=np.float32)]
+        if channel_layout == "LA":
+            channels.append(pixels[:, :, 3])
+        return np.stack(channels, axis=-1)
+
+    if channel_layout == "RGB" or (channel_layout == 'DEFAULT' and not alpha):
+        return pixels[:, :, :3]
+
+    return pixels[:, :, :4]
+
+
+def get_layout_pixel_format(channel_layout, image_format, float_buffer, color_depth=None):
+    """
+    Choose the OpenImageIO pixel format of an output.
+
+    Grayscale layouts are written as half floats in EXR and as 8-bit (L, LA)
+    or 16-bit (L16) integers elsewhere. Color layouts use the color depth
+    when given (see get_output_color_depth) and follow the float buffer
+    setting otherwise.
+
+    Returns:
+        str: OpenImageIO pixel format name.
+    """
+    if image_format in LINEAR_IMAGE_FORMATS:
+        if channel_layout in GRAYSCALE_LAYOUTS:
+            return "half"
+        full_float = float_buffer if color_depth is None else color_depth == '32'
+        return "float" if full_float else "half"
+
+    if channel_layout == "L16":
+        return "uint16"
+
+    if channel_layout in GRAYSCALE_LAYOUTS:
+        return "uint8"
+
+    high_depth = float_buffer if color_depth is None else color_depth == '16'
+    return "uint16" if high_depth and image_format in {"PNG", "TIFF"} else "uint8"
+
+
+def get_output_color_depth(scene, image_format, encoding=None):
+    """
+    Resolve the sample depth Image.save_render writes an output with.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        image_format (str): Add-on image format.
+        encoding (SequencedBakeEncoding, optional): Encoding override; its
+            EXR depth replaces the scene setting for EXR outputs.
+
+    Returns:
+        str: '8', '16' or '32', as in the scene output settings.
+    """
+    if encoding is not None and image_format == "EXR":
+        return encoding.exr_depth
+
+    return scene.render.image_settings.color_depth
+
+
+def save_render_with_layout(scene, image, filepath, channel_layout='DEFAULT'):
+    """
+    Save an image with image.save_render, temporarily switching the scene
+    output color mode and depth to the channel layout.
+
+    save_render writes into an existing file in place, so the path is
+    cleared first (see prepare_output_path).
+
+    Args:
+        scene (bpy.types.Scene): Scene whose output settings are used.
+        image (bpy.types.Image): Image to save.
+        filepath (str): Output file path.
+        channel_layout (str): Output channel layout.
+    """
+    prepare_output_path(filepath)
+
+    if channel_layout == 'DEFAULT':
+        image.save_render(filepath)
+        return
+
+    settings = scene.render.image_settings
+    original = {"color_mode": settings.color_mode, "color_depth": settings.color_depth}
+
+    if settings.file_format in {'OPEN_EXR', 'OPEN_EXR_MULTILAYER'}:
+        depth = '16' if channel_layout in GRAYSCALE_LAYOUTS else None
+    else:
+        depth = {"L": '8', "LA": '8', "L16": '16'}.get(channel_layout)
+
+    try:
+        # Formats without the requested mode or depth keep their own settings.
+        for attr, value in (("color_mode", SAVE_RENDER_COLOR_MODES[channel_layout]), ("color_depth", depth)):
+            if value is not None:
+                try:
+                    setattr(settings, attr, value)
+                except TypeError:
+                    pass
+
+        image.save_render(filepath)
+    finally:
+        for attr, value in original.items():
+            setattr(settings, attr, value)
+
+
+def prepare_pixel_write(scene, image, props, channel_layout='DEFAULT', encoding=None):
+    """
+    Choose how a baked image is written from its raw pixels with OpenImageIO
+    so that the file matches Image.save_render.
+
+    Data passes (non-color images) are written raw, skipping color
+    management. Linear formats get scene-linear values, so byte sRGB images
+    are decoded first. Color passes under a plain 'Standard' sRGB view only
+    need the sRGB transfer function; any other display, view, look,
+    exposure or gamma is applied through a cached 3D LUT of the scene view
+    transform. The sample depth follows the scene output settings, or the
+    EXR depth of an encoding override.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        image (bpy.types.Image): Baked image.
+        props: Property group containing Sequenced Bake settings.
+        channel_layout (str): Output channel layout.
+        encoding (SequencedBakeEncoding, optional): Encoding override; its
+            codec, compression and EXR depth replace the scene settings.
+
+    Returns:
+        dict | None: Keyword arguments for write_pixels (besides pixels and
+        filepath), or None if OpenImageIO cannot write the format.
+    """
+    image_format = props.sequenced_bake_image_format
+
+    if oiio is None or image_format not in OIIO_FORMATS:
+        return None
+
+    write_kwargs = dict(
+        image_format=image_format,
+        float_buffer=image.is_float,
+        alpha=props.sequence_is_alpha,
+        encode_srgb=False,
+        view_lut=None,
+        attributes=get_write_attributes(scene, image_format, encoding),
+        channel_layout=channel_layout,
+        decode_srgb=False,
+        color_depth=get_output_color_depth(scene, image_format, encoding),
+    )
+
+    colorspace = image.colorspace_settings.name
+    if colorspace == "Non-Color":
+        return write_kwargs
+
+    if image_format in LINEAR_IMAGE_FORMATS:
+        # Float images are already scene-linear; byte images hold sRGB.
+        write_kwargs["decode_srgb"] = not image.is_float and colorspace == 'sRGB'
+        return write_kwargs
+
+    view = scene.view_settings
+    standard_view = (
+        scene.display_settings.display_device == 'sRGB' and view.view_transform == 'Standard'
+        and view.look == 'None' and view.exposure == 0.0 and view.gamma == 1.0
+    )
+
+    if standard_view and image.is_float:
+        write_kwargs["encode_srgb"] = True
+    elif not (standard_view and colorspace == 'sRGB'):
+        write_kwargs["view_lut"] = get_view_lut(scene, image)
+
+    return write_kwargs
+
+
+def get_write_attributes(scene, image_format, encoding=None):
+    """
+    Translate the output compression settings to OpenImageIO attributes.
+
+    An encoding override is read directly rather than through the scene
+    output settings, which apply_encoding only changes when the scene file
+    format matches.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        image_format (str): Add-on image format.
+        encoding (SequencedBakeEncoding, optional): Result of resolve_encoding.
+
+    Returns:
+        dict[str, object]: OpenImageIO output attributes.
+    """
+    if encoding is not None:
+        return get_encoding_attributes(image_format, encoding.exr_codec, encoding.png_compression)
+
+    settings = scene.render.image_settings
+    return get_encoding_attributes(image_format, settings.exr_codec, settings.compression)
+
+
+def get_encoding_attributes(image_format, exr_codec, png_compression):
+    """
+    Build the OpenImageIO compression attributes of an encoding.
+
+    Args:
+        image_format (str): Add-on image format.
+        exr_codec (str): Blender EXR codec identifier (e.g. 'ZIP', 'DWAA').
+        png_compression (int): Blender PNG compression in percent.
+
+    Returns:
+        dict[str, object]: OpenImageIO output attributes.
+    """
+    if image_format == "PNG":
+        return {"png:compressionLevel": round(png_compression * 9 / 100)}
+
+    if image_format == "EXR":
+        return {"compression": exr_codec.lower()}
+
+    return {}
+
+
+def resolve_encoding(bake_type, props):
+    """
+    Return the encoding override of a bake type.
+
+    Args:
+        bake_type (str): The bake pass type.
+        props: Property group containing Sequenced Bake settings.
+
+    Returns:
+        SequencedBakeEncoding | None: The override, or None when the scene
+        output settings apply.
+    """
+    encoding = getattr(props, f"encoding_{bake_type.lower()}", None)
+
+    if encoding is None or not encoding.use_override:
+        return None
+
+    return encoding
+
+
+def apply_encoding(scene, encoding):
+    """
+    Apply an encoding override to the scene output settings.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        encoding (SequencedBakeEncoding | None): Result of resolve_encoding.
+
+    Returns:
+        dict | None: Original settings for restore_encoding.
+    """
+    if encoding is None:
+        return None
+
+    settings = scene.render.image_settings
+    original = {
+        "exr_codec": settings.exr_codec,
+        "color_depth": settings.color_depth,
+        "compression": settings.compression,
+    }
+
+    if settings.file_format in {'OPEN_EXR', 'OPEN_EXR_MULTILAYER'}:
+        settings.exr_codec = encoding.exr_codec
+        settings.color_depth = encoding.exr_depth
+    elif settings.file_format == 'PNG':
+        settings.compression = encoding.png_compression
+
+    return original
+
+
+def restore_encoding(scene, original):
+    """
+    Restore the scene output settings changed by apply_encoding.
+    """
+    if original is None:
+        return
+
+    settings = scene.render.image_settings
+    for attr, value in original.items():
+        setattr(settings, attr, value)
+
+
+def encode_output_pixels(data, encode_srgb=False, view_lut=None, decode_srgb=False):
+    """
+    Apply the color encoding chosen by prepare_pixel_write to pixels.
+
+    Args:
+        data (np.ndarray): (height, width, 4) float32 pixels; sRGB encoding
+            and decoding modify them in place.
+        encode_srgb (bool): Apply the sRGB transfer function to the color channels.
+        view_lut (tuple[np.ndarray, bool], optional): View transform LUT
+            (see get_view_lut) applied to the color channels instead.
+        decode_srgb (bool): Decode sRGB color channels to scene-linear.
+
+    Returns:
+        np.ndarray: The encoded pixels.
+    """
+    if view_lut is not None:
+        return apply_view_lut(data, view_lut)
+
+    if encode_srgb:
+        data[:, :, :3] = _linear_to_srgb(data[:, :, :3])
+    elif decode_srgb:
+        data[:, :, :3] = _srgb_to_linear(data[:, :, :3])
+
+    return data
+
+
+def write_pixels(pixels, filepath, image_format, float_buffer, alpha, encode_srgb, view_lut=None, attributes=None,
+                 channel_layout='DEFAULT', decode_srgb=False, color_depth=None):
+    """
+    Encode and write pixels with OpenImageIO without touching bpy.
+
+    Safe to call from a worker thread. The file is written under a temporary
+    name and moved into place, so a partially written file never appears at
+    the output path.
+
+    Args:
+        pixels (np.ndarray): (height, width, 4) float32 pixels (row 0 at the bottom).
+        filepath (str): Output file path.
+        image_format (str): Add-on image format.
+        float_buffer (bool): Whether the pixels come from a float image.
+        alpha (bool): Whether to write the alpha channel.
+        encode_srgb (bool): Apply the sRGB transfer function to the color channels.
+        view_lut (tuple[np.ndarray, bool], optional): View transform LUT
+            (see get_view_lut) applied to the color channels instead.
+        attributes (dict, optional): OpenImageIO output attributes.
+        channel_layout (str): Output channel layout (see resolve_channel_layout).
+        decode_srgb (bool): Decode sRGB color channels to scene-linear.
+        color_depth (str, optional): Sample depth of color layouts (see
+            get_output_color_depth); defaults to the float buffer setting.
+
+    Raises:
+        RuntimeError: If OpenImageIO is unavailable or the file cannot be written.
+    """
+    if oiio is None:
+        raise RuntimeError("Writing images requires the OpenImageIO module bundled with Blender")
+
+    # Blender stores rows bottom-up, image files top-down.
+    data = encode_output_pixels(np.ascontiguousarray(pixels[::-1]), encode_srgb, view_lut, decode_srgb)
+    data = np.ascontiguousarray(convert_channel_layout(data, channel_layout, alpha))
+    channels = data.shape[2]
+
+    output = oiio.ImageOutput.create(OIIO_FORMATS.get(image_format, image_format.lower()))
+    if output is None:
+        raise RuntimeError(f"OpenImageIO cannot write {image_format}: {oiio.geterror()}")
+
+    height, width = data.shape[:2]
+    spec = oiio.ImageSpec(
+        width, height, channels, get_layout_pixel_format(channel_layout, image_format, float_buffer, color_depth)
+    )
+
+    for name, value in (attributes or {}).items():
+        spec.attribute(name, value)
+
+    temp_path = f"{filepath}.part"
+
+    if not output.open(temp_path, spec):
+        raise RuntimeError(f"Failed to open {filepath}: {output.geterror()}")
+
+    written = output.write_image(data)
+    error = "" if written else output.geterror()
+    output.close()
+
+    if not written:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise RuntimeError(f"Failed to write {filepath}: {error}")
+
+    os.replace(temp_path, filepath)
+
+
+def save_baked_image(scene, props, image, filepath, writer=None, channel_layout='DEFAULT', encoding=None):
+    """
+    Write a baked image to disk.
+
+    Uses the OpenImageIO writer (see prepare_pixel_write) when a background
+    writer is given or direct writing is enabled, and image.save_render
+    otherwise.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        props: Property group containing Sequenced Bake settings.
+        image (bpy.types.Image): Baked image.
+        filepath (str): Output file path.
+        writer (AsyncImageWriter, optional): Background writer.
+        channel_layout (str): Output channel layout (see resolve_channel_layout).
+        encoding (SequencedBakeEncoding, optional): Encoding override, already
+            applied to the scene with apply_encoding.
+    """
+    # A failed write must not leave an older output behind.
+    prepare_output_path(filepath)
+
+    write_kwargs = None
+    if writer is not None or props.use_direct_write:
+        write_kwargs = prepare_pixel_write(scene, image, props, channel_layout, encoding)
+
+    if write_kwargs is None:
+        save_render_with_layout(scene, image, filepath, channel_layout)
+    elif writer is not None:
+        writer.submit(get_image_pixels(image), filepath, **write_kwargs)
+    else:
+        write_pixels(get_image_pixels(image), filepath, **write_kwargs)
+
+
+def bake_tiled(bake_type, props, obj, mat, image_node, image, full_size, filepath, bake_kwargs, denoise_stats=None,
+               preview_samples=None, channel_layout='DEFAULT', encoding=None):
+    """
+    Bake a frame one UV-space tile at a time and stream it to disk.
+
+    A temporary UV map scales and offsets the active UV map so that each
+    tile of the final image maps onto the [0, 1] range of the tile-sized
+    bake target. Baked tiles are streamed to a tiled EXR (or written as
+    scanline bands for other formats), so peak memory is bounded by the
+    tile size rather than the final resolution. Tiles that no UV island of
+    the material (plus bake margin) touches are written empty without
+    baking or encoding.
+
+    Tiles are color managed like a direct write of the whole image (see
+    prepare_pixel_write), so switching tiling on does not change how a
+    color pass looks.
+
+    Args:
+        bake_type (str): The bake pass type.
+        props: Property group containing Sequenced Bake settings.
+        obj (bpy.types.Object): Object being baked.
+        mat (bpy.types.Material): Material being baked.
+        image_node (bpy.types.Node): Active Image Texture node used for baking.
+        image (bpy.types.Image): Tile-sized bake target.
+        full_size (tuple[int, int]): Final output (width, height).
+        filepath (str): Output file path.
+        bake_kwargs (dict): Keyword arguments for bpy.ops.object.bake.
+        denoise_stats (dict, optional): Timing statistics of the denoise pipeline.
+        preview_samples (int, optional): Sample cap for preview bakes.
+        channel_layout (str): Output channel layout (see resolve_channel_layout).
+        encoding (SequencedBakeEncoding, optional): Encoding override, already
+            applied to the scene with apply_encoding.
+
+    Raises:
+        RuntimeError: If the object has no active UV map or OpenImageIO
+            cannot write the format.
+    """
+    scene = bpy.context.scene
+    mesh = obj.data
+    width, height = full_size
+    tile_size = image.size[0]
+    image_format = props.sequenced_bake_image_format
+
+    source_uv = mesh.uv_layers.active
+    if source_uv is None:
+        raise RuntimeError(f"Object '{obj.name}' has no active UV layer.")
+
+    source_uv_name = source_uv.name
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    source_uv.data.foreach_get("uv", uvs)
+    uvs = uvs.reshape((-1, 2))
+
+    min_uv, max_uv = get_polygon_uv_bounds(mesh, source_uv)
+    margin = scene.render.bake.margin
+
+    # Only the material's own faces decide whether a tile needs baking.
+    slots = [i for i, slot in enumerate(obj.material_slots) if slot.material == mat]
+    if slots:
+        material_indices = np.empty(len(mesh.polygons), dtype=np.int64)
+        mesh.polygons.foreach_get("material_index", material_indices)
+        used = np.isin(material_indices, slots)
+        min_uv, max_uv = min_uv[used], max_uv[used]
+
+    write_kwargs = prepare_pixel_write(scene, image, props, channel_layout, encoding)
+    if write_kwargs is None:
+        raise RuntimeError(f"OpenImageIO cannot write {image_format}")
+
+    color_kwargs = {key: write_kwargs[key] for key in ("encode_srgb", "view_lut", "decode_srgb")}
+
+    empty_tile = np.zeros((tile_size, tile_size, 4), dtype=np.float32)
+    if not props.sequence_is_alpha:
+        empty_tile[:, :, 3] = 1.0
+
+    # Uncovered tiles are identical, so they are encoded once up front.
+    encoded_empty_tile = encode_output_pixels(empty_tile, **color_kwargs)
+
+    if channel_layout != 'DEFAULT':
+        encoded_empty_tile = convert_channel_layout(encoded_empty_tile, channel_layout, props.sequence_is_alpha)
+
+    output, use_tiles = open_stitched_output(
+        filepath, image_format, width, height, tile_size, write_kwargs["float_buffer"], channel_layout,
+        write_kwargs["attributes"], write_kwargs["color_depth"]
+    )
+    tile_uv = mesh.uv_layers.new(name=TILE_UV_NAME)
+    band = None
+
+    try:
+        mesh.uv_layers.active = tile_uv
+
+        for column, row in get_tile_grid(width, height, tile_size):
+            # Tile bounds in bottom-up pixel space.
+            x0 = column * tile_size
+            y0 = height - (row + 1) * tile_size
+
+            touched = np.any(
+                (max_uv[:, 0] * width >= x0 - margin)
+                & (min_uv[:, 0] * width <= x0 + tile_size + margin)
+                & (max_uv[:, 1] * height >= y0 - margin)
+                & (min_uv[:, 1] * height <= y0 + tile_size + margin)
+            )
+
+            if touched:
+                tile_uvs = np.empty_like(uvs)
+                tile_uvs[:, 0] = (uvs[:, 0] * width - x0) / tile_size
+                tile_uvs[:, 1] = (uvs[:, 1] * height - y0) / tile_size
+                tile_uv.data.foreach_set("uv", tile_uvs.ravel())
+                mesh.update()
+
+                run_bake_pass(
+                    scene, props, bake_type, bake_kwargs, image_node, image, mat, denoise_stats, preview_samples
+                )
+
+                # Blender stores rows bottom-up, image files top-down.
+                tile = encode_output_pixels(np.ascontiguousarray(get_image_pixels(image)[::-1]), **color_kwargs)
+
+                if channel_layout != 'DEFAULT':
+                    tile = convert_channel_layout(tile, channel_layout, props.sequence_is_alpha)
+            else:
+                tile = encoded_empty_tile
+
+            if use_tiles:
+                output.write_tile(x0, row * tile_size, 0, np.ascontiguousarray(tile))
+                continue
+
+            if column == 0:
+                band_height = min(tile_size, height - row * tile_size)
+                band = np.zeros((band_height, width, encoded_empty_tile.shape[2]), dtype=np.float32)
+
+            # The bottom row and right column may be only partially inside the image.
+            band_width = min(tile_size, width - x0)
+            band[:, x0:x0 + band_width] = tile[:band.shape[0], :band_width]
+
+            if x0 + tile_size >= width:
+                output.write_scanlines(row * tile_size, row * tile_size + band.shape[0], 0, band)
+                band = None
+
+    finally:
+        output.close()
+        mesh.uv_layers.remove(tile_uv)
+
+        if source_uv_name in mesh.uv_layers:
+            mesh.uv_layers.active = mesh.uv_layers[source_uv_name]
+
+
+def run_bake_pass_with_margin(scene, props, bake_type, bake_kwargs, image_node, image, mat, denoise_stats=None,
+                              preview_samples=None, margin_index=None):
+    """
+    Run a bake pass, applying the bake margin from a cached margin index.
+
+    Without a margin index this is run_bake_pass. Otherwise Cycles bakes
+    with a margin of 0 and the margin is filled in with one gather.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        props: Property group containing Sequenced Bake settings.
+        bake_type (str): The bake pass type.
+        bake_kwargs (dict): Keyword arguments for bpy.ops.object.bake.
+        image_node (bpy.types.Node): Active Image Texture node used for baking.
+        image (bpy.types.Image): Image datablock receiving the bake.
+        mat (bpy.types.Material): Material being baked.
+        denoise_stats (dict, optional): Timing statistics of the denoise pipeline.
+        preview_samples (int, optional): Sample cap used by preview bakes.
+        margin_index (tuple[np.ndarray, np.ndarray], optional): Cached margin index.
+    """
+    if margin_index is None:
+        run_bake_pass(scene, props, bake_type, bake_kwargs, image_node, image, mat, denoise_stats, preview_samples)
+        return
+
+    bake = scene.render.bake
+    original_margin = bake.margin
+    bake.margin = 0
+
+    try:
+        run_bake_pass(scene, props, bake_type, bake_kwargs, image_node, image, mat, denoise_stats, preview_samples)
+    finally:
+        bake.margin = original_margin
+
+    apply_image_margin(image, margin_index)
+
+
+def get_enabled_bake_types(props):
+    """
+    Map every supported bake pass to whether it is enabled.
+
+    Args:
+        props: Property group containing Sequenced Bake settings.
+
+    Returns:
+        dict[str, bool]: Enabled flag per bake pass type, in bake order.
+    """
+    return {
+        "NORMAL": props.sequenced_bake_normal,
+        "ROUGHNESS": props.sequenced_bake_roughness,
+        "GLOSSY": props.sequenced_bake_glossy,
+        "EMIT": props.sequenced_bake_emission,
+        "AO": props.sequenced_bake_ambient_occlusion,
+        "SHADOW": props.sequenced_bake_shadow,
+        "POSITION": props.sequenced_bake_position,
+        "UV": props.sequenced_bake_uv,
+        "ENVIRONMENT": props.sequenced_bake_environment,
+        "DIFFUSE": props.sequenced_bake_diffuse,
+        "TRANSMISSION": props.sequenced_bake_transmission,
+        "COMBINED": props.sequenced_bake_combined,
+        "METALLIC": props.sequenced_bake_metallic,
+        "OCCLUSION": props.sequenced_bake_occlusion,
+        "SCULPT": props.sequenced_bake_sculpt,
+    }
+
+
+def apply_pass_settings(scene, props, bake_type):
+    """
+    Apply the lighting contributions, normal space and color management
+    settings of a bake pass to the scene.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        props: Property group containing Sequenced Bake settings.
+        bake_type (str): The bake pass type.
+    """
+    bake = scene.render.bake
+
+    if bake_type == "DIFFUSE":
+        bake.use_pass_direct = props.diffuse_lighting_direct
+        bake.use_pass_indirect = props.diffuse_lighting_indirect
+        bake.use_pass_color = props.diffuse_lighting_color
+
+    elif bake_type == "GLOSSY":
+        bake.use_pass_direct = props.glossy_lighting_direct
+        bake.use_pass_indirect = props.glossy_lighting_indirect
+        bake.use_pass_color = props.glossy_lighting_color
+
+    elif bake_type == "TRANSMISSION":
+        bake.use_pass_direct = props.transmission_lighting_direct
+        bake.use_pass_indirect = props.transmission_lighting_indirect
+        bake.use_pass_color = props.transmission_lighting_color
+
+    elif bake_type == "COMBINED":
+        bake.use_pass_direct = props.combined_lighting_direct
+        bake.use_pass_indirect = props.combined_lighting_indirect
+        bake.use_pass_diffuse = props.combined_contribution_deffuse
+        bake.use_pass_glossy = props.combined_contribution_glossy
+        bake.use_pass_transmission = props.combined_contribution_transmission
+        bake.use_pass_emit = props.combined_contribution_emit
+
+    elif bake_type == "NORMAL":
+        bake.normal_space = props.normal_map_space
+
+        # Derived conventions are swizzled from one canonical +X +Y +Z bake.
+        if props.use_normal_conventions:
+            bake.normal_r = 'POS_X'
+            bake.normal_g = 'POS_Y'
+            bake.normal_b = 'POS_Z'
+        else:
+            bake.normal_r = props.normal_map_red_channel
+            bake.normal_g = props.normal_map_green_channel
+            bake.normal_b = props.normal_map_blue_channel
+
+    apply_color_management(scene, props)
+
+
+def apply_color_management(scene, props):
+    """
+    Apply the display device, view transform, look, exposure, gamma and
+    sequencer color space of the add-on to the scene.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        props: Property group containing Sequenced Bake settings.
+    """
+    scene.display_settings.display_device = props.display_device
+    scene.view_settings.view_transform = props.view_transform
+    scene.view_settings.look = props.look
+    scene.view_settings.exposure = props.exposure
+    scene.view_settings.gamma = props.gamma
+
+    try:
+        scene.sequencer_colorspace_settings.name = props.sequencer
+    except Exception:
+        pass
+
+
+def build_bake_kwargs(bake_type, props):
+    """
+    Build the bpy.ops.object.bake keyword arguments for a bake type.
+
+    Args:
+        bake_type (str): The bake pass type.
+        props: Property group containing Sequenced Bake settings.
+
+    Returns:
+        dict: Keyword arguments for bpy.ops.object.bake.
+    """
+    cage_name = (
+        props.selected_to_active_cage_object.name
+        if props.selected_to_active_cage and props.selected_to_active_cage_object
+        else ""
+    )
+
+    return dict(
+        type=("EMIT" if bake_type in {"METALLIC", "OCCLUSION"} else bake_type),
+        use_selected_to_active=props.sequenced_selected_to_active,
+        cage_extrusion=props.selected_to_active_extrusion,
+        max_ray_distance=props.selected_to_active_max_ray_distance,
+        cage_object=cage_name,
+    )
+
+
+def get_packed_scalar_types(bake_types, props, material):
+    """
+    Select the scalar passes of a material that share one packed bake.
+
+    Packed passes must share the same output resolution. The layout matches
+    ORM (R = occlusion, G = metallic, B = roughness), so when ORM is enabled
+    it carries Metallic and Roughness for free.
+
+    Args:
+        bake_types (Iterable[str]): Bake types queued for the material.
+        props: Property group containing Sequenced Bake settings.
+        material (bpy.types.Material): Material being baked.
+
+    Returns:
+        list[str]: Packed bake types, empty if fewer than two can be packed.
+    """
+    if not props.use_packed_scalar_bake:
+        return []
+
+    packable = [t for t in PACKED_SCALAR_CHANNELS if t in set(bake_types)]
+    if len(packable) < 2:
+        return []
+
+    carrier = packable[0]
+    size = resolve_bake_resolution(carrier, props, material)
+    packed = [t for t in packable if resolve_bake_resolution(t, props, material) == size]
+
+    return packed if len(packed) >= 2 else []
+
+
+def bake_packed_scalars(bake_types, props, frame, obj, mat, image_node, image, output_root, denoise_stats=None,
+                        preview_samples=None, margin_index=None):
+    """
+    Bake several scalar passes with one Emission bake and split the channels.
+
+    The material must already be rerouted with connect_occlusion_node. The
+    packed result is baked once with the carrier pass settings (ORM when
+    present, otherwise Metallic) and each channel is written to the output
+    directory of its own bake type.
+
+    Args:
+        bake_types (list[str]): Packed bake types (see get_packed_scalar_types).
+        props: Property group containing Sequenced Bake settings.
+        frame (int): Frame number to bake.
+        obj (bpy.types.Object): Object being baked.
+        mat (bpy.types.Material): Material being baked.
+        image_node (bpy.types.Node): Active Image Texture node used for baking.
+        image (bpy.types.Image): Image datablock receiving the packed result.
+        output_root (str): Root output directory of the bake tier.
+        denoise_stats (dict, optional): Timing statistics of the denoise pipeline.
+        preview_samples (int, optional): Sample cap used by preview bakes.
+        margin_index (tuple[np.ndarray, np.ndarray], optional): Cached margin
+            index; the bake then runs with a margin of 0.
+    """
+    scene = bpy.context.scene
+    scene.frame_set(frame)
+    bpy.context.view_layer.update()
+
+    carrier = bake_types[0]
+    apply_pass_settings(scene, props, carrier)
+    run_bake_pass_with_margin(
+        scene, props, carrier, build_bake_kwargs(carrier, props), image_node, image, mat, denoise_stats,
+        preview_samples, margin_index
+    )
+
+    pixels = get_image_pixels(image)
+
+    for bake_type in bake_types:
+        output_dir = os.path.join(output_root, f"{obj.name}_{mat.name}_{bake_type}")
+        filepath = get_frame_filepath(output_dir, frame, props)
+
+        channel_layout = resolve_channel_layout(bake_type, props)
+
+        encoding = resolve_encoding(bake_type, props)
+        original_encoding = apply_encoding(scene, encoding)
+
+        try:
+            channel = PACKED_SCALAR_CHANNELS[bake_type]
+            if channel is None:
+                save_baked_image(scene, props, image, filepath, channel_layout=channel_layout, encoding=encoding)
+                continue
+
+            channel_pixels = pixels.copy()
+            channel_pixels[:, :, :3] = pixels[:, :, channel:channel + 1]
+
+            save_pixels(
+                channel_pixels,
+                name=f"{obj.name}_{mat.name}_{bake_type}_{frame}",
+                filepath=filepath,
+                alpha=props.sequence_is_alpha,
+                colorspace="Non-Color",
+                channel_layout=channel_layout,
+            )
+        finally:
+            restore_encoding(scene, original_encoding)
+
+    mat.node_tree.nodes.remove(image_node)
+
+    bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+
+
+def bake_frame(bake_type, props, frame, obj, mat, image_node, image, output_dir, sculpt_bounds=None,
+               denoise_stats=None, tiled_size=None, preview_samples=None, margin_index=None, writer=None,
+               pixel_sink=None):
+    """
+    Bake a single frame for a specific bake pass and material.
+
+    This function configures bake settings based on the bake type,
+    updates the scene to the requested frame, performs the bake
+    operation, and saves the resulting image to disk.
+
+    Args:
+        bake_type (str): The bake pass type (e.g. NORMAL, DIFFUSE, METALLIC).
+        props: Property group containing Sequenced Bake settings.
+        frame (int): Frame number to bake.
+        obj (bpy.types.Object): Object being baked.
+        mat (bpy.types.Material): Material being baked.
+        image_node (bpy.types.Node): Active Image Texture node used for baking.
+        image (bpy.types.Image): Image datablock receiving the baked result.
+        output_dir (str): Directory where the baked image will be saved.
+        sculpt_bounds: defines the bounding box area of the sculpted object.
+        denoise_stats (dict, optional): Timing statistics updated by the
+            low-sample + denoise pipeline.
+        tiled_size (tuple[int, int], optional): Full output resolution when
+            baking tile by tile. `image` is then a single tile-sized target.
+        preview_samples (int, optional): Sample cap used by preview bakes.
+        margin_index (tuple[np.ndarray, np.ndarray], optional): Cached margin
+            index; the bake then runs with a margin of 0 and the margin is
+            filled in afterwards. Ignored for tiled bakes.
+        writer (AsyncImageWriter, optional): Background writer. When given,
+            the pixels are copied out and encoded on a worker thread instead
+            of blocking on image.save_render.
+        pixel_sink (callable, optional): Receives the baked (height, width, 4)
+            pixels instead of a file being written. Ignored for tiled bakes.
+    """
+
+    scene = bpy.context.scene
+    scene.frame_set(frame)
+    bpy.context.view_layer.update()
+
+    apply_pass_settings(scene, props, bake_type)
+
+    # Bake sculpt map rather than a shader.
+    if bake_type == "SCULPT":
+        scene.render.bake.use_clear = True
+        scene.render.bake.margin_type = 'EXTEND'
+        bake_sculpt_direct_to_buffer(obj, image, sculpt_bounds)
+
+        # Sculpt maps are saved uncompressed at 16 bits; the scene settings are restored afterwards.
+        settings = scene.render.image_settings
+        original_encoding = {"color_depth": settings.color_depth, "compression": settings.compression}
+        settings.color_depth = '16'
+
+        if settings.file_format == 'PNG':
+            settings.compression = 0
+
+        # Save the result
+        filepath = get_frame_filepath(output_dir, frame, props)
+
+        try:
+            save_render_with_layout(scene, image, filepath)
+        finally:
+            restore_encoding(scene, original_encoding)
+
+    else:
+        bake_kwargs = build_bake_kwargs(bake_type, props)
+
+        filepath = get_frame_filepath(output_dir, frame, props)
+
+        encoding = resolve_encoding(bake_type, props)
+        original_encoding = apply_encoding(scene, encoding)
+
+        try:
+            if tiled_size is not None:
+                bake_tiled(
+                    bake_type=bake_type,
+                    props=props,
+                    obj=obj,
+                    mat=mat,
+                    image_node=image_node,
+                    image=image,
+                    full_size=tiled_size,
+                    filepath=filepath,
+                    bake_kwargs=bake_kwargs,
+                    denoise_stats=denoise_stats,
+                    preview_samples=preview_samples,
+                    channel_layout=resolve_channel_layout(bake_type, props),
+                    encoding=encoding,
+                )
+            else:
+                run_bake_pass_with_margin(
+                    scene, props, bake_type, bake_kwargs, image_node, image, mat, denoise_stats, preview_samples,
+                    margin_index
+                )
+
+                if pixel_sink is not None:
+                    pixel_sink(get_image_pixels(image))
+                else:
+                    save_baked_image(
+                        scene, props, image, filepath, writer, resolve_channel_layout(bake_type, props), encoding
+                    )
+        finally:
+            restore_encoding(scene, original_encoding)
 
     mat.node_tree.nodes.remove(image_node)
 
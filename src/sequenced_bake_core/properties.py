@@ -39,6 +39,28 @@ IMAGE_FORMAT_ITEMS = [
     ("DPX", "DPX", "Save as DPX"),
 ]
 
+CHANNEL_LAYOUT_ITEMS = [
+    ('DEFAULT', "Default", "Follow the Use Alpha and 32-bit Float settings"),
+    ('L', "L", "8-bit grayscale (single-channel half float for EXR)"),
+    ('L16', "L16", "16-bit grayscale (single-channel half float for EXR)"),
+    ('LA', "LA", "Grayscale with alpha (written as RGBA by Save as Render)"),
+    ('RGB', "RGB", "Color without alpha"),
+    ('RGBA', "RGBA", "Color with alpha"),
+]
+
+EXR_CODEC_ITEMS = [
+    ('NONE', "None", "No compression"),
+    ('ZIP', "ZIP", "Lossless, 16 scanlines per block; good for noisy data"),
+    ('ZIPS', "ZIPS", "Lossless, one scanline per block"),
+    ('PIZ', "PIZ", "Lossless wavelet; best for grainy images"),
+    ('PXR24', "Pxr24", "Lossy for 32-bit float (24-bit mantissa), lossless for half"),
+    ('RLE', "RLE", "Lossless run-length; fast, only for flat areas"),
+    ('DWAA', "DWAA", "Lossy DCT, 32 scanlines per block; small color images"),
+    ('DWAB', "DWAB", "Lossy DCT, 256 scanlines per block"),
+    ('B44', "B44", "Lossy fixed-rate for half float; fast playback"),
+    ('B44A', "B44A", "B44 that also compresses flat areas"),
+]
+
 NORMAL_MAP_PRESET_ITEMS = [
     # --- API Conventions ---
     ('OPENGL', "OpenGL", "Standard OpenGL normal map convention (+Y)"),
@@ -54,6 +76,15 @@ NORMAL_MAP_PRESET_ITEMS = [
     ('CUSTOM', "Custom", "Manual configuration"),
 ]
 
+NORMAL_CONVENTION_ITEMS = [
+    ('OPENGL', "OpenGL", "OpenGL normal map convention (+Y)"),
+    ('DIRECTX', "DirectX", "DirectX normal map convention (-Y)"),
+    ('BLENDER', "Blender", "Blender default (OpenGL +Y)"),
+    ('UNITY', "Unity", "Unity default (OpenGL +Y)"),
+    ('UNREAL', "Unreal Engine", "Unreal Engine default (DirectX -Y)"),
+    ('SUBSTANCE', "Substance", "Substance Painter/Designer (OpenGL +Y)"),
+]
+
 NORMAL_MAP_SPACE_ITEMS = [
     ('OBJECT', "Object", "Use object space for the normal map"),
     ('TANGENT', "Tangent", "Use tangent space for the normal map"),
@@ -400,6 +431,127 @@ COLOR_SPACE_ITEMS = [
 ]
 
 
+DENOISE_GUIDE_ITEMS = [
+    ('NONE', "None", "Denoise the baked color only"),
+    ('ALBEDO', "Albedo", "Guide the denoiser with a baked diffuse color pass"),
+    ('ALBEDO_NORMAL', "Albedo + Normal", "Guide the denoiser with baked diffuse color and normal passes"),
+]
+
+DENOISE_PREFILTER_ITEMS = [
+    ('NONE', "None", "No prefiltering, use when guiding passes are noise-free"),
+    ('FAST', "Fast", "Denoise image and guiding passes together"),
+    ('ACCURATE', "Accurate", "Prefilter guiding passes before denoising the image"),
+]
+
+MIP_FILTER_ITEMS = [
+    ('BOX', "Box", "Average each 2x2 block, fastest and softest"),
+    ('KAISER', "Kaiser", "Kaiser-windowed sinc, keeps more detail at lower levels"),
+]
+
+
+class SequencedBakeRenderProfile(PropertyGroup):
+    """
+    Per-bake-type Cycles render profile override.
+
+    When `use_override` is disabled the built-in profile for the bake type
+    (see `processing.RENDER_PROFILE_DEFAULTS`) is used instead.
+    """
+    use_override: bpy.props.BoolProperty(
+        name="Override",
+        description="Use these render settings instead of the built-in profile for this bake type",
+        default=False
+    )
+    samples: bpy.props.IntProperty(
+        name="Samples",
+        description="Number of Cycles samples used while baking this pass",
+        default=128,
+        min=1,
+        max=16777216
+    )
+    max_bounces: bpy.props.IntProperty(
+        name="Max Bounces",
+        description="Total maximum number of light bounces used while baking this pass",
+        default=12,
+        min=0,
+        max=1024
+    )
+    adaptive_threshold: bpy.props.FloatProperty(
+        name="Noise Threshold",
+        description="Adaptive sampling noise threshold. Zero disables adaptive sampling for this pass",
+        default=0.01,
+        min=0.0,
+        max=1.0,
+        precision=4
+    )
+    use_denoising: bpy.props.BoolProperty(
+        name="Denoise",
+        description="Enable denoising for this pass",
+        default=False
+    )
+
+
+class SequencedBakeResolution(PropertyGroup):
+    """
+    Optional output resolution override for a bake type or a material.
+    """
+    use_override: bpy.props.BoolProperty(
+        name="Override Resolution",
+        description="Bake at this resolution instead of the global image size",
+        default=False
+    )
+    width: bpy.props.IntProperty(
+        name="Width",
+        description='The width of the baked image',
+        default=1024,
+        min=1,
+        max=16384
+    )
+    height: bpy.props.IntProperty(
+        name="Height",
+        description='The height of the baked image',
+        default=1024,
+        min=1,
+        max=16384
+    )
+
+
+class SequencedBakeEncoding(PropertyGroup):
+    """
+    Optional file encoding override for a bake type.
+
+    Settings that do not apply to the output format (the EXR options for a
+    PNG sequence and vice versa) are ignored.
+    """
+    use_override: bpy.props.BoolProperty(
+        name="Override Encoding",
+        description="Write this pass with these encoding settings instead of the scene output settings",
+        default=False
+    )
+    exr_codec: bpy.props.EnumProperty(
+        name="EXR Codec",
+        description="OpenEXR compression codec",
+        items=EXR_CODEC_ITEMS,
+        default='ZIP'
+    )
+    exr_depth: bpy.props.EnumProperty(
+        name="EXR Depth",
+        description="OpenEXR sample precision",
+        items=[
+            ('16', "Half", "16-bit half float"),
+            ('32', "Full", "32-bit float"),
+        ],
+        default='16'
+    )
+    png_compression: bpy.props.IntProperty(
+        name="PNG Compression",
+        description="PNG compression level; 0 writes fastest and largest files",
+        default=15,
+        min=0,
+        max=100,
+        subtype='PERCENTAGE'
+    )
+
+
 class SequencedBakeProperties(PropertyGroup):
     # UI Collapse Toggles
     ui_show_image_settings: bpy.props.BoolProperty(
@@ -420,6 +572,18 @@ class SequencedBakeProperties(PropertyGroup):
     ui_show_output: bpy.props.BoolProperty(
         default=True
     )
+    ui_show_render_profiles: bpy.props.BoolProperty(
+        default=False
+    )
+    ui_show_pass_resolution: bpy.props.BoolProperty(
+        default=False
+    )
+    ui_show_channel_layouts: bpy.props.BoolProperty(
+        default=False
+    )
+    ui_show_pass_encoding: bpy.props.BoolProperty(
+        default=False
+    )
 
     sequenced_bake_output_path: bpy.props.StringProperty(
         name="",
@@ -432,14 +596,143 @@ class SequencedBakeProperties(PropertyGroup):
         description='The width of the baked image',
         default=1024,
         min=1,
-        max=8192
+        max=16384
     )
     sequenced_bake_height: bpy.props.IntProperty(
         name="Height",
         description='The height of the baked image',
         default=1024,
         min=1,
-        max=8192
+        max=16384
+    )
+    # Per-pass resolution overrides.
+    resolution_normal: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_roughness: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_glossy: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_emit: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_ao: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_shadow: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_position: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_uv: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_environment: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_diffuse: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_transmission: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_combined: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_metallic: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_occlusion: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    resolution_sculpt: bpy.props.PointerProperty(type=SequencedBakeResolution)
+    # Per-pass file encoding overrides.
+    encoding_normal: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_roughness: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_glossy: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_emit: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_ao: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_shadow: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_position: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_uv: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_environment: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_diffuse: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_transmission: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_combined: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_metallic: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    encoding_occlusion: bpy.props.PointerProperty(type=SequencedBakeEncoding)
+    # Per-pass output channel layouts.
+    channel_layout_normal: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_roughness: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_glossy: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_emit: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_ao: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_shadow: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_position: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_uv: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_environment: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_diffuse: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_transmission: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_combined: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_metallic: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    channel_layout_occlusion: bpy.props.EnumProperty(
+        name="Channels",
+        description="Channel layout of the written files",
+        items=CHANNEL_LAYOUT_ITEMS,
+        default='DEFAULT'
+    )
+    use_tiled_bake: bpy.props.BoolProperty(
+        name="Tiled Bake",
+        description="Bake images larger than the tile size one UV tile at a time and stream the tiles to disk, "
+                    "so memory use is bounded by the tile size instead of the final resolution",
+        default=False
+    )
+    bake_tile_size: bpy.props.IntProperty(
+        name="Tile Size",
+        description="Edge length in pixels of each baked tile",
+        default=2048,
+        min=64,
+        max=16384
     )
     sequenced_bake_image_format: bpy.props.EnumProperty(
         name="",
@@ -527,6 +820,20 @@ class SequencedBakeProperties(PropertyGroup):
         default='OPENGL',
         update=update_normal_map_preset
     )
+    use_normal_conventions: bpy.props.BoolProperty(
+        name="Multiple Conventions",
+        description="Bake the normal map once with +X +Y +Z and derive every selected convention by flipping and "
+                    "swizzling channels, writing each to its own folder (<pass>_DIRECTX). The R, G and B swizzles "
+                    "are ignored and the main normal folder holds the +X +Y +Z map",
+        default=False
+    )
+    normal_conventions: bpy.props.EnumProperty(
+        name="Conventions",
+        description="Normal map conventions written alongside the canonical bake",
+        items=NORMAL_CONVENTION_ITEMS,
+        options={'ENUM_FLAG'},
+        default={'OPENGL', 'DIRECTX'}
+    )
     normal_map_space: bpy.props.EnumProperty(
         name="Space",
         description="Normal map coordinate space",
@@ -629,6 +936,61 @@ class SequencedBakeProperties(PropertyGroup):
         ),
         default=False
     )
+    # Render profiles.
+    use_render_profiles: bpy.props.BoolProperty(
+        name="Per-Pass Render Profiles",
+        description="Apply per-bake-type Cycles samples, bounces, adaptive sampling and denoise settings "
+                    "around each bake and restore the scene settings afterward",
+        default=True
+    )
+    render_profile_normal: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_roughness: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_glossy: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_emit: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_ao: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_shadow: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_position: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_uv: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_environment: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_diffuse: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_transmission: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_combined: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_metallic: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+    render_profile_occlusion: bpy.props.PointerProperty(type=SequencedBakeRenderProfile)
+
+    # Low-sample bake + denoise pipeline.
+    use_denoise_pipeline: bpy.props.BoolProperty(
+        name="Low-Sample + Denoise",
+        description="Bake Combined, Diffuse, Glossy, Shadow and Ambient Occlusion at a low sample count and "
+                    "denoise each baked image with OpenImageDenoise through the compositor",
+        default=False
+    )
+    denoise_samples: bpy.props.IntProperty(
+        name="Bake Samples",
+        description="Cycles samples used for the low-sample bake before denoising",
+        default=16,
+        min=1,
+        max=4096
+    )
+    denoise_guides: bpy.props.EnumProperty(
+        name="Guide Passes",
+        description="Auxiliary passes baked per frame to guide the denoiser",
+        items=DENOISE_GUIDE_ITEMS,
+        default='ALBEDO_NORMAL'
+    )
+    denoise_prefilter: bpy.props.EnumProperty(
+        name="Prefilter",
+        description="Denoise prefilter applied to the guide passes",
+        items=DENOISE_PREFILTER_ITEMS,
+        default='ACCURATE'
+    )
+    denoise_measure_baseline: bpy.props.BoolProperty(
+        name="Measure Baseline",
+        description="Bake the first frame of each denoised pass once at full samples to measure the time saved. "
+                    "When disabled the baseline is extrapolated linearly from the sample counts",
+        default=True
+    )
+
     # Lighting options.
     diffuse_lighting_direct: bpy.props.BoolProperty(
         name="Direct",
@@ -808,10 +1170,234 @@ class SequencedBakeProperties(PropertyGroup):
         items=[
             ('SEQUENCE', "Frame Sequence", "Bake across the full frame range"),
             ('CURRENT', "Current Frame", "Bake only the current frame"),
+            ('ADAPTIVE', "Adaptive Sequence",
+             "Bake the frame range at a coarse stride, bake midpoints only where neighboring results differ "
+             "more than the error threshold and interpolate the remaining frames"),
         ],
         default='SEQUENCE',
     )
 
+    bake_engine: bpy.props.EnumProperty(
+        name="Bake Engine",
+        description="How passes are produced",
+        items=[
+            ('BAKE', "Cycles Bake", "Run one Cycles bake per pass and frame"),
+            ('UV_RENDER', "UV-Space Render",
+             "Flatten the object into UV space and render once per frame with all supported passes enabled. "
+             "Supports Emission, Roughness, Metallic, UV, Position and color-only Diffuse/Glossy/Transmission; "
+             "other passes fall back to the Cycles bake. Textures must not depend on object or generated "
+             "coordinates"),
+        ],
+        default='BAKE',
+    )
+
+    use_shader_interpreter: bpy.props.BoolProperty(
+        name="Evaluate Procedural Scalars",
+        description="Evaluate Roughness and Metallic node graphs in NumPy instead of baking them with Cycles. "
+                    "Supports Value, Math, Map Range, Color Ramp, Mix, Clamp and UV-mapped Image Texture nodes "
+                    "with keyframed inputs; materials using other nodes fall back to the Cycles bake",
+        default=False,
+    )
+
+    resume_bake: bpy.props.BoolProperty(
+        name="Resume",
+        description="Skip tasks that a previous run of this output directory completed. "
+                    "Completed tasks are recorded in a journal with the size and hash of their output files, "
+                    "and only tasks whose files are still intact are skipped",
+        default=False,
+    )
+
+    use_incremental_bake: bpy.props.BoolProperty(
+        name="Incremental",
+        description="Only bake material/pass outputs whose settings, node tree or animation changed since the "
+                    "last bake into this output directory. A fingerprint manifest is kept next to the outputs",
+        default=False,
+    )
+
+    use_static_pass_detection: bpy.props.BoolProperty(
+        name="Detect Static Passes",
+        description="Analyze keyframes, drivers, image sequences, object/shape-key/armature animation and "
+                    "modifiers before baking. Material passes that cannot change over the frame range are "
+                    "baked once and linked (or copied) to every other frame",
+        default=False,
+    )
+
+    use_frame_dedup: bpy.props.BoolProperty(
+        name="Reuse Identical Frames",
+        description="Hash the animated material values and the deformed mesh of every frame before baking. "
+                    "Frames identical to an already baked frame (held poses, stepped keys) get a hardlink or "
+                    "copy of its output instead of a bake",
+        default=False,
+    )
+
+    use_temporal_channel_packing: bpy.props.BoolProperty(
+        name="Temporal Channel Packing",
+        description="Pack four consecutive frames of the Roughness, Metallic, AO, Shadow and Emit passes into "
+                    "the R, G, B and A channels of one image, with a channel_mapping.json describing which "
+                    "frame each channel holds. Cuts file count and size of scalar sequences by 4x",
+        default=False,
+    )
+
+    use_mip_pyramid: bpy.props.BoolProperty(
+        name="Mip Pyramid",
+        description="Downsample every written frame into half, quarter, ... resolution levels saved in sibling "
+                    "folders (<pass>_1024x1024), instead of baking each resolution separately. Color is averaged "
+                    "in linear light and normal maps are renormalized",
+        default=False,
+    )
+
+    mip_levels: bpy.props.IntProperty(
+        name="Levels",
+        description="Number of levels below the baked resolution (2 turns a 2048 bake into 1024 and 512)",
+        default=2,
+        min=1,
+        max=12,
+    )
+
+    mip_filter: bpy.props.EnumProperty(
+        name="Filter",
+        description="Reduction filter used for each level",
+        items=MIP_FILTER_ITEMS,
+        default='BOX',
+    )
+
+    use_bake_manifest: bpy.props.BoolProperty(
+        name="Write Manifest",
+        description="Write bake_manifest.json to the output folder, listing every written file with its frame, "
+                    "pass, material, resolution, size and SHA-256 checksum, so tools such as the Sprite Sheet "
+                    "Creator open files without scanning directories",
+        default=False,
+    )
+
+    use_sharded_output: bpy.props.BoolProperty(
+        name="Shard Output Folders",
+        description="Group the frames of each pass into subfolders of Shard Size frames (e.g. 001000/1234.png) "
+                    "so very long sequences do not put thousands of files in one folder",
+        default=False,
+    )
+
+    shard_size: bpy.props.IntProperty(
+        name="Shard Size",
+        description="Frames per shard subfolder",
+        default=1000,
+        min=10,
+    )
+
+    use_frame_store: bpy.props.BoolProperty(
+        name="Frame Store",
+        description="Append every baked frame to one preallocated, memory-mapped array file per object, "
+                    "material and pass (<object>_<material>_<pass>.seqraw plus a JSON header) instead of "
+                    "writing one image per frame. Use Export Frame Store to write regular images later",
+        default=False,
+    )
+
+    use_tile_delta_store: bpy.props.BoolProperty(
+        name="Tile Delta Store",
+        description="Split every frame into tiles and store only the tiles that changed since the last keyframe "
+                    "(<object>_<material>_<pass>_delta/). Identical tiles are stored once. Cuts disk use and "
+                    "write bandwidth for sequences where only small regions animate",
+        default=False,
+    )
+
+    delta_tile_size: bpy.props.IntProperty(
+        name="Delta Tile Size",
+        description="Edge length in pixels of the tiles compared between frames",
+        default=64,
+        min=8,
+        max=1024,
+    )
+
+    delta_keyframe_interval: bpy.props.IntProperty(
+        name="Keyframe Interval",
+        description="Frames between full keyframes; other frames store the tiles changed since their keyframe",
+        default=24,
+        min=1,
+    )
+
+    frame_store_precision: bpy.props.EnumProperty(
+        name="Store Precision",
+        description="Sample type of the frame store and tile delta store",
+        items=[
+            ('HALF', "Half Float", "16-bit float samples; keeps HDR values and float bakes"),
+            ('BYTE', "8-bit", "8-bit samples clamped to 0-1; half the size of half float"),
+        ],
+        default='HALF',
+    )
+
+    use_direct_write: bpy.props.BoolProperty(
+        name="Direct Writer",
+        description="Write outputs with OpenImageIO instead of Save as Render. Data passes are written raw "
+                    "without color management; color passes get the scene view transform from a 3D LUT "
+                    "sampled once per color-management setup. Requires OpenImageIO",
+        default=False,
+    )
+
+    use_async_write: bpy.props.BoolProperty(
+        name="Write in Background",
+        description="Copy baked pixels out and encode/write the files on background threads so the next bake "
+                    "starts while the previous frame compresses. Uses the direct writer; requires OpenImageIO",
+        default=False,
+    )
+
+    async_write_threads: bpy.props.IntProperty(
+        name="Writer Threads",
+        description="Number of background threads encoding frames",
+        default=2,
+        min=1,
+        max=16,
+    )
+
+    async_write_queue_depth: bpy.props.IntProperty(
+        name="Write Queue",
+        description="Maximum number of frames waiting to be written. Baking pauses while the queue is full, "
+                    "which caps the memory held by pending frames",
+        default=4,
+        min=1,
+        max=64,
+    )
+
+    def update_watch_mode(self, context):
+        from .watch import start_watch, stop_watch
+
+        if self.use_watch_mode:
+            start_watch()
+        else:
+            stop_watch()
+
+    use_watch_mode: bpy.props.BoolProperty(
+        name="Watch Mode",
+        description="Re-bake the current frame of the active object in the background while you edit. "
+                    "Only passes whose input nodes, images, geometry or lighting changed are re-baked, at "
+                    "the preview resolution and sample count, into reused 'SeqBake_Watch' images",
+        default=False,
+        update=update_watch_mode,
+    )
+
+    watch_debounce: bpy.props.FloatProperty(
+        name="Watch Delay",
+        description="Seconds without edits before watch mode re-bakes",
+        default=0.5,
+        min=0.05,
+        max=10.0,
+        unit='TIME_ABSOLUTE',
+    )
+
+    use_cached_margin: bpy.props.BoolProperty(
+        name="Cached Bake Margin",
+        description="Rasterize each material's UV coverage once per bake and fill the bake margin with a "
+                    "cached nearest-texel lookup instead of letting Cycles recompute it for every frame. "
+                    "Behaves like the 'Extend' margin type; other margin types keep the Cycles margin",
+        default=False,
+    )
+
+    use_packed_scalar_bake: bpy.props.BoolProperty(
+        name="Pack Scalar Passes",
+        description="Bake Metallic, Roughness and ORM together as one Emission bake per frame "
+                    "(R = occlusion, G = metallic, B = roughness) and split the channels into their own outputs. "
+                    "Only passes sharing the same resolution are packed",
+        default=False,
+    )
+
     frame_step: bpy.props.IntProperty(
         name="Frame Step",
         description="Step interval between frames when baking a sequence (e.g. 2 = every other frame)",
@@ -820,6 +1406,64 @@ class SequencedBakeProperties(PropertyGroup):
         max=1000,
     )
 
+    # Adaptive temporal sampling.
+    temporal_stride: bpy.props.IntProperty(
+        name="Coarse Stride",
+        description="Distance (in sequence frames) between the frames baked in the first adaptive pass",
+        default=8,
+        min=2,
+        max=1000,
+    )
+
+    temporal_error_metric: bpy.props.EnumProperty(
+        name="Error Metric",
+        description="How neighboring baked frames are compared",
+        items=[
+            ('RMSE', "RMS Error", "Root mean square difference of all pixel channels"),
+            ('MEAN', "Mean Error", "Mean absolute difference of all pixel channels"),
+            ('MAX', "Max Error", "Largest absolute difference of any pixel channel"),
+        ],
+        default='RMSE',
+    )
+
+    temporal_error_threshold: bpy.props.FloatProperty(
+        name="Error Threshold",
+        description="Neighboring frames differing more than this are refined by baking their midpoint; "
+                    "others are interpolated",
+        default=0.01,
+        min=0.0,
+        soft_max=0.25,
+        precision=4,
+    )
+
+    # Preview tier.
+    preview_resolution_scale: bpy.props.FloatProperty(
+        name="Preview Scale",
+        description="Fraction of the final resolution used by the preview bake",
+        default=0.25,
+        min=0.01,
+        max=1.0,
+        subtype='FACTOR'
+    )
+    preview_samples: bpy.props.IntProperty(
+        name="Preview Samples",
+        description="Maximum Cycles samples used by the preview bake",
+        default=4,
+        min=1,
+        max=4096
+    )
+    preview_output_path: bpy.props.StringProperty(
+        name="Preview Path",
+        default="",
+        subtype='DIR_PATH',
+        description="Output path for preview images. If empty, a 'preview' folder inside the output path is used"
+    )
+    preview_then_full: bpy.props.BoolProperty(
+        name="Continue With Full Bake",
+        description="Automatically start the full-resolution bake when the preview bake completes",
+        default=False
+    )
+
     bake_progress: bpy.props.FloatProperty(
         name="Progress",
         description="Overall progress of the sequencing bake operation (0.0 - 1.0)",
@@ -831,7 +1475,7 @@ class SequencedBakeProperties(PropertyGroup):
 
     bake_status: bpy.props.StringProperty(
         name="Status",
-        description="Current bake execution state (Idle, Baking, Completed, Cancelled)",
+        description="Current bake execution state (Idle, Baking, Completed, Cancelled, Failed)",
         default="Idle"
     )
 
@@ -878,6 +1522,12 @@ class SequencedBakeProperties(PropertyGroup):
         default="N/A"
     )
 
+    bake_denoise_report: bpy.props.StringProperty(
+        name="Denoise Report",
+        description="Time saved by the low-sample + denoise pipeline against the full-sample baseline",
+        default=""
+    )
+
     bake_current_type: bpy.props.StringProperty(
         name="Bake Type",
         description="Current bake pass type being executed (e.g. Normal, AO, Roughness)",
@@ -0,0 +1,624 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import math
+import numpy as np
+
+from .processing import (
+    apply_margin_index,
+    get_frame_filepath,
+    get_image_pixels,
+    resolve_channel_layout,
+    resolve_encoding,
+    save_pixels,
+)
+
+# Bake types whose Principled BSDF input can be evaluated in NumPy.
+EVALUATED_BAKE_TYPES = {
+    "ROUGHNESS": "Roughness",
+    "METALLIC": "Metallic",
+}
+
+# Rec.709 luma weights used by Blender for color -> float conversion.
+LUMA_WEIGHTS = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+
+class UnsupportedNodeError(Exception):
+    """
+    Raised when the node graph contains something the evaluator cannot
+    reproduce exactly; the caller falls back to the Cycles bake.
+    """
+
+
+def _srgb_to_linear(rgb):
+    return np.where(
+        rgb <= 0.04045,
+        rgb / 12.92,
+        np.power((np.maximum(rgb, 0.0) + 0.055) / 1.055, 2.4)
+    )
+
+
+# Socket values are (kind, array) pairs. FLOAT arrays have shape () or
+# (height, width); VECTOR arrays end in 3 and COLOR arrays end in 4.
+
+def _to_float(value):
+    kind, array = value
+    if kind == 'FLOAT':
+        return array
+    if kind == 'COLOR':
+        return array[..., :3] @ LUMA_WEIGHTS
+    return array[..., :3].mean(axis=-1)
+
+
+def _to_vector(value):
+    kind, array = value
+    if kind == 'FLOAT':
+        return np.stack([array, array, array], axis=-1)
+    return array[..., :3]
+
+
+def _to_color(value):
+    kind, array = value
+    if kind == 'FLOAT':
+        return np.stack([array, array, array, np.ones_like(array)], axis=-1)
+    if kind == 'VECTOR':
+        return np.concatenate([array, np.ones(array.shape[:-1] + (1,), dtype=np.float32)], axis=-1)
+    return array
+
+
+def _socket_kind(socket):
+    if socket.type == 'RGBA':
+        return 'COLOR'
+    if socket.type == 'VECTOR':
+        return 'VECTOR'
+    if socket.type in {'VALUE', 'INT', 'BOOLEAN'}:
+        return 'FLOAT'
+    raise UnsupportedNodeError(f"socket type {socket.type}")
+
+
+def _safe_divide(a, b):
+    return np.where(b != 0.0, a / np.where(b != 0.0, b, 1.0), 0.0)
+
+
+def _safe_power(a, b):
+    # Blender returns 0 for negative bases with non-integer exponents.
+    valid = (a >= 0.0) | (np.floor(b) == b)
+    return np.where(valid, np.power(np.where(valid, a, 1.0), b), 0.0)
+
+
+def _wrap(value, maximum, minimum):
+    span = maximum - minimum
+    return np.where(span != 0.0, value - span * np.floor(_safe_divide(value - minimum, span)), minimum)
+
+
+def _pingpong(a, b):
+    return np.where(b != 0.0, np.abs(np.mod(a - b, b * 2.0) - b), 0.0)
+
+
+MATH_OPERATIONS = {
+    'ADD': lambda a, b, c: a + b,
+    'SUBTRACT': lambda a, b, c: a - b,
+    'MULTIPLY': lambda a, b, c: a * b,
+    'DIVIDE': lambda a, b, c: _safe_divide(a, b),
+    'MULTIPLY_ADD': lambda a, b, c: a * b + c,
+    'POWER': lambda a, b, c: _safe_power(a, b),
+    'LOGARITHM': lambda a, b, c: np.where((a > 0.0) & (b > 0.0), np.log(np.maximum(a, 1e-30)) / np.log(
+        np.where(b > 0.0, np.where(b != 1.0, b, 2.0), 2.0)), 0.0),
+    'SQRT': lambda a, b, c: np.where(a > 0.0, np.sqrt(np.maximum(a, 0.0)), 0.0),
+    'INVERSE_SQRT': lambda a, b, c: np.where(a > 0.0, 1.0 / np.sqrt(np.maximum(a, 1e-30)), 0.0),
+    'ABSOLUTE': lambda a, b, c: np.abs(a),
+    'EXPONENT': lambda a, b, c: np.exp(a),
+    'MINIMUM': lambda a, b, c: np.minimum(a, b),
+    'MAXIMUM': lambda a, b, c: np.maximum(a, b),
+    'LESS_THAN': lambda a, b, c: (a < b).astype(np.float32),
+    'GREATER_THAN': lambda a, b, c: (a > b).astype(np.float32),
+    'SIGN': lambda a, b, c: np.sign(a),
+    'COMPARE': lambda a, b, c: (np.abs(a - b) <= np.maximum(c, 1e-5)).astype(np.float32),
+    'ROUND': lambda a, b, c: np.floor(a + 0.5),
+    'FLOOR': lambda a, b, c: np.floor(a),
+    'CEIL': lambda a, b, c: np.ceil(a),
+    'TRUNC': lambda a, b, c: np.trunc(a),
+    'FRACT': lambda a, b, c: a - np.floor(a),
+    'MODULO': lambda a, b, c: np.where(b != 0.0, np.fmod(a, np.where(b != 0.0, b, 1.0)), 0.0),
+    'FLOORED_MODULO': lambda a, b, c: np.where(b != 0.0, a - np.floor(_safe_divide(a, b)) * b, 0.0),
+    'WRAP': lambda a, b, c: _wrap(a, b, c),
+    'SNAP': lambda a, b, c: np.floor(_safe_divide(a, b)) * b,
+    'PINGPONG': lambda a, b, c: _pingpong(a, b),
+    'SINE': lambda a, b, c: np.sin(a),
+    'COSINE': lambda a, b, c: np.cos(a),
+    'TANGENT': lambda a, b, c: np.tan(a),
+    'ARCSINE': lambda a, b, c: np.arcsin(np.clip(a, -1.0, 1.0)),
+    'ARCCOSINE': lambda a, b, c: np.arccos(np.clip(a, -1.0, 1.0)),
+    'ARCTANGENT': lambda a, b, c: np.arctan(a),
+    'ARCTAN2': lambda a, b, c: np.arctan2(a, b),
+    'SINH': lambda a, b, c: np.sinh(a),
+    'COSH': lambda a, b, c: np.cosh(a),
+    'TANH': lambda a, b, c: np.tanh(a),
+    'RADIANS': lambda a, b, c: a * (math.pi / 180.0),
+    'DEGREES': lambda a, b, c: a * (180.0 / math.pi),
+}
+
+MIX_BLEND_OPERATIONS = {
+    'MIX': lambda a, b: b,
+    'ADD': lambda a, b: a + b,
+    'SUBTRACT': lambda a, b: a - b,
+    'MULTIPLY': lambda a, b: a * b,
+    'SCREEN': lambda a, b: 1.0 - (1.0 - a) * (1.0 - b),
+    'DIVIDE': lambda a, b: np.where(b != 0.0, a / np.where(b != 0.0, b, 1.0), a),
+    'DIFFERENCE': lambda a, b: np.abs(a - b),
+    'DARKEN': lambda a, b: np.minimum(a, b),
+    'LIGHTEN': lambda a, b: np.maximum(a, b),
+}
+
+
+class ShaderGraphEvaluator:
+    """
+    Vectorized NumPy interpreter for simple scalar shader node graphs.
+
+    Evaluates the node graph feeding a socket at every texel centre of a
+    UV-space grid. Supported nodes: Value, RGB, Reroute, Math, Map Range
+    (float), Color Ramp (RGB linear/constant), Mix (float/vector/color),
+    Clamp, Invert Color, Separate/Combine XYZ, Separate/Combine Color (RGB),
+    UV Map / Texture Coordinate (UV of the baked map) and Image Texture
+    sampled by UV. Keyframed and driven socket values are read from the
+    current frame. Anything else raises UnsupportedNodeError.
+
+    Instance Attributes:
+        width (int): Grid width in texels.
+        height (int): Grid height in texels.
+        uv_name (str): UV map the grid is laid out in.
+        implicit_uv_name (str): UV map used by unconnected texture vectors.
+    """
+
+    def __init__(self, width, height, uv_name, implicit_uv_name):
+        self.width = width
+        self.height = height
+        self.uv_name = uv_name
+        self.implicit_uv_name = implicit_uv_name
+        self._image_cache = {}
+        self._cache = {}
+
+        u = (np.arange(width, dtype=np.float32) + 0.5) / width
+        v = (np.arange(height, dtype=np.float32) + 0.5) / height
+        uu, vv = np.meshgrid(u, v)
+        self._uv = np.stack([uu, vv, np.zeros_like(uu)], axis=-1)
+
+    def evaluate(self, socket):
+        """
+        Evaluate a node socket over the UV grid.
+
+        Args:
+            socket (bpy.types.NodeSocket): Input socket to evaluate.
+
+        Returns:
+            np.ndarray: (height, width) float32 values.
+
+        Raises:
+            UnsupportedNodeError: If the graph cannot be evaluated.
+        """
+        self._cache = {}
+        value = _to_float(self._input(socket))
+        return np.broadcast_to(np.asarray(value, dtype=np.float32), (self.height, self.width)).copy()
+
+    # --- Sockets ---
+
+    def _input(self, socket):
+        if not socket.is_linked:
+            return self._default(socket)
+
+        link = socket.links[0]
+        if link.is_muted or not link.is_valid:
+            return self._default(socket)
+
+        return self._output(link.from_node, link.from_socket)
+
+    def _default(self, socket):
+        kind = _socket_kind(socket)
+        if kind == 'FLOAT':
+            return 'FLOAT', np.float32(socket.default_value)
+        return kind, np.array(socket.default_value[:], dtype=np.float32)
+
+    def _output(self, node, socket):
+        key = (node.name, socket.identifier)
+        if key not in self._cache:
+            if node.mute:
+                raise UnsupportedNodeError(f"muted node '{node.name}'")
+
+            handler = getattr(self, f"_node_{node.type.lower()}", None)
+            if handler is None:
+                raise UnsupportedNodeError(f"node '{node.name}' ({node.bl_idname})")
+
+            self._cache[key] = handler(node, socket)
+
+        return self._cache[key]
+
+    # --- Nodes ---
+
+    def _node_value(self, node, socket):
+        return 'FLOAT', np.float32(node.outputs[0].default_value)
+
+    def _node_rgb(self, node, socket):
+        return 'COLOR', np.array(node.outputs[0].default_value[:], dtype=np.float32)
+
+    def _node_reroute(self, node, socket):
+        return self._input(node.inputs[0])
+
+    def _node_math(self, node, socket):
+        operation = MATH_OPERATIONS.get(node.operation)
+        if operation is None:
+            raise UnsupportedNodeError(f"math operation {node.operation}")
+
+        a, b, c = (_to_float(self._input(node.inputs[i])) for i in range(3))
+        result = operation(a, b, c).astype(np.float32)
+
+        if node.use_clamp:
+            result = np.clip(result, 0.0, 1.0)
+
+        return 'FLOAT', result
+
+    def _node_map_range(self, node, socket):
+        if node.data_type != 'FLOAT' or socket.identifier != node.outputs[0].identifier:
+            raise UnsupportedNodeError(f"map range data type {node.data_type}")
+
+        value, from_min, from_max, to_min, to_max, steps = (
+            _to_float(self._input(node.inputs[i])) for i in range(6)
+        )
+        factor = _safe_divide(value - from_min, from_max - from_min)
+
+        if node.interpolation_type == 'STEPPED':
+            factor = np.where(steps > 0.0, np.floor(factor * (steps + 1.0)) / np.where(steps > 0.0, steps, 1.0), 0.0)
+        elif node.interpolation_type == 'SMOOTHSTEP':
+            factor = np.clip(factor, 0.0, 1.0)
+            factor = factor * factor * (3.0 - 2.0 * factor)
+        elif node.interpolation_type == 'SMOOTHERSTEP':
+            factor = np.clip(factor, 0.0, 1.0)
+            factor = factor * factor * factor * (factor * (factor * 6.0 - 15.0) + 10.0)
+
+        result = to_min + factor * (to_max - to_min)
+
+        if node.clamp and node.interpolation_type in {'LINEAR', 'STEPPED'}:
+            result = np.clip(result, np.minimum(to_min, to_max), np.maximum(to_min, to_max))
+
+        return 'FLOAT', result.astype(np.float32)
+
+    def _node_valtorgb(self, node, socket):
+        ramp = node.color_ramp
+
+        if ramp.color_mode != 'RGB' or ramp.interpolation not in {'LINEAR', 'CONSTANT'}:
+            raise UnsupportedNodeError(f"color ramp {ramp.color_mode}/{ramp.interpolation}")
+
+        factor = _to_float(self._input(node.inputs['Fac']))
+        elements = sorted(ramp.elements, key=lambda element: element.position)
+        positions = np.array([element.position for element in elements], dtype=np.float32)
+        colors = np.array([element.color[:] for element in elements], dtype=np.float32)
+
+        if ramp.interpolation == 'CONSTANT':
+            index = np.clip(np.searchsorted(positions, factor, side='right') - 1, 0, len(elements) - 1)
+            result = colors[index]
+        else:
+            result = np.stack(
+                [np.interp(factor, positions, colors[:, channel]) for channel in range(4)], axis=-1
+            ).astype(np.float32)
+
+        if socket.identifier == node.outputs['Alpha'].identifier:
+            return 'FLOAT', result[..., 3]
+
+        return 'COLOR', result
+
+    def _node_mix(self, node, socket):
+        factor = _to_float(self._input(node.inputs[0]))
+
+        if node.clamp_factor:
+            factor = np.clip(factor, 0.0, 1.0)
+
+        if node.data_type == 'FLOAT':
+            a = _to_float(self._input(node.inputs[2]))
+            b = _to_float(self._input(node.inputs[3]))
+            return 'FLOAT', (a + (b - a) * factor).astype(np.float32)
+
+        if node.data_type == 'VECTOR':
+            if node.factor_mode != 'UNIFORM':
+                raise UnsupportedNodeError("non-uniform vector mix")
+            a = _to_vector(self._input(node.inputs[4]))
+            b = _to_vector(self._input(node.inputs[5]))
+            return 'VECTOR', (a + (b - a) * np.expand_dims(factor, -1)).astype(np.float32)
+
+        if node.data_type == 'RGBA':
+            a = _to_color(self._input(node.inputs[6]))
+            b = _to_color(self._input(node.inputs[7]))
+            return 'COLOR', self._blend(node.blend_type, factor, a, b, node.clamp_result)
+
+        raise UnsupportedNodeError(f"mix data type {node.data_type}")
+
+    def _node_mix_rgb(self, node, socket):
+        factor = np.clip(_to_float(self._input(node.inputs['Fac'])), 0.0, 1.0)
+        a = _to_color(self._input(node.inputs['Color1']))
+        b = _to_color(self._input(node.inputs['Color2']))
+        return 'COLOR', self._blend(node.blend_type, factor, a, b, node.use_clamp)
+
+    def _blend(self, blend_type, factor, a, b, clamp):
+        operation = MIX_BLEND_OPERATIONS.get(blend_type)
+        if operation is None:
+            raise UnsupportedNodeError(f"mix blend type {blend_type}")
+
+        factor = np.expand_dims(factor, -1)
+        rgb = a[..., :3] + (operation(a[..., :3], b[..., :3]) - a[..., :3]) * factor
+
+        if clamp:
+            rgb = np.clip(rgb, 0.0, 1.0)
+
+        alpha = np.broadcast_to(a[..., 3:], rgb.shape[:-1] + (1,))
+        return np.concatenate([rgb, alpha], axis=-1).astype(np.float32)
+
+    def _node_clamp(self, node, socket):
+        value, minimum, maximum = (_to_float(self._input(node.inputs[i])) for i in range(3))
+
+        if node.clamp_type == 'RANGE':
+            minimum, maximum = np.minimum(minimum, maximum), np.maximum(minimum, maximum)
+
+        return 'FLOAT', np.clip(value, minimum, maximum).astype(np.float32)
+
+    def _node_invert(self, node, socket):
+        factor = np.expand_dims(_to_float(self._input(node.inputs['Fac'])), -1)
+        color = _to_color(self._input(node.inputs['Color']))
+        rgb = color[..., :3] + ((1.0 - color[..., :3]) - color[..., :3]) * factor
+        alpha = np.broadcast_to(color[..., 3:], rgb.shape[:-1] + (1,))
+        return 'COLOR', np.concatenate([rgb, alpha], axis=-1).astype(np.float32)
+
+    def _node_sepxyz(self, node, socket):
+        vector = _to_vector(self._input(node.inputs[0]))
+        index = [output.identifier for output in node.outputs].index(socket.identifier)
+        return 'FLOAT', vector[..., index]
+
+    def _node_combxyz(self, node, socket):
+        x, y, z = (_to_float(self._input(node.inputs[i])) for i in range(3))
+        x, y, z = np.broadcast_arrays(x, y, z)
+        return 'VECTOR', np.stack([x, y, z], axis=-1).astype(np.float32)
+
+    def _node_separate_color(self, node, socket):
+        if node.mode != 'RGB':
+            raise UnsupportedNodeError(f"separate color mode {node.mode}")
+
+        color = _to_color(self._input(node.inputs[0]))
+        index = [output.identifier for output in node.outputs].index(socket.identifier)
+        return 'FLOAT', color[..., index]
+
+    def _node_combine_color(self, node, socket):
+        if node.mode != 'RGB':
+            raise UnsupportedNodeError(f"combine color mode {node.mode}")
+
+        r, g, b = (_to_float(self._input(node.inputs[i])) for i in range(3))
+        r, g, b = np.broadcast_arrays(r, g, b)
+        return 'COLOR', np.stack([r, g, b, np.ones_like(r)], axis=-1).astype(np.float32)
+
+    def _node_uvmap(self, node, socket):
+        if node.from_instancer or (node.uv_map and node.uv_map != self.uv_name):
+            raise UnsupportedNodeError(f"UV map '{node.uv_map}' is not the baked UV map")
+        if not node.uv_map and self.implicit_uv_name != self.uv_name:
+            raise UnsupportedNodeError("render UV map differs from the baked UV map")
+
+        return 'VECTOR', self._uv
+
+    def _node_tex_coord(self, node, socket):
+        if socket.identifier != node.outputs['UV'].identifier:
+            raise UnsupportedNodeError(f"texture coordinate output '{socket.name}'")
+        if self.implicit_uv_name != self.uv_name:
+            raise UnsupportedNodeError("render UV map differs from the baked UV map")
+
+        return 'VECTOR', self._uv
+
+    def _node_tex_image(self, node, socket):
+        image = node.image
+
+        if image is None:
+            return ('FLOAT', np.float32(0.0)) if socket.name == 'Alpha' else ('COLOR', np.zeros(4, np.float32))
+
+        if image.source not in {'FILE', 'GENERATED'} or node.projection != 'FLAT':
+            raise UnsupportedNodeError(f"image texture '{image.name}' ({image.source}, {node.projection})")
+
+        if node.interpolation not in {'Closest', 'Linear'}:
+            raise UnsupportedNodeError(f"image interpolation {node.interpolation}")
+
+        if node.inputs['Vector'].is_linked:
+            uv = _to_vector(self._input(node.inputs['Vector']))
+        elif self.implicit_uv_name == self.uv_name:
+            uv = self._uv
+        else:
+            raise UnsupportedNodeError("render UV map differs from the baked UV map")
+
+        texels = self._image_pixels(image)
+        color = self._sample(texels, uv, node.interpolation, node.extension)
+
+        if socket.name == 'Alpha':
+            return 'FLOAT', color[..., 3]
+
+        return 'COLOR', color
+
+    def _image_pixels(self, image):
+        key = (image.name, tuple(image.size), image.colorspace_settings.name)
+
+        if key not in self._image_cache:
+            colorspace = image.colorspace_settings.name
+
+            if colorspace not in {'sRGB', 'Non-Color', 'Linear Rec.709'}:
+                raise UnsupportedNodeError(f"image color space {colorspace}")
+
+            pixels = get_image_pixels(image)
+
+            if colorspace == 'sRGB' and not image.is_float:
+                pixels[..., :3] = _srgb_to_linear(pixels[..., :3])
+
+            self._image_cache[key] = pixels
+
+        return self._image_cache[key]
+
+    def _sample(self, texels, uv, interpolation, extension):
+        height, width = texels.shape[:2]
+        uv = np.broadcast_to(uv, (self.height, self.width, 3))
+        x = uv[..., 0] * width
+        y = uv[..., 1] * height
+
+        def address(index, size):
+            if extension == 'REPEAT':
+                return np.mod(index, size), None
+            if extension == 'MIRROR':
+                period = np.mod(index, 2 * size)
+                return np.where(period < size, period, 2 * size - 1 - period), None
+            inside = (index >= 0) & (index < size)
+            return np.clip(index, 0, size - 1), (inside if extension == 'CLIP' else None)
+
+        if interpolation == 'Closest':
+            ix, inside_x = address(np.floor(x).astype(np.int64), width)
+            iy, inside_y = address(np.floor(y).astype(np.int64), height)
+            result = texels[iy, ix]
+            for inside in (inside_x, inside_y):
+                if inside is not None:
+                    result = result * inside[..., None]
+            return result
+
+        x = x - 0.5
+        y = y - 0.5
+        x0 = np.floor(x)
+        y0 = np.floor(y)
+        fx = (x - x0)[..., None]
+        fy = (y - y0)[..., None]
+        x0 = x0.astype(np.int64)
+        y0 = y0.astype(np.int64)
+
+        result = 0.0
+        for dy, wy in ((0, 1.0 - fy), (1, fy)):
+            for dx, wx in ((0, 1.0 - fx), (1, fx)):
+                ix, inside_x = address(x0 + dx, width)
+                iy, inside_y = address(y0 + dy, height)
+                sample = texels[iy, ix]
+                for inside in (inside_x, inside_y):
+                    if inside is not None:
+                        sample = sample * inside[..., None]
+                result = result + sample * wx * wy
+
+        return result.astype(np.float32)
+
+
+def find_evaluated_socket(material, bake_type):
+    """
+    Find the Principled BSDF input evaluated for a bake type.
+
+    The Principled BSDF must feed the Material Output surface directly,
+    otherwise the Cycles bake would blend several shaders and the graph is
+    treated as unsupported.
+
+    Args:
+        material (bpy.types.Material): Material being baked.
+        bake_type (str): ROUGHNESS or METALLIC.
+
+    Returns:
+        bpy.types.NodeSocket: The Principled BSDF input socket.
+
+    Raises:
+        UnsupportedNodeError: If the material layout is not supported.
+    """
+    if not material.use_nodes or material.node_tree is None:
+        raise UnsupportedNodeError("material has no node tree")
+
+    nodes = material.node_tree.nodes
+    output = next(
+        (n for n in nodes if n.type == 'OUTPUT_MATERIAL' and n.is_active_output),
+        next((n for n in nodes if n.type == 'OUTPUT_MATERIAL'), None)
+    )
+
+    if output is None or not output.inputs['Surface'].is_linked:
+        raise UnsupportedNodeError("material output surface is not connected")
+
+    bsdf = output.inputs['Surface'].links[0].from_node
+
+    if bsdf.type != 'BSDF_PRINCIPLED':
+        raise UnsupportedNodeError(f"surface shader '{bsdf.name}' is not a Principled BSDF")
+
+    return bsdf.inputs[EVALUATED_BAKE_TYPES[bake_type]]
+
+
+def evaluate_scalar_pass(material, bake_type, width, height, uv_name, implicit_uv_name):
+    """
+    Evaluate a scalar bake pass of a material in NumPy.
+
+    Args:
+        material (bpy.types.Material): Material being baked.
+        bake_type (str): ROUGHNESS or METALLIC.
+        width (int): Output width in pixels.
+        height (int): Output height in pixels.
+        uv_name (str): UV map the output is laid out in (the baked UV map).
+        implicit_uv_name (str): UV map used by unconnected texture vectors
+            (the active render UV map).
+
+    Returns:
+        np.ndarray: (height, width) float32 values.
+
+    Raises:
+        UnsupportedNodeError: If the graph cannot be evaluated.
+    """
+    if bake_type not in EVALUATED_BAKE_TYPES:
+        raise UnsupportedNodeError(f"bake type {bake_type}")
+
+    socket = find_evaluated_socket(material, bake_type)
+    evaluator = ShaderGraphEvaluator(width, height, uv_name, implicit_uv_name)
+    return evaluator.evaluate(socket)
+
+
+def bake_evaluated_frame(obj, mat, bake_type, props, frame, width, height, output_dir, coverage, margin_index=None):
+    """
+    Evaluate a scalar pass in NumPy and save it like a Cycles bake would.
+
+    Args:
+        obj (bpy.types.Object): Object being baked.
+        mat (bpy.types.Material): Material being baked.
+        bake_type (str): ROUGHNESS or METALLIC.
+        props (SequencedBakeProperties): Add-on settings.
+        frame (int): Frame number (used for the filename).
+        width (int): Output width in pixels.
+        height (int): Output height in pixels.
+        output_dir (str): Directory the frame is written to.
+        coverage (np.ndarray): (height, width) UV coverage mask of the material.
+        margin_index (tuple[np.ndarray, np.ndarray], optional): Cached margin
+            index of the coverage mask.
+
+    Raises:
+        UnsupportedNodeError: If the graph cannot be evaluated.
+    """
+    uv_layers = obj.data.uv_layers
+
+    if uv_layers.active is None:
+        raise UnsupportedNodeError("object has no UV map")
+
+    render_uv = next((uv for uv in uv_layers if uv.active_render), uv_layers.active)
+    values = evaluate_scalar_pass(mat, bake_type, width, height, uv_layers.active.name, render_uv.name)
+
+    pixels = np.zeros((height, width, 4), dtype=np.float32)
+    pixels[coverage, :3] = values[coverage, None]
+    pixels[:, :, 3] = 1.0
+
+    if margin_index is not None:
+        apply_margin_index(pixels, margin_index)
+
+    save_pixels(
+        pixels,
+        name=f"{obj.name}_{mat.name}_{bake_type}_{frame}",
+        filepath=get_frame_filepath(output_dir, frame, props),
+        alpha=props.sequence_is_alpha,
+        colorspace="Non-Color",
+        channel_layout=resolve_channel_layout(bake_type, props),
+        encoding=resolve_encoding(bake_type, props),
+    )
@@ -0,0 +1,324 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import bpy
+import re
+
+from .fingerprint import (
+    LIGHTING_DEPENDENT_BAKE_TYPES,
+    SCENE_DEPENDENT_BAKE_TYPES,
+    SCENE_DEPENDENT_NODE_TYPES,
+    TIME_DEPENDENT_IMAGE_SOURCES,
+    TIME_DEPENDENT_NODE_TYPES,
+    get_animated_paths,
+)
+
+# Principled BSDF inputs each pass reads. Passes not listed depend on the
+# whole node tree.
+PASS_SOCKETS = {
+    "ROUGHNESS": {"Roughness"},
+    "METALLIC": {"Metallic"},
+    "EMIT": {"Emission Color", "Emission Strength"},
+    "NORMAL": {"Normal", "Coat Normal"},
+    "OCCLUSION": {"Metallic", "Roughness", "Alpha", "Normal"},
+    "UV": set(),
+    "POSITION": set(),
+    "SCULPT": set(),
+}
+
+# Passes whose result changes when the mesh deforms or moves.
+GEOMETRY_DEPENDENT_BAKE_TYPES = {"NORMAL", "POSITION", "OCCLUSION", "SCULPT"} | LIGHTING_DEPENDENT_BAKE_TYPES
+
+# Shader nodes whose output depends on the evaluated geometry or view.
+GEOMETRY_NODE_TYPES = {
+    'NEW_GEOMETRY', 'AMBIENT_OCCLUSION', 'BEVEL', 'OBJECT_INFO', 'ATTRIBUTE', 'VERTEX_COLOR', 'WIREFRAME',
+    'TANGENT', 'LIGHT_PATH', 'CAMERA', 'LAYER_WEIGHT', 'FRESNEL', 'PARTICLE_INFO', 'POINT_INFO', 'HAIR_INFO',
+    'CURVES_INFO', 'VOLUME_INFO', 'NORMAL_MAP', 'BUMP', 'DISPLACEMENT', 'VECTOR_DISPLACEMENT', 'VECT_TRANSFORM',
+}
+
+# Modifiers that simulate or otherwise change the mesh over time by themselves.
+TIME_DEPENDENT_MODIFIERS = {
+    'NODES', 'OCEAN', 'WAVE', 'CLOTH', 'SOFT_BODY', 'FLUID', 'DYNAMIC_PAINT', 'EXPLODE', 'PARTICLE_SYSTEM',
+    'MESH_CACHE', 'MESH_SEQUENCE_CACHE', 'COLLISION',
+}
+
+NODE_PATH_PATTERN = re.compile(r'^nodes\["((?:[^"\\]|\\.)*)"\]')
+INPUT_PATH_PATTERN = re.compile(r'^\.inputs\[(\d+)\]')
+
+
+def _has_animation(id_data):
+    """
+    Check whether an ID datablock has keyframes or drivers.
+    """
+    return bool(id_data is not None and get_animated_paths(id_data))
+
+
+def _is_object_animated(obj, visited=None):
+    """
+    Check whether an object, its parents, constraint targets or deforming
+    objects can move or deform over time.
+    """
+    visited = set() if visited is None else visited
+
+    if obj is None or obj.name in visited:
+        return False
+
+    visited.add(obj.name)
+
+    if _has_animation(obj) or _has_animation(obj.data):
+        return True
+
+    shape_keys = getattr(obj.data, "shape_keys", None)
+    if shape_keys is not None and _has_animation(shape_keys):
+        return True
+
+    if _is_object_animated(obj.parent, visited):
+        return True
+
+    for constraint in obj.constraints:
+        if constraint.enabled and _is_object_animated(getattr(constraint, "target", None), visited):
+            return True
+
+    for modifier in obj.modifiers:
+        if not modifier.show_render:
+            continue
+
+        if modifier.type in TIME_DEPENDENT_MODIFIERS:
+            return True
+
+        for attr in ("object", "target", "auxiliary_target", "start_cap", "end_cap", "offset_object"):
+            if _is_object_animated(getattr(modifier, attr, None), visited):
+                return True
+
+    return False
+
+
+def _upstream_nodes(node_tree, socket_names):
+    """
+    Collect the nodes and linked output sockets feeding a pass.
+
+    Args:
+        node_tree (bpy.types.NodeTree): Material node tree.
+        socket_names (set[str] | None): Principled BSDF inputs the pass
+            reads, or None for the whole tree.
+
+    Returns:
+        tuple[list, list, set] | None: (nodes, from_sockets, root_inputs),
+        where root_inputs holds the (node name, input index) pairs the pass
+        reads directly, or None if the pass layout is not understood and the
+        whole tree must be considered.
+    """
+    if socket_names is None:
+        return None
+
+    output = next(
+        (n for n in node_tree.nodes if n.type == 'OUTPUT_MATERIAL' and n.is_active_output),
+        next((n for n in node_tree.nodes if n.type == 'OUTPUT_MATERIAL'), None)
+    )
+
+    if output is None or not output.inputs['Surface'].is_linked:
+        return [], [], set()
+
+    bsdf = output.inputs['Surface'].links[0].from_node
+    if bsdf.type != 'BSDF_PRINCIPLED':
+        return None
+
+    nodes, sockets = [], []
+    stack = [bsdf.inputs[name] for name in socket_names if name in bsdf.inputs]
+    root_inputs = {
+        (bsdf.name, index) for index, socket in enumerate(bsdf.inputs) if socket.name in socket_names
+    }
+
+    # Displacement changes the shading normal of every pass.
+    if output.inputs['Displacement'].is_linked:
+        stack.append(output.inputs['Displacement'])
+
+    visited = set()
+
+    while stack:
+        socket = stack.pop()
+        for link in socket.links:
+            if link.is_muted:
+                continue
+
+            sockets.append(link.from_socket)
+            node = link.from_node
+
+            if node.name not in visited:
+                visited.add(node.name)
+                nodes.append(node)
+                stack.extend(node.inputs)
+
+    return nodes, sockets, root_inputs
+
+
+def get_pass_input_nodes(node_tree, bake_type):
+    """
+    Collect the nodes of a material node tree that feed a bake pass.
+
+    Args:
+        node_tree (bpy.types.NodeTree): Material node tree.
+        bake_type (str): The bake pass type.
+
+    Returns:
+        tuple[list, list, set] | None: See _upstream_nodes; None when the
+        whole tree feeds the pass.
+    """
+    return _upstream_nodes(node_tree, PASS_SOCKETS.get(bake_type))
+
+
+def _analyze_node_tree(node_tree, socket_names=None, visited=None):
+    """
+    Decide whether the part of a node tree feeding a pass varies over time,
+    with the geometry or with other objects.
+
+    Args:
+        node_tree (bpy.types.NodeTree): Node tree to inspect.
+        socket_names (set[str] | None): Principled BSDF inputs the pass reads.
+        visited (set[str], optional): Node groups already inspected.
+
+    Returns:
+        tuple[bool, bool, bool]: (animated, geometry dependent, scene dependent).
+    """
+    visited = set() if visited is None else visited
+
+    if node_tree is None:
+        return False, False, False
+
+    upstream = _upstream_nodes(node_tree, socket_names)
+    if upstream is None:
+        nodes = list(node_tree.nodes)
+        sockets = [s for n in node_tree.nodes for s in n.outputs if s.is_linked]
+        root_inputs = set()
+    else:
+        nodes, sockets, root_inputs = upstream
+
+    animated = geometry = scene_dependent = False
+    animated_nodes = set()
+
+    for path in get_animated_paths(node_tree):
+        match = NODE_PATH_PATTERN.match(path)
+        if match is None:
+            # Interface or tree-level animation: treat the whole tree as animated.
+            return True, True, True
+
+        node_name = match.group(1).replace('\\"', '"')
+        animated_nodes.add(node_name)
+
+        # Animated values typed directly into the inputs the pass reads.
+        input_match = INPUT_PATH_PATTERN.match(path[match.end():])
+        if input_match and (node_name, int(input_match.group(1))) in root_inputs:
+            animated = True
+
+    for node in nodes:
+        if node.name in animated_nodes or node.type in TIME_DEPENDENT_NODE_TYPES:
+            animated = True
+
+        if node.type in GEOMETRY_NODE_TYPES:
+            geometry = True
+
+        if node.type in SCENE_DEPENDENT_NODE_TYPES:
+            scene_dependent = True
+
+        image = getattr(node, "image", None)
+        if image is not None and image.source in TIME_DEPENDENT_IMAGE_SOURCES:
+            animated = True
+
+        group = getattr(node, "node_tree", None)
+        if group is not None and group.name not in visited:
+            visited.add(group.name)
+            group_animated, group_geometry, group_scene = _analyze_node_tree(group, None, visited)
+            animated |= group_animated
+            geometry |= group_geometry
+            scene_dependent |= group_scene
+
+    # Texture coordinates other than UV follow the evaluated mesh.
+    for socket in sockets:
+        if socket.node.type == 'TEX_COORD' and socket.name != 'UV':
+            geometry = True
+
+    return animated, geometry, scene_dependent
+
+
+def _is_scene_animated(scene, include_world=True):
+    """
+    Check whether anything that lights, shadows or occludes the baked object
+    can change.
+    """
+    world = scene.world
+
+    if include_world and world is not None and (_has_animation(world) or _has_animation(world.node_tree)):
+        return True
+
+    return any(_is_object_animated(obj) for obj in scene.objects if obj.visible_get())
+
+
+def is_pass_static(scene, props, obj, material, bake_type):
+    """
+    Decide whether a (material, pass) output stays the same for every frame.
+
+    Inspects the keyframes and drivers of the material and of the nodes
+    feeding the pass (including node groups), image sequences/movies, object,
+    parent, constraint, shape-key and deforming-object animation, time
+    dependent modifiers and, for lighting dependent passes, the animation of
+    the world and of every visible object. Occlusion and trees feeding the
+    pass from Ambient Occlusion or Bevel nodes see every visible object too.
+
+    Args:
+        scene (bpy.types.Scene): Scene being baked.
+        props (SequencedBakeProperties): Add-on settings.
+        obj (bpy.types.Object): Object being baked.
+        material (bpy.types.Material): Material being baked.
+        bake_type (str): The bake pass type.
+
+    Returns:
+        bool: True if the pass can be baked once and replicated.
+    """
+    geometry_animated = _is_object_animated(obj)
+
+    if props.sequenced_selected_to_active:
+        geometry_animated = geometry_animated or any(
+            _is_object_animated(source) for source in bpy.context.selected_objects if source != obj
+        )
+
+    if bake_type == "UV":
+        # UVs follow deformation; only generated or cached geometry can change them.
+        return not any(
+            modifier.show_render and modifier.type in TIME_DEPENDENT_MODIFIERS for modifier in obj.modifiers
+        )
+
+    if bake_type == "SCULPT" or bake_type == "POSITION":
+        return not geometry_animated
+
+    if _has_animation(material):
+        return False
+
+    tree_animated, tree_geometry, tree_scene = _analyze_node_tree(material.node_tree, PASS_SOCKETS.get(bake_type))
+
+    if tree_animated:
+        return False
+
+    if geometry_animated and (tree_geometry or bake_type in GEOMETRY_DEPENDENT_BAKE_TYPES):
+        return False
+
+    if bake_type in LIGHTING_DEPENDENT_BAKE_TYPES and _is_scene_animated(scene):
+        return False
+
+    if (bake_type in SCENE_DEPENDENT_BAKE_TYPES or tree_scene) and _is_scene_animated(scene, include_world=False):
+        return False
+
+    return True
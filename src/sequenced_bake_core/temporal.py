@@ -0,0 +1,117 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import bpy
+import numpy as np
+
+from .processing import (
+    get_image_pixels,
+    save_pixels,
+)
+
+
+def get_coarse_indices(count, stride):
+    """
+    Pick the frame indices baked in the first adaptive pass.
+
+    Args:
+        count (int): Number of frames in the sequence.
+        stride (int): Distance between coarse frames.
+
+    Returns:
+        list[int]: Indices into the frame list, always including the last one.
+    """
+    indices = list(range(0, count, max(1, stride)))
+
+    if indices[-1] != count - 1:
+        indices.append(count - 1)
+
+    return indices
+
+
+def load_output_pixels(filepath):
+    """
+    Read a written frame as raw (non color managed) pixel values.
+
+    Args:
+        filepath (str): Output file to read.
+
+    Returns:
+        np.ndarray: (height, width, 4) float32 pixels (row 0 at the bottom).
+    """
+    image = bpy.data.images.load(filepath, check_existing=False)
+
+    try:
+        image.colorspace_settings.name = "Non-Color"
+        return get_image_pixels(image)
+    finally:
+        bpy.data.images.remove(image)
+
+
+def measure_difference(a, b, metric):
+    """
+    Compare two frames of a pass.
+
+    Args:
+        a (np.ndarray): First frame pixels.
+        b (np.ndarray): Second frame pixels.
+        metric (str): 'RMSE', 'MEAN' (mean absolute) or 'MAX' (maximum absolute).
+
+    Returns:
+        float: Difference between the frames (0 for identical frames).
+    """
+    if a.shape != b.shape:
+        return float("inf")
+
+    difference = np.abs(a - b)
+
+    if metric == 'MAX':
+        return float(difference.max())
+
+    if metric == 'MEAN':
+        return float(difference.mean())
+
+    return float(np.sqrt(np.mean(difference * difference)))
+
+
+def write_interpolated_frames(start_pixels, end_pixels, filepaths, name, alpha, channel_layout='DEFAULT'):
+    """
+    Write linearly interpolated frames between two baked neighbors.
+
+    Pixel values are blended as stored in the files and written without
+    color management, so display-encoded outputs stay display-encoded.
+
+    Args:
+        start_pixels (np.ndarray): Pixels of the earlier baked frame.
+        end_pixels (np.ndarray): Pixels of the later baked frame.
+        filepaths (list[str]): Output paths of the in-between frames, in order.
+        name (str): Name prefix of the temporary image datablocks.
+        alpha (bool): Whether outputs have an alpha channel.
+        channel_layout (str): Output channel layout of the pass.
+    """
+    steps = len(filepaths) + 1
+
+    for offset, filepath in enumerate(filepaths, start=1):
+        t = offset / steps
+        save_pixels(
+            start_pixels * (1.0 - t) + end_pixels * t,
+            name=f"{name}_{offset}",
+            filepath=filepath,
+            alpha=alpha,
+            colorspace="Non-Color",
+            channel_layout=channel_layout,
+        )
@@ -0,0 +1,198 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import json
+import os
+
+import numpy as np
+
+from .processing import (
+    convert_channel_layout,
+    save_pixels,
+)
+
+# Scalar passes that can be packed four frames per image.
+TEMPORAL_PACK_BAKE_TYPES = {"ROUGHNESS", "METALLIC", "AO", "SHADOW", "EMIT"}
+
+# Channels receiving consecutive frames, in order.
+PACK_CHANNELS = ("R", "G", "B", "A")
+
+# Frame to file/channel mapping written next to the packed images.
+PACK_MAPPING_FILENAME = "channel_mapping.json"
+
+
+def get_packed_output_dir(output_root, obj, mat, bake_type):
+    """
+    Build the output directory of a temporally packed pass.
+    """
+    return os.path.join(output_root, f"{obj.name}_{mat.name}_{bake_type}_packed")
+
+
+def get_frame_groups(frames):
+    """
+    Split the frame list into groups of consecutive frames sharing one image.
+
+    Args:
+        frames (list[int]): Frames of the bake, in order.
+
+    Returns:
+        list[list[int]]: Groups of up to four frames.
+    """
+    size = len(PACK_CHANNELS)
+    return [frames[i:i + size] for i in range(0, len(frames), size)]
+
+
+def get_packed_frames(output_dir):
+    """
+    List the frames held by the packed images of a pass.
+
+    Args:
+        output_dir (str): Packed output directory.
+
+    Returns:
+        set[int]: Frames listed in the channel mapping whose image exists.
+    """
+    path = os.path.join(output_dir, PACK_MAPPING_FILENAME)
+
+    if not os.path.exists(path):
+        return set()
+
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            mapping = json.load(handle)
+
+        return {
+            int(frame) for frame, entry in mapping["frames"].items()
+            if os.path.exists(os.path.join(output_dir, entry["file"]))
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return set()
+
+
+def update_channel_mapping(output_dir, filename, group):
+    """
+    Record which frame each channel of a packed image holds.
+
+    Args:
+        output_dir (str): Packed output directory.
+        filename (str): Packed image file name.
+        group (dict[str, int]): Frame per channel name.
+    """
+    path = os.path.join(output_dir, PACK_MAPPING_FILENAME)
+    mapping = {"channels": list(PACK_CHANNELS), "files": {}, "frames": {}}
+
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                mapping.update(json.load(handle))
+        except (OSError, ValueError):
+            pass
+
+    mapping["files"][filename] = group
+
+    for channel, frame in group.items():
+        mapping["frames"][str(frame)] = {"file": filename, "channel": channel}
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(mapping, handle, indent=2, sort_keys=True)
+
+    os.replace(temp_path, path)
+
+
+class TemporalChannelPacker:
+    """
+    Accumulates consecutive frames of scalar passes into the R, G, B and A
+    channels of one image.
+
+    Each pass keeps at most one partially filled group in memory. A group is
+    written as soon as all of its frames arrived; incomplete groups (the end
+    of the range, or a cancelled bake) are written when the next group
+    starts or on flush. Resumed and incremental bakes skip whole groups
+    only, so a rewritten image never loses frames.
+    """
+
+    def __init__(self, frames, image_format):
+        """
+        Args:
+            frames (list[int]): Frames of the bake, in order.
+            image_format (str): Extension of the packed images.
+        """
+        self._groups = {frame: tuple(group) for group in get_frame_groups(frames) for frame in group}
+        self._image_format = image_format
+        self._pending = {}
+
+    def add(self, output_dir, frame, pixels, name):
+        """
+        Add the baked pixels of one frame.
+
+        Args:
+            output_dir (str): Packed output directory of the pass.
+            frame (int): Frame number.
+            pixels (np.ndarray): (height, width, 4) baked pixels.
+            name (str): Name prefix of the temporary image datablock.
+        """
+        group = self._groups[frame]
+        pending = self._pending.get(output_dir)
+
+        if pending is not None and pending[0] != group:
+            self._write(output_dir)
+            pending = None
+
+        if pending is None:
+            pending = self._pending[output_dir] = (group, {}, name)
+
+        pending[1][frame] = convert_channel_layout(pixels, "L", False)[:, :, 0]
+
+        if len(pending[1]) == len(group):
+            self._write(output_dir)
+
+    def flush(self):
+        """
+        Write every partially filled group.
+        """
+        for output_dir in list(self._pending):
+            self._write(output_dir)
+
+    def _write(self, output_dir):
+        """
+        Write the pending group of a pass and update its channel mapping.
+        """
+        group, scalars, name = self._pending.pop(output_dir)
+
+        height, width = next(iter(scalars.values())).shape
+        packed = np.zeros((height, width, len(PACK_CHANNELS)), dtype=np.float32)
+        channels = {}
+
+        for index, frame in enumerate(group):
+            if frame in scalars:
+                packed[:, :, index] = scalars[frame]
+                channels[PACK_CHANNELS[index]] = frame
+
+        filename = f"{group[0]}-{group[-1]}.{self._image_format}"
+        os.makedirs(output_dir, exist_ok=True)
+
+        save_pixels(
+            packed,
+            name=f"{name}_{group[0]}",
+            filepath=os.path.join(output_dir, filename),
+            alpha=True,
+            colorspace="Non-Color",
+            channel_layout="RGBA",
+        )
+
+        update_channel_mapping(output_dir, filename, channels)
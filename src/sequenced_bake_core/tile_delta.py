@@ -0,0 +1,444 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from .frame_store import (
+    FRAME_STORE_DTYPES,
+    export_frames,
+    quantize_pixels,
+    to_rgba_float,
+)
+from .processing import convert_channel_layout
+
+# Index of a delta store: a JSON header line followed by one line per frame.
+DELTA_INDEX_FILENAME = "index.seqdelta"
+
+# Append-only tile data, addressed by byte offset.
+DELTA_DATA_FILENAME = "tiles.bin"
+
+DELTA_STORE_VERSION = 1
+
+
+def get_delta_store_dir(output_root, obj, mat, bake_type):
+    """
+    Build the directory of a (object, material, pass) tile delta store.
+    """
+    return os.path.join(output_root, f"{obj.name}_{mat.name}_{bake_type}_delta")
+
+
+def get_delta_tiles(width, height, tile_size):
+    """
+    Split a frame into tiles, clipped to the frame.
+
+    Args:
+        width (int): Frame width in pixels.
+        height (int): Frame height in pixels.
+        tile_size (int): Tile edge length in pixels.
+
+    Returns:
+        list[tuple[int, int, int, int]]: (x, y, width, height) of each tile,
+        row by row from pixel row 0.
+    """
+    return [
+        (x, y, min(tile_size, width - x), min(tile_size, height - y))
+        for y in range(0, height, tile_size)
+        for x in range(0, width, tile_size)
+    ]
+
+
+def hash_tile(tile):
+    """
+    Hash the stored samples of one tile.
+    """
+    return hashlib.blake2b(np.ascontiguousarray(tile).tobytes(), digest_size=16).hexdigest()
+
+
+def _read_index(directory):
+    """
+    Read the header and frame records of a delta store.
+
+    Returns:
+        tuple[dict, list[dict]]: (header, frame records in write order).
+    """
+    records = []
+
+    with open(os.path.join(directory, DELTA_INDEX_FILENAME), "r", encoding="utf-8") as handle:
+        header = json.loads(handle.readline())
+
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Truncated line of an interrupted bake.
+                continue
+
+            records.append(record)
+
+    return header, records
+
+
+def get_delta_store_frames(directory, height, width, precision, tile_size):
+    """
+    List the frames an earlier bake wrote into a delta store that
+    TileDeltaWriter would reopen for the given bake.
+
+    Args:
+        directory (str): Delta store directory.
+        height (int): Frame height in pixels.
+        width (int): Frame width in pixels.
+        precision (str): Key of FRAME_STORE_DTYPES.
+        tile_size (int): Tile edge length in pixels.
+
+    Returns:
+        set[int]: Stored frames; empty if the store is missing or would be
+        replaced.
+    """
+    if not os.path.exists(os.path.join(directory, DELTA_INDEX_FILENAME)):
+        return set()
+
+    try:
+        header, records = _read_index(directory)
+
+        if (header["height"], header["width"], header["dtype"], header["tile_size"]) != (
+                height, width, FRAME_STORE_DTYPES[precision], tile_size):
+            return set()
+
+        return {int(record["frame"]) for record in records}
+    except (OSError, ValueError, KeyError, TypeError):
+        return set()
+
+
+class TileDeltaStore:
+    """
+    Writer of one sparse tile delta store.
+
+    Every frame is split into fixed tiles whose stored samples are hashed.
+    Keyframes reference all of their tiles; other frames reference only the
+    tiles that differ from their keyframe. Tile data is content addressed,
+    so a tile that reappears (a blinking panel switching back on) is stored
+    once.
+    """
+
+    def __init__(self, directory, header, records):
+        self.directory = directory
+        self.header = header
+        self._offsets = {}
+        self._keyframe = None
+        self._data_size = 0
+        self._next_id = max((record["id"] for record in records), default=-1) + 1
+
+        data_path = os.path.join(directory, DELTA_DATA_FILENAME)
+        if os.path.exists(data_path):
+            self._data_size = os.path.getsize(data_path)
+
+        for record in records:
+            for digest, offset in record.get("blobs", {}).items():
+                if offset < self._data_size:
+                    self._offsets[digest] = offset
+
+    @classmethod
+    def open_or_create(cls, directory, height, width, channels, dtype, tile_size, colorspace, channel_layout):
+        """
+        Reopen a matching store left by an earlier bake, or start a new one.
+
+        Returns:
+            TileDeltaStore: Writable store.
+        """
+        header = {
+            "version": DELTA_STORE_VERSION,
+            "height": height,
+            "width": width,
+            "channels": channels,
+            "dtype": dtype,
+            "tile_size": tile_size,
+            "colorspace": colorspace,
+            "channel_layout": channel_layout,
+        }
+
+        index_path = os.path.join(directory, DELTA_INDEX_FILENAME)
+
+        if os.path.exists(index_path):
+            try:
+                existing, records = _read_index(directory)
+                if existing == header:
+                    # Terminate a line cut off by an interrupted bake.
+                    with open(index_path, "rb+") as handle:
+                        handle.seek(-1, os.SEEK_END)
+                        if handle.read(1) != b"\n":
+                            handle.write(b"\n")
+
+                    return cls(directory, header, records)
+            except (OSError, ValueError, KeyError):
+                pass
+
+        os.makedirs(directory, exist_ok=True)
+
+        for filename in (DELTA_INDEX_FILENAME, DELTA_DATA_FILENAME):
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                os.remove(path)
+
+        with open(index_path, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(header) + "\n")
+
+        return cls(directory, header, [])
+
+    def write(self, frame, pixels, keyframe):
+        """
+        Store a frame.
+
+        Args:
+            frame (int): Frame number.
+            pixels (np.ndarray): (height, width, channels) float pixels.
+            keyframe (bool): Reference every tile instead of the changed ones.
+                Forced when no keyframe was written in this session.
+
+        Returns:
+            int: Number of tiles referenced by the frame.
+        """
+        samples = quantize_pixels(pixels, self.header["dtype"])
+        grid = get_delta_tiles(self.header["width"], self.header["height"], self.header["tile_size"])
+        hashes = [hash_tile(samples[y:y + h, x:x + w]) for x, y, w, h in grid]
+
+        keyframe = keyframe or self._keyframe is None
+
+        if keyframe:
+            changed = range(len(grid))
+        else:
+            key_hashes = self._keyframe[1]
+            changed = [index for index, digest in enumerate(hashes) if digest != key_hashes[index]]
+
+        blobs = {}
+
+        with open(os.path.join(self.directory, DELTA_DATA_FILENAME), "ab") as handle:
+            for index in changed:
+                digest = hashes[index]
+                if digest in self._offsets or digest in blobs:
+                    continue
+
+                x, y, w, h = grid[index]
+                data = np.ascontiguousarray(samples[y:y + h, x:x + w]).tobytes()
+
+                blobs[digest] = self._data_size
+                handle.write(data)
+                self._data_size += len(data)
+
+        self._offsets.update(blobs)
+
+        # Deltas point at the id of their keyframe record, which never changes
+        # even if the keyframe's frame is re-baked later.
+        record_id = self._next_id
+        self._next_id += 1
+
+        record = {
+            "id": record_id,
+            "frame": frame,
+            "keyframe": record_id if keyframe else self._keyframe[0],
+            "tiles": [[index, self._offsets[hashes[index]]] for index in changed],
+            "blobs": blobs,
+        }
+
+        # Data first, then the index line referencing it.
+        with open(os.path.join(self.directory, DELTA_INDEX_FILENAME), "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+
+        if keyframe:
+            self._keyframe = (record_id, hashes)
+
+        return len(record["tiles"])
+
+
+class TileDeltaWriter:
+    """
+    Routes baked frames into one tile delta store per pass.
+    """
+
+    def __init__(self, frames, precision, tile_size, keyframe_interval):
+        """
+        Args:
+            frames (list[int]): Frames of the bake, in order.
+            precision (str): Key of FRAME_STORE_DTYPES.
+            tile_size (int): Tile edge length in pixels.
+            keyframe_interval (int): Frames between full keyframes.
+        """
+        self._positions = {frame: index for index, frame in enumerate(frames)}
+        self._dtype = FRAME_STORE_DTYPES[precision]
+        self._tile_size = tile_size
+        self._keyframe_interval = max(1, keyframe_interval)
+        self._stores = {}
+
+    def add(self, directory, frame, pixels, colorspace, alpha, channel_layout='DEFAULT'):
+        """
+        Store the baked pixels of one frame in the delta store of its pass.
+
+        Args:
+            directory (str): Delta store directory of the pass.
+            frame (int): Frame number.
+            pixels (np.ndarray): (height, width, 4) baked pixels.
+            colorspace (str): Color space of the baked image.
+            alpha (bool): Whether the default layout keeps alpha.
+            channel_layout (str): Channel layout of the pass.
+        """
+        pixels = convert_channel_layout(pixels, channel_layout, alpha)
+        height, width, channels = pixels.shape
+
+        store = self._stores.get(directory)
+
+        if store is None or (store.header["height"], store.header["width"]) != (height, width):
+            store = self._stores[directory] = TileDeltaStore.open_or_create(
+                directory, height, width, channels, self._dtype, self._tile_size, colorspace, channel_layout
+            )
+
+        store.write(frame, pixels, self._positions.get(frame, 0) % self._keyframe_interval == 0)
+
+    def close(self):
+        """
+        Forget the open stores; everything is already on disk.
+        """
+        self._stores.clear()
+
+
+class TileDeltaReader:
+    """
+    Reconstructs frames of a tile delta store.
+
+    A frame is its keyframe with the frame's changed tiles pasted over it,
+    so any frame is rebuilt from at most two index records, reading tile
+    data straight from a memory map of the data file. When a frame was
+    stored more than once, the latest record wins.
+    """
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory (str): Delta store directory.
+        """
+        self.directory = directory
+        self.header, self._records = _read_index(directory)
+        self._by_id = {record["id"]: record for record in self._records}
+        self._latest = {record["frame"]: record for record in self._records}
+
+        data_path = os.path.join(directory, DELTA_DATA_FILENAME)
+        self._data = (
+            np.memmap(data_path, dtype=np.uint8, mode='r') if os.path.getsize(data_path) else np.zeros(0, np.uint8)
+        )
+
+        self._grid = get_delta_tiles(self.header["width"], self.header["height"], self.header["tile_size"])
+        self._itemsize = np.dtype(self.header["dtype"]).itemsize
+
+    @property
+    def frames(self):
+        """
+        list[int]: Stored frames, in order.
+        """
+        return sorted(self._latest)
+
+    @property
+    def channels(self):
+        """
+        int: Channels per pixel.
+        """
+        return self.header["channels"]
+
+    @property
+    def colorspace(self):
+        """
+        str: Color space of the stored pixels.
+        """
+        return self.header["colorspace"]
+
+    @property
+    def channel_layout(self):
+        """
+        str: Channel layout the frames were reduced to.
+        """
+        return self.header["channel_layout"]
+
+    def _paste(self, target, record):
+        """
+        Copy the tiles referenced by a record into a frame buffer.
+        """
+        channels = self.header["channels"]
+
+        for index, offset in record["tiles"]:
+            x, y, w, h = self._grid[index]
+            size = w * h * channels * self._itemsize
+            target[y:y + h, x:x + w] = self._data[offset:offset + size].view(self.header["dtype"]).reshape(
+                (h, w, channels)
+            )
+
+    def get(self, frame):
+        """
+        Reconstruct a frame in the stored sample type.
+
+        Args:
+            frame (int): Frame number.
+
+        Returns:
+            np.ndarray: (height, width, channels) samples.
+
+        Raises:
+            KeyError: If the frame (or its keyframe) is not stored.
+        """
+        record = self._latest[frame]
+        pixels = np.empty(
+            (self.header["height"], self.header["width"], self.header["channels"]), dtype=self.header["dtype"]
+        )
+
+        if record["keyframe"] != record["id"]:
+            self._paste(pixels, self._by_id[record["keyframe"]])
+
+        self._paste(pixels, record)
+        return pixels
+
+    def get_float(self, frame):
+        """
+        Reconstruct a frame as (height, width, 4) float32 RGBA pixels.
+        """
+        return to_rgba_float(self.get(frame), self.header["dtype"])
+
+
+def export_tile_delta_store(directory, output_dir=None, image_format=None):
+    """
+    Write the frames of a delta store as individual images, in the same
+    `<object>_<material>_<pass>/<frame>.<ext>` layout a regular bake uses.
+
+    Args:
+        directory (str): Delta store directory.
+        output_dir (str, optional): Target directory. Defaults to the
+            per-frame directory next to the store.
+        image_format (str, optional): File extension. Defaults to the
+            scene's output format.
+
+    Returns:
+        int: Number of frames written.
+    """
+    directory = os.path.normpath(directory)
+
+    if output_dir is None:
+        output_dir = directory[:-len("_delta")] if directory.endswith("_delta") else f"{directory}_frames"
+
+    return export_frames(TileDeltaReader(directory), output_dir, image_format)
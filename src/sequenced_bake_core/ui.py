@@ -20,6 +20,48 @@ from bpy.types import Panel, Node, NodeSocket
 from .properties import SequencedBakeProperties
 
 
+# (bake type toggle, render profile pointer, label) for the Render Profiles section.
+RENDER_PROFILE_UI_ITEMS = [
+    ("sequenced_bake_normal", "render_profile_normal", "Normal"),
+    ("sequenced_bake_roughness", "render_profile_roughness", "Roughness"),
+    ("sequenced_bake_glossy", "render_profile_glossy", "Glossy"),
+    ("sequenced_bake_emission", "render_profile_emit", "Emission"),
+    ("sequenced_bake_ambient_occlusion", "render_profile_ao", "Ambient Occlusion"),
+    ("sequenced_bake_shadow", "render_profile_shadow", "Shadow"),
+    ("sequenced_bake_position", "render_profile_position", "Position"),
+    ("sequenced_bake_uv", "render_profile_uv", "UV"),
+    ("sequenced_bake_environment", "render_profile_environment", "Environment"),
+    ("sequenced_bake_diffuse", "render_profile_diffuse", "Diffuse"),
+    ("sequenced_bake_transmission", "render_profile_transmission", "Transmission"),
+    ("sequenced_bake_combined", "render_profile_combined", "Combined"),
+    ("sequenced_bake_metallic", "render_profile_metallic", "Metallic"),
+    ("sequenced_bake_occlusion", "render_profile_occlusion", "ORM"),
+]
+
+
+# (bake type toggle, resolution pointer, label) for the Per-Pass Resolution section.
+PASS_RESOLUTION_UI_ITEMS = [
+    (enable_attr, profile_attr.replace("render_profile_", "resolution_"), label)
+    for enable_attr, profile_attr, label in RENDER_PROFILE_UI_ITEMS
+] + [
+    ("sequenced_bake_sculpt", "resolution_sculpt", "Sculpt"),
+]
+
+
+# (bake type toggle, channel layout property, label) for the Per-Pass Channels section.
+PASS_CHANNEL_LAYOUT_UI_ITEMS = [
+    (enable_attr, profile_attr.replace("render_profile_", "channel_layout_"), label)
+    for enable_attr, profile_attr, label in RENDER_PROFILE_UI_ITEMS
+]
+
+
+# (bake type toggle, encoding pointer, label) for the Per-Pass Encoding section.
+PASS_ENCODING_UI_ITEMS = [
+    (enable_attr, profile_attr.replace("render_profile_", "encoding_"), label)
+    for enable_attr, profile_attr, label in RENDER_PROFILE_UI_ITEMS
+]
+
+
 def draw_material_manager_ui(layout, context):
     """
     Custom Material Manager UI.
@@ -100,6 +142,16 @@ def draw_material_manager_ui(layout, context):
     # Link data control (always available)
     row.prop(obj, "active_material", text="", icon='LINKED')
 
+    # Per-material bake resolution override
+    if mat is not None and hasattr(mat, "sequenced_bake_resolution"):
+        resolution = mat.sequenced_bake_resolution
+        col.prop(resolution, "use_override", text="Material Resolution Override")
+
+        if resolution.use_override:
+            row = col.row(align=True)
+            row.prop(resolution, "width")
+            row.prop(resolution, "height")
+
 
 class SequencedBakeSocket(NodeSocket):
     """
@@ -152,6 +204,7 @@ def draw_sequenced_bake_ui(layout, props):
     - Selected to Active
     - Image Texture Settings
     - Bake Type Options
+    - Render Profiles
     - Color Management
     - Bake Operator Button
 
@@ -197,6 +250,83 @@ def draw_sequenced_bake_ui(layout, props):
         row.prop(props, "sequenced_bake_width")
         row.prop(props, "sequenced_bake_height")
 
+        pass_box = col.box()
+        pass_header = pass_box.row()
+        pass_header.prop(
+            props,
+            "ui_show_pass_resolution",
+            text="Per-Pass Resolution",
+            emboss=False,
+            icon='TRIA_DOWN' if props.ui_show_pass_resolution else 'TRIA_RIGHT'
+        )
+
+        if props.ui_show_pass_resolution:
+            for enable_attr, resolution_attr, label in PASS_RESOLUTION_UI_ITEMS:
+                if not getattr(props, enable_attr):
+                    continue
+
+                resolution = getattr(props, resolution_attr)
+                pass_box.prop(resolution, "use_override", text=f"{label} Override")
+
+                if resolution.use_override:
+                    row = pass_box.row(align=True)
+                    row.separator(factor=option_padding)
+                    row.prop(resolution, "width")
+                    row.prop(resolution, "height")
+
+        channel_box = col.box()
+        channel_header = channel_box.row()
+        channel_header.prop(
+            props,
+            "ui_show_channel_layouts",
+            text="Per-Pass Channels",
+            emboss=False,
+            icon='TRIA_DOWN' if props.ui_show_channel_layouts else 'TRIA_RIGHT'
+        )
+
+        if props.ui_show_channel_layouts:
+            for enable_attr, layout_attr, label in PASS_CHANNEL_LAYOUT_UI_ITEMS:
+                if getattr(props, enable_attr):
+                    channel_box.prop(props, layout_attr, text=label)
+
+        encoding_box = col.box()
+        encoding_header = encoding_box.row()
+        encoding_header.prop(
+            props,
+            "ui_show_pass_encoding",
+            text="Per-Pass Encoding",
+            emboss=False,
+            icon='TRIA_DOWN' if props.ui_show_pass_encoding else 'TRIA_RIGHT'
+        )
+
+        if props.ui_show_pass_encoding:
+            encoding_box.operator("sequenced_bake.benchmark_encoding", icon='TIME')
+
+            for enable_attr, encoding_attr, label in PASS_ENCODING_UI_ITEMS:
+                if not getattr(props, enable_attr):
+                    continue
+
+                encoding = getattr(props, encoding_attr)
+                encoding_box.prop(encoding, "use_override", text=f"{label} Encoding")
+
+                if encoding.use_override:
+                    row = encoding_box.row(align=True)
+                    row.separator(factor=option_padding)
+
+                    if props.sequenced_bake_image_format == "EXR":
+                        row.prop(encoding, "exr_codec", text="")
+                        row.prop(encoding, "exr_depth", text="")
+                    elif props.sequenced_bake_image_format == "PNG":
+                        row.prop(encoding, "png_compression")
+                    else:
+                        row.label(text="Uses the scene output settings")
+
+        col.prop(props, "use_tiled_bake")
+        if props.use_tiled_bake:
+            row = col.row()
+            row.separator(factor=option_padding)
+            row.prop(props, "bake_tile_size")
+
         col.prop(props, "sequenced_bake_image_format")
         col.prop(props, "sequence_is_alpha")
         col.prop(props, "sequence_use_float")
@@ -262,8 +392,18 @@ def draw_sequenced_bake_ui(layout, props):
             for ch in ["preset", "space", "red_channel", "green_channel", "blue_channel"]:
                 row = col.row()
                 row.separator(factor=option_padding)
+                row.enabled = ch in {"preset", "space"} or not props.use_normal_conventions
                 row.prop(props, f"normal_map_{ch}")
 
+            row = col.row()
+            row.separator(factor=option_padding)
+            row.prop(props, "use_normal_conventions")
+
+            if props.use_normal_conventions:
+                row = col.row()
+                row.separator(factor=option_padding)
+                row.prop(props, "normal_conventions", expand=True)
+
         col.prop(props, "sequenced_bake_roughness")
         col.prop(props, "sequenced_bake_glossy")
         if props.sequenced_bake_glossy:
@@ -312,6 +452,44 @@ def draw_sequenced_bake_ui(layout, props):
 
         col.prop(props, "sequenced_bake_sculpt")
 
+    # Render Profiles
+    box = layout.box()
+    header = box.row()
+    header.prop(
+        props,
+        "ui_show_render_profiles",
+        text="Render Profiles",
+        emboss=False,
+        icon='TRIA_DOWN' if props.ui_show_render_profiles else 'TRIA_RIGHT'
+    )
+    if props.ui_show_render_profiles:
+        col = box.column(align=True)
+        col.prop(props, "use_render_profiles")
+
+        if props.use_render_profiles:
+            for enable_attr, profile_attr, label in RENDER_PROFILE_UI_ITEMS:
+                if not getattr(props, enable_attr):
+                    continue
+
+                profile = getattr(props, profile_attr)
+                row = col.row()
+                row.prop(profile, "use_override", text=f"{label} Override")
+
+                if profile.use_override:
+                    for attr in ["samples", "max_bounces", "adaptive_threshold", "use_denoising"]:
+                        row = col.row()
+                        row.separator(factor=option_padding)
+                        row.prop(profile, attr)
+
+        col.separator()
+        col.prop(props, "use_denoise_pipeline")
+
+        if props.use_denoise_pipeline:
+            for attr in ["denoise_samples", "denoise_guides", "denoise_prefilter", "denoise_measure_baseline"]:
+                row = col.row()
+                row.separator(factor=option_padding)
+                row.prop(props, attr)
+
     # Color Management
     box = layout.box()
     header = box.row()
@@ -346,10 +524,57 @@ def draw_sequenced_bake_ui(layout, props):
         col.label(text="Bake Scope:")
         col.prop(props, "material_mode")
         col.prop(props, "frame_mode")
-
-        if props.frame_mode == 'SEQUENCE':
+        col.prop(props, "bake_engine")
+        col.prop(props, "use_shader_interpreter")
+        col.prop(props, "use_packed_scalar_bake")
+        col.prop(props, "use_cached_margin")
+        col.prop(props, "use_static_pass_detection")
+        col.prop(props, "use_frame_dedup")
+        col.prop(props, "use_temporal_channel_packing")
+        col.prop(props, "use_mip_pyramid")
+
+        if props.use_mip_pyramid:
+            row = col.row(align=True)
+            row.prop(props, "mip_levels")
+            row.prop(props, "mip_filter", text="")
+
+        col.prop(props, "use_bake_manifest")
+        col.prop(props, "use_sharded_output")
+
+        if props.use_sharded_output:
+            row = col.row()
+            row.separator(factor=option_padding)
+            row.prop(props, "shard_size")
+
+        col.prop(props, "use_frame_store")
+        col.prop(props, "use_tile_delta_store")
+
+        if props.use_tile_delta_store:
+            row = col.row(align=True)
+            row.prop(props, "delta_tile_size")
+            row.prop(props, "delta_keyframe_interval")
+
+        if props.use_frame_store or props.use_tile_delta_store:
+            row = col.row(align=True)
+            row.prop(props, "frame_store_precision", text="")
+            row.operator("sequenced_bake.export_frame_store", icon='EXPORT')
+
+        col.prop(props, "use_direct_write")
+        col.prop(props, "use_async_write")
+
+        if props.use_async_write:
+            row = col.row(align=True)
+            row.prop(props, "async_write_threads")
+            row.prop(props, "async_write_queue_depth")
+
+        if props.frame_mode in {'SEQUENCE', 'ADAPTIVE'}:
             col.prop(props, "frame_step")
 
+        if props.frame_mode == 'ADAPTIVE':
+            col.prop(props, "temporal_stride")
+            col.prop(props, "temporal_error_metric")
+            col.prop(props, "temporal_error_threshold")
+
         if props.frame_mode == 'CURRENT':
             col.label(text="Only current frame will be baked", icon='INFO')
         else:
@@ -363,11 +588,30 @@ def draw_sequenced_bake_ui(layout, props):
 
         col.separator(factor=1.0)
 
+        col.prop(props, "resume_bake")
+        col.prop(props, "use_incremental_bake")
         col.operator(
             "sequenced_bake.bake",
             text="Bake Material Sequence",
             icon='RENDER_STILL'
-        )
+        ).tier = 'FULL'
+
+        col.separator()
+
+        col.label(text="Preview Bake:")
+        row = col.row(align=True)
+        row.prop(props, "preview_resolution_scale")
+        row.prop(props, "preview_samples")
+        col.prop(props, "preview_output_path")
+        col.prop(props, "preview_then_full")
+        row = col.row(align=True)
+        row.prop(props, "use_watch_mode", icon='VIEWZOOM')
+        row.prop(props, "watch_debounce")
+        col.operator(
+            "sequenced_bake.bake",
+            text="Preview Bake",
+            icon='HIDE_OFF'
+        ).tier = 'PREVIEW'
 
         col.separator()
 
@@ -399,6 +643,9 @@ def draw_sequenced_bake_ui(layout, props):
         col.label(text="FPS: %.3f" % props.bake_fps)
         col.label(text=f"Time Remaining: {props.bake_estimated_time}")
 
+        if props.bake_denoise_report:
+            col.label(text=props.bake_denoise_report, icon='INFO')
+
 
 class SequencedBakePanel(Panel):
     """
@@ -0,0 +1,557 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import bpy
+import numpy as np
+import os
+
+from .processing import (
+    oiio,
+    apply_color_management,
+    resolve_bake_resolution,
+    resolve_render_profile,
+    extend_margin,
+    get_frame_filepath,
+    resolve_channel_layout,
+    resolve_encoding,
+    save_pixels,
+)
+
+# Task marker used in the operator queue for a UV-space render of one frame.
+UV_RENDER_TASK = "UV_RENDER"
+
+UV_RENDER_TAG = "__SEQBAKE_UV_RENDER__"
+
+# AOV names written by the temporary material nodes.
+AOV_MATERIAL = "seqbake_material"
+AOV_ROUGHNESS = "seqbake_roughness"
+AOV_METALLIC = "seqbake_metallic"
+AOV_POSITION = "seqbake_position"
+
+POSITION_ATTRIBUTE = "seqbake_position"
+
+# Bake type -> (render pass name in the multilayer EXR, channel count, is data).
+UV_RENDER_PASSES = {
+    "EMIT": ("Emit", 3, False),
+    "DIFFUSE": ("DiffCol", 3, False),
+    "GLOSSY": ("GlossCol", 3, False),
+    "TRANSMISSION": ("TransCol", 3, False),
+    "UV": ("UV", 2, True),
+    "POSITION": (AOV_POSITION, 3, True),
+    "ROUGHNESS": (AOV_ROUGHNESS, 1, True),
+    "METALLIC": (AOV_METALLIC, 1, True),
+}
+
+
+def is_uv_render_pass(bake_type, props):
+    """
+    Check whether a bake type can be produced by the UV-space render.
+
+    The flattened mesh no longer sits where it does in the scene, so only
+    passes that do not depend on lighting or on the shading position are
+    supported: emission, color-only diffuse/glossy/transmission, UV,
+    world position and the Roughness/Metallic inputs of the Principled BSDF.
+    Everything else keeps using the Cycles bake.
+
+    Args:
+        bake_type (str): The bake pass type.
+        props: Property group containing Sequenced Bake settings.
+
+    Returns:
+        bool: True if the pass can be split out of the UV-space render.
+    """
+    if bake_type not in UV_RENDER_PASSES:
+        return False
+
+    lighting = {
+        "DIFFUSE": ("diffuse_lighting_direct", "diffuse_lighting_indirect", "diffuse_lighting_color"),
+        "GLOSSY": ("glossy_lighting_direct", "glossy_lighting_indirect", "glossy_lighting_color"),
+        "TRANSMISSION": (
+            "transmission_lighting_direct", "transmission_lighting_indirect", "transmission_lighting_color"
+        ),
+    }
+
+    if bake_type in lighting:
+        direct, indirect, color = lighting[bake_type]
+        return getattr(props, color) and not getattr(props, direct) and not getattr(props, indirect)
+
+    return True
+
+
+def get_uv_render_targets(materials, bake_map, props):
+    """
+    Select the (material, bake type) combinations rendered in UV space.
+
+    Combinations are eligible when the pass is supported and the material
+    bakes at the global resolution, since a single render shares one
+    resolution across all of its outputs. Tiled and selected-to-active
+    bakes keep using the Cycles bake, since the render only sees the
+    active object's own material.
+
+    Args:
+        materials (list[bpy.types.Material]): Materials being baked.
+        bake_map (dict[str, bool]): Enabled state per bake type.
+        props: Property group containing Sequenced Bake settings.
+
+    Returns:
+        list[tuple[bpy.types.Material, str]]: Combinations to render.
+    """
+    if props.bake_engine != 'UV_RENDER' or oiio is None or props.sequenced_selected_to_active:
+        return []
+
+    global_size = (props.sequenced_bake_width, props.sequenced_bake_height)
+
+    if props.use_tiled_bake and max(global_size) > props.bake_tile_size:
+        return []
+
+    targets = []
+
+    for mat in materials:
+        for bake_type, enabled in bake_map.items():
+            if not enabled or not is_uv_render_pass(bake_type, props):
+                continue
+
+            if resolve_bake_resolution(bake_type, props, mat) != global_size:
+                continue
+
+            targets.append((mat, bake_type))
+
+    return targets
+
+
+def create_flatten_node_group(uv_map_name, aspect):
+    """
+    Create a geometry node group that flattens a mesh into UV space.
+
+    The original world-space position is stored as a point attribute, all
+    edges are split so every face corner owns its vertex, and each vertex is
+    moved to its UV coordinate. The object transform is inverted so the
+    flattened mesh lands on the world XY plane in [0, aspect.x] x [0, aspect.y]
+    regardless of where the object is.
+
+    Args:
+        uv_map_name (str): Name of the UV map to flatten along.
+        aspect (tuple[float, float]): World-space extent of the UV square.
+
+    Returns:
+        bpy.types.GeometryNodeTree: The new node group.
+    """
+    group = bpy.data.node_groups.new(UV_RENDER_TAG, 'GeometryNodeTree')
+    group.interface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    group.interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    nodes = group.nodes
+    links = group.links
+
+    group_input = nodes.new('NodeGroupInput')
+    group_output = nodes.new('NodeGroupOutput')
+
+    self_object = nodes.new('GeometryNodeSelfObject')
+    object_info = nodes.new('GeometryNodeObjectInfo')
+    object_info.transform_space = 'ORIGINAL'
+    links.new(self_object.outputs['Self Object'], object_info.inputs['Object'])
+
+    # Store the world-space position before flattening.
+    position = nodes.new('GeometryNodeInputPosition')
+    world_position = nodes.new('FunctionNodeTransformPoint')
+    links.new(position.outputs['Position'], world_position.inputs['Vector'])
+    links.new(object_info.outputs['Transform'], world_position.inputs['Transform'])
+
+    store = nodes.new('GeometryNodeStoreNamedAttribute')
+    store.data_type = 'FLOAT_VECTOR'
+    store.domain = 'POINT'
+    store.inputs['Name'].default_value = POSITION_ATTRIBUTE
+    links.new(group_input.outputs[0], store.inputs['Geometry'])
+    links.new(world_position.outputs['Vector'], store.inputs['Value'])
+
+    # Give every face corner its own vertex so seams can be pulled apart.
+    split = nodes.new('GeometryNodeSplitEdges')
+    links.new(store.outputs['Geometry'], split.inputs['Mesh'])
+
+    uv = nodes.new('GeometryNodeInputNamedAttribute')
+    uv.data_type = 'FLOAT_VECTOR'
+    uv.inputs['Name'].default_value = uv_map_name
+
+    scale = nodes.new('ShaderNodeVectorMath')
+    scale.operation = 'MULTIPLY'
+    scale.inputs[1].default_value = (aspect[0], aspect[1], 0.0)
+    links.new(uv.outputs['Attribute'], scale.inputs[0])
+
+    invert = nodes.new('FunctionNodeInvertMatrix')
+    links.new(object_info.outputs['Transform'], invert.inputs['Matrix'])
+
+    local_position = nodes.new('FunctionNodeTransformPoint')
+    links.new(scale.outputs['Vector'], local_position.inputs['Vector'])
+    links.new(invert.outputs['Matrix'], local_position.inputs['Transform'])
+
+    set_position = nodes.new('GeometryNodeSetPosition')
+    links.new(split.outputs['Mesh'], set_position.inputs['Geometry'])
+    links.new(local_position.outputs['Vector'], set_position.inputs['Position'])
+
+    links.new(set_position.outputs['Geometry'], group_output.inputs[0])
+
+    return group
+
+
+def _link_bsdf_input(nodes, links, bsdf, input_name, target_socket):
+    """
+    Route a Principled BSDF input (linked source or default value) into a socket.
+    """
+    source = bsdf.inputs[input_name]
+
+    if source.is_linked:
+        links.new(source.links[0].from_socket, target_socket)
+    else:
+        target_socket.default_value = source.default_value
+
+
+def add_material_aovs(material, material_index, bake_types):
+    """
+    Add temporary AOV Output nodes to a material.
+
+    Nodes are labelled with UV_RENDER_TAG and removed by remove_material_aovs.
+
+    Args:
+        material (bpy.types.Material): Material to modify.
+        material_index (int): 1-based id written to the material mask AOV.
+        bake_types (set[str]): Bake types rendered for this material.
+    """
+    nodes = material.node_tree.nodes
+    links = material.node_tree.links
+
+    bsdf = next((n for n in nodes if n.type == 'BSDF_PRINCIPLED'), None)
+
+    def new_aov(name):
+        node = nodes.new('ShaderNodeOutputAOV')
+        node.aov_name = name
+        node.label = UV_RENDER_TAG
+        return node
+
+    mask = new_aov(AOV_MATERIAL)
+    mask.inputs['Value'].default_value = float(material_index)
+
+    if "POSITION" in bake_types:
+        attribute = nodes.new('ShaderNodeAttribute')
+        attribute.attribute_type = 'GEOMETRY'
+        attribute.attribute_name = POSITION_ATTRIBUTE
+        attribute.label = UV_RENDER_TAG
+        links.new(attribute.outputs['Vector'], new_aov(AOV_POSITION).inputs['Color'])
+
+    if bsdf is None:
+        return
+
+    if "ROUGHNESS" in bake_types:
+        _link_bsdf_input(nodes, links, bsdf, 'Roughness', new_aov(AOV_ROUGHNESS).inputs['Value'])
+
+    if "METALLIC" in bake_types:
+        _link_bsdf_input(nodes, links, bsdf, 'Metallic', new_aov(AOV_METALLIC).inputs['Value'])
+
+
+def remove_material_aovs(material):
+    """
+    Remove the temporary nodes added by add_material_aovs.
+    """
+    nodes = material.node_tree.nodes
+
+    for node in list(nodes):
+        if node.label == UV_RENDER_TAG:
+            nodes.remove(node)
+
+
+def read_multilayer_passes(filepath):
+    """
+    Read every pass of a multilayer EXR into NumPy arrays.
+
+    Channels named "<layer>.<pass>.<channel>" are grouped by pass name.
+
+    Args:
+        filepath (str): Path of the multilayer EXR.
+
+    Returns:
+        dict[str, np.ndarray]: Pass name -> (height, width, channels) array,
+            rows ordered bottom-up like Blender image pixels.
+
+    Raises:
+        RuntimeError: If the file cannot be read.
+    """
+    image_input = oiio.ImageInput.open(filepath)
+    if image_input is None:
+        raise RuntimeError(f"Failed to open UV render result {filepath}: {oiio.geterror()}")
+
+    try:
+        spec = image_input.spec()
+        pixels = image_input.read_image("float")
+    finally:
+        image_input.close()
+
+    if pixels is None:
+        raise RuntimeError(f"Failed to read UV render result {filepath}")
+
+    pixels = np.asarray(pixels).reshape((spec.height, spec.width, spec.nchannels))[::-1]
+
+    channels_by_pass = {}
+    for index, channel_name in enumerate(spec.channelnames):
+        prefix = channel_name.rsplit(".", 1)[0]
+        pass_name = prefix.split(".", 1)[1] if "." in prefix else prefix
+        channels_by_pass.setdefault(pass_name, []).append(index)
+
+    return {
+        pass_name: pixels[:, :, indices]
+        for pass_name, indices in channels_by_pass.items()
+    }
+
+
+def pass_to_rgba(pass_pixels, channel_count):
+    """
+    Expand a render pass into an RGBA buffer matching the equivalent bake.
+    """
+    height, width = pass_pixels.shape[:2]
+    rgba = np.zeros((height, width, 4), dtype=np.float32)
+    rgba[:, :, 3] = 1.0
+
+    if channel_count == 1:
+        rgba[:, :, :3] = pass_pixels[:, :, :1]
+    else:
+        rgba[:, :, :channel_count] = pass_pixels[:, :, :channel_count]
+
+    return rgba
+
+
+def render_uv_frame(obj, targets, props, frame, width, height, output_root, preview_samples=None):
+    """
+    Render all UV-space passes of one frame and split them into per-pass outputs.
+
+    The object is flattened into UV space with a temporary geometry nodes
+    modifier and rendered once through a temporary orthographic camera with
+    every required render pass and AOV enabled. The multilayer result is
+    split per material (using a material id AOV) and per pass, margin is
+    extended into empty texels, and each output is written to the usual
+    `{obj}_{mat}_{type}/{frame}.{ext}` location with the add-on color
+    management settings, as a Cycles bake of the pass would be.
+
+    Scene, view layer, object visibility and material changes are restored
+    before returning.
+
+    Args:
+        obj (bpy.types.Object): Object being baked.
+        targets (list[tuple[bpy.types.Material, str]]): Outputs to produce.
+        props: Property group containing Sequenced Bake settings.
+        frame (int): Frame to render.
+        width (int): Output width in pixels.
+        height (int): Output height in pixels.
+        output_root (str): Root output directory.
+        preview_samples (int, optional): Sample cap for preview bakes.
+
+    Raises:
+        RuntimeError: If the object has no UV map or the render fails.
+    """
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+    render = scene.render
+
+    uv_layer = obj.data.uv_layers.active
+    if uv_layer is None:
+        raise RuntimeError(f"Object '{obj.name}' has no active UV layer.")
+
+    largest = max(width, height)
+    aspect = (width / largest, height / largest)
+
+    # Samples: the largest profile sample count among the rendered passes.
+    samples = 1
+    for _mat, bake_type in targets:
+        profile = resolve_render_profile(bake_type, props)
+        samples = max(samples, (profile or {}).get("samples") or scene.cycles.samples)
+    if preview_samples is not None:
+        samples = min(samples, preview_samples)
+
+    bake_types_by_material = {}
+    for mat, bake_type in targets:
+        bake_types_by_material.setdefault(mat, set()).add(bake_type)
+
+    filepath = os.path.join(bpy.app.tempdir, f"{UV_RENDER_TAG}{obj.name}_{frame}.exr")
+
+    original = {
+        "camera": scene.camera,
+        "filepath": render.filepath,
+        "format": render.image_settings.file_format,
+        "color_depth": render.image_settings.color_depth,
+        "res_x": render.resolution_x,
+        "res_y": render.resolution_y,
+        "percent": render.resolution_percentage,
+        "film_transparent": render.film_transparent,
+        "use_compositing": render.use_compositing,
+        "use_sequencer": render.use_sequencer,
+        "samples": scene.cycles.samples,
+        "use_adaptive_sampling": scene.cycles.use_adaptive_sampling,
+        "use_denoising": scene.cycles.use_denoising,
+        "filter_width": scene.cycles.filter_width,
+        "pass_emit": view_layer.use_pass_emit,
+        "pass_diffuse_color": view_layer.use_pass_diffuse_color,
+        "pass_glossy_color": view_layer.use_pass_glossy_color,
+        "pass_transmission_color": view_layer.use_pass_transmission_color,
+        "pass_uv": view_layer.use_pass_uv,
+        "aov_count": len(view_layer.aovs),
+        "hidden": [],
+    }
+
+    group = None
+    modifier = None
+    camera_data = None
+    camera = None
+
+    try:
+        # Flatten the object into UV space.
+        group = create_flatten_node_group(uv_layer.name, aspect)
+        modifier = obj.modifiers.new(name=UV_RENDER_TAG, type='NODES')
+        modifier.node_group = group
+
+        # Orthographic camera looking down at the UV square.
+        camera_data = bpy.data.cameras.new(UV_RENDER_TAG)
+        camera_data.type = 'ORTHO'
+        camera_data.ortho_scale = 1.0
+        camera_data.clip_start = 0.5
+        camera_data.clip_end = 1.5
+        camera = bpy.data.objects.new(UV_RENDER_TAG, camera_data)
+        camera.location = (aspect[0] * 0.5, aspect[1] * 0.5, 1.0)
+        scene.collection.objects.link(camera)
+        scene.camera = camera
+
+        # Only the flattened object is rendered.
+        for other in scene.objects:
+            if other not in {obj, camera} and not other.hide_render:
+                other.hide_render = True
+                original["hidden"].append(other)
+
+        for index, (mat, bake_types) in enumerate(bake_types_by_material.items(), start=1):
+            add_material_aovs(mat, index, bake_types)
+
+        for name, aov_type in (
+            (AOV_MATERIAL, 'VALUE'),
+            (AOV_ROUGHNESS, 'VALUE'),
+            (AOV_METALLIC, 'VALUE'),
+            (AOV_POSITION, 'COLOR'),
+        ):
+            aov = view_layer.aovs.add()
+            aov.name = name
+            aov.type = aov_type
+
+        bake_types = {bake_type for _mat, bake_type in targets}
+        view_layer.use_pass_emit = view_layer.use_pass_emit or "EMIT" in bake_types
+        view_layer.use_pass_diffuse_color = view_layer.use_pass_diffuse_color or "DIFFUSE" in bake_types
+        view_layer.use_pass_glossy_color = view_layer.use_pass_glossy_color or "GLOSSY" in bake_types
+        view_layer.use_pass_transmission_color = (
+            view_layer.use_pass_transmission_color or "TRANSMISSION" in bake_types
+        )
+        view_layer.use_pass_uv = view_layer.use_pass_uv or "UV" in bake_types
+
+        render.resolution_x = width
+        render.resolution_y = height
+        render.resolution_percentage = 100
+        render.film_transparent = True
+        render.use_compositing = False
+        render.use_sequencer = False
+        render.image_settings.file_format = 'OPEN_EXR_MULTILAYER'
+        render.image_settings.color_depth = '32'
+        render.filepath = filepath
+
+        # One centred sample per texel, matching the bake rasterization.
+        scene.cycles.samples = samples
+        scene.cycles.use_adaptive_sampling = False
+        scene.cycles.use_denoising = False
+        scene.cycles.filter_width = 0.01
+
+        scene.frame_set(frame)
+        bpy.ops.render.render(write_still=True)
+
+        if not os.path.exists(filepath):
+            raise RuntimeError(f"UV render produced no output for frame {frame}")
+
+        passes = read_multilayer_passes(filepath)
+
+    finally:
+        for mat in bake_types_by_material:
+            remove_material_aovs(mat)
+
+        while len(view_layer.aovs) > original["aov_count"]:
+            view_layer.aovs.remove(view_layer.aovs[-1])
+
+        if modifier is not None:
+            obj.modifiers.remove(modifier)
+        if group is not None:
+            bpy.data.node_groups.remove(group)
+        if camera is not None:
+            bpy.data.objects.remove(camera)
+        if camera_data is not None:
+            bpy.data.cameras.remove(camera_data)
+
+        for other in original["hidden"]:
+            other.hide_render = False
+
+        scene.camera = original["camera"]
+        render.filepath = original["filepath"]
+        render.image_settings.file_format = original["format"]
+        render.image_settings.color_depth = original["color_depth"]
+        render.resolution_x = original["res_x"]
+        render.resolution_y = original["res_y"]
+        render.resolution_percentage = original["percent"]
+        render.film_transparent = original["film_transparent"]
+        render.use_compositing = original["use_compositing"]
+        render.use_sequencer = original["use_sequencer"]
+        scene.cycles.samples = original["samples"]
+        scene.cycles.use_adaptive_sampling = original["use_adaptive_sampling"]
+        scene.cycles.use_denoising = original["use_denoising"]
+        scene.cycles.filter_width = original["filter_width"]
+        view_layer.use_pass_emit = original["pass_emit"]
+        view_layer.use_pass_diffuse_color = original["pass_diffuse_color"]
+        view_layer.use_pass_glossy_color = original["pass_glossy_color"]
+        view_layer.use_pass_transmission_color = original["pass_transmission_color"]
+        view_layer.use_pass_uv = original["pass_uv"]
+
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+    material_ids = passes[AOV_MATERIAL][:, :, 0]
+    margin = scene.render.bake.margin
+
+    # Color passes are saved through the scene view transform.
+    apply_color_management(scene, props)
+
+    for index, (mat, bake_types) in enumerate(bake_types_by_material.items(), start=1):
+        mask = np.abs(material_ids - index) < 0.5
+
+        for bake_type in bake_types:
+            pass_name, channel_count, is_data = UV_RENDER_PASSES[bake_type]
+            pixels = pass_to_rgba(passes[pass_name], channel_count)
+            pixels[~mask] = 0.0
+
+            if margin > 0:
+                pixels = extend_margin(pixels, mask, margin)
+
+            if not props.sequence_is_alpha:
+                pixels[:, :, 3] = 1.0
+
+            bake_dir = os.path.join(output_root, f"{obj.name}_{mat.name}_{bake_type}")
+
+            save_pixels(
+                pixels,
+                name=f"{obj.name}_{mat.name}_{bake_type}_{frame}",
+                filepath=get_frame_filepath(bake_dir, frame, props),
+                alpha=props.sequence_is_alpha,
+                colorspace="Non-Color" if is_data else None,
+                channel_layout=resolve_channel_layout(bake_type, props),
+                encoding=resolve_encoding(bake_type, props),
+            )
@@ -0,0 +1,391 @@
+"""
+    This file is part of Sequence Bake.
+
+    Sequence Bake is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or any later version.
+
+    Sequence Bake is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Sequence Bake. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import hashlib
+import json
+import time
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .fingerprint import (
+    SCENE_DEPENDENT_BAKE_TYPES,
+    describe_node,
+)
+from .processing import (
+    apply_pass_settings,
+    build_bake_kwargs,
+    connect_metallic_node,
+    connect_occlusion_node,
+    get_enabled_bake_types,
+    reconnect_node,
+    resolve_bake_resolution,
+    run_bake_pass,
+)
+from .static_passes import (
+    GEOMETRY_DEPENDENT_BAKE_TYPES,
+    get_pass_input_nodes,
+)
+
+# Label of the temporary image node the watch bake targets.
+WATCH_NODE_TAG = "__SEQBAKE_WATCH__"
+
+# Prefix of the reused watch target images.
+WATCH_IMAGE_PREFIX = "SeqBake_Watch"
+
+# Passes the watch mode does not preview (sculpt maps are not a Cycles bake).
+WATCH_SKIPPED_BAKE_TYPES = {"SCULPT"}
+
+# Watch state shared by the depsgraph handler and the debounce timer.
+_state = {
+    "active": False,
+    "paused": 0,
+    "baking": False,
+    "timer_pending": False,
+    "last_edit": 0.0,
+    "geometry": set(),
+    "images": set(),
+    "lighting": False,
+    "digests": {},
+}
+
+
+def get_watch_image_name(obj, mat, bake_type):
+    """
+    Build the name of the reused watch target image of a pass.
+    """
+    return f"{WATCH_IMAGE_PREFIX}_{obj.name}_{mat.name}_{bake_type}"
+
+
+def compute_pass_input_digest(material, bake_type):
+    """
+    Hash the current values of the nodes feeding a bake pass.
+
+    Only the nodes upstream of the Principled BSDF inputs the pass reads are
+    hashed; the whole node tree is hashed when the pass layout is not
+    understood.
+
+    Args:
+        material (bpy.types.Material): Material being watched.
+        bake_type (str): The bake pass type.
+
+    Returns:
+        tuple[str, set[str]]: (SHA-256 hex digest, names of the images the
+        pass reads).
+    """
+    node_tree = material.node_tree
+    upstream = get_pass_input_nodes(node_tree, bake_type)
+
+    if upstream is None:
+        nodes = list(node_tree.nodes)
+        root_inputs = set()
+    else:
+        nodes, _sockets, root_inputs = upstream
+
+    roots = {name: describe_node(node_tree.nodes[name]) for name, _index in root_inputs}
+
+    state = {
+        "nodes": [describe_node(node) for node in sorted(nodes, key=lambda n: n.name)],
+        "root_inputs": [roots[name]["inputs"][index] for name, index in sorted(root_inputs)],
+    }
+
+    images = {node.image.name for node in nodes if getattr(node, "image", None) is not None}
+
+    digest = hashlib.sha256(json.dumps(state, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return digest, images
+
+
+def _get_watch_image(name, width, height, props, colorspace):
+    """
+    Return the reused watch target image, recreating it when its size or
+    buffer type no longer matches.
+    """
+    image = bpy.data.images.get(name)
+
+    if image is not None and (
+            tuple(image.size) != (width, height) or image.is_float != props.sequence_use_float):
+        bpy.data.images.remove(image)
+        image = None
+
+    if image is None:
+        image = bpy.data.images.new(
+            name=name, width=width, height=height, alpha=props.sequence_is_alpha,
+            float_buffer=props.sequence_use_float
+        )
+        image.use_fake_user = True
+
+    image.colorspace_settings.name = colorspace
+    return image
+
+
+def bake_watch_pass(context, obj, mat, bake_type):
+    """
+    Re-bake a single pass of the current frame at preview quality into its
+    reused watch image.
+
+    Args:
+        context (bpy.types.Context): Current Blender context.
+        obj (bpy.types.Object): Object being watched.
+        mat (bpy.types.Material): Material being watched.
+        bake_type (str): The bake pass type.
+
+    Returns:
+        bpy.types.Image: The updated watch image.
+    """
+    scene = context.scene
+    props = scene.sequenced_bake_props
+
+    width, height = resolve_bake_resolution(bake_type, props, mat)
+    width = max(1, round(width * props.preview_resolution_scale))
+    height = max(1, round(height * props.preview_resolution_scale))
+
+    colorspace = props.colorspace
+    if bake_type in {"NORMAL", "ROUGHNESS", "METALLIC", "OCCLUSION"}:
+        colorspace = "Non-Color"
+
+    image = _get_watch_image(get_watch_image_name(obj, mat, bake_type), width, height, props, colorspace)
+
+    nodes = mat.node_tree.nodes
+    previous_active = nodes.active
+
+    if bake_type == "METALLIC":
+        connect_metallic_node(mat)
+
+    if bake_type == "OCCLUSION":
+        connect_occlusion_node(mat)
+
+    image_node = nodes.new("ShaderNodeTexImage")
+    image_node.label = WATCH_NODE_TAG
+    image_node.image = image
+    nodes.active = image_node
+
+    try:
+        apply_pass_settings(scene, props, bake_type)
+        run_bake_pass(
+            scene, props, bake_type, build_bake_kwargs(bake_type, props), image_node, image, mat,
+            preview_samples=props.preview_samples,
+        )
+    finally:
+        nodes.remove(image_node)
+
+        if bake_type in {"METALLIC", "OCCLUSION"}:
+            reconnect_node(mat)
+
+        if previous_active is not None and previous_active.name in nodes:
+            nodes.active = previous_active
+
+    return image
+
+
+def bake_changed_passes(context):
+    """
+    Re-bake the passes of the active object whose inputs changed since the
+    last watch bake.
+
+    Args:
+        context (bpy.types.Context): Current Blender context.
+
+    Returns:
+        int: Number of passes baked.
+    """
+    scene = context.scene
+    props = scene.sequenced_bake_props
+    obj = context.active_object
+
+    geometry_changed = obj is not None and obj.name in _state["geometry"]
+    scene_changed = bool(_state["geometry"]) or _state["lighting"]
+    changed_images = set(_state["images"])
+
+    _state["geometry"].clear()
+    _state["images"].clear()
+    _state["lighting"] = False
+
+    if obj is None or not obj.active_material or scene.render.engine != 'CYCLES':
+        return 0
+
+    if props.material_mode == 'ALL':
+        materials = [slot.material for slot in obj.material_slots if slot.material]
+    else:
+        materials = [obj.active_material]
+
+    baked = 0
+
+    for mat in materials:
+        if not mat.use_nodes:
+            continue
+
+        for bake_type, enabled in get_enabled_bake_types(props).items():
+            if not enabled or bake_type in WATCH_SKIPPED_BAKE_TYPES:
+                continue
+
+            key = (obj.name, mat.name, bake_type)
+            digest, images = compute_pass_input_digest(mat, bake_type)
+
+            stale = (
+                _state["digests"].get(key) != digest
+                or bpy.data.images.get(get_watch_image_name(obj, mat, bake_type)) is None
+                or bool(images & changed_images)
+                or (geometry_changed and bake_type in GEOMETRY_DEPENDENT_BAKE_TYPES)
+                or (scene_changed and bake_type in SCENE_DEPENDENT_BAKE_TYPES)
+            )
+
+            if not stale:
+                continue
+
+            bake_watch_pass(context, obj, mat, bake_type)
+            _state["digests"][key] = digest
+            baked += 1
+
+    if baked:
+        props.bake_status = f"Watch: re-baked {baked} pass(es) of frame {scene.frame_current}"
+
+    return baked
+
+
+def _process_pending_edits():
+    """
+    Debounce timer: waits until edits have settled, then re-bakes.
+    """
+    if not _state["active"]:
+        _state["timer_pending"] = False
+        return None
+
+    props = bpy.context.scene.sequenced_bake_props
+    remaining = props.watch_debounce - (time.monotonic() - _state["last_edit"])
+
+    if remaining > 0.0:
+        return remaining
+
+    if _state["paused"]:
+        # Retry once the sequence bake has finished.
+        return max(props.watch_debounce, 0.1)
+
+    _state["timer_pending"] = False
+    _state["baking"] = True
+
+    window = next(iter(bpy.context.window_manager.windows), None)
+
+    try:
+        with bpy.context.temp_override(window=window):
+            bake_changed_passes(bpy.context)
+    except RuntimeError as error:
+        props.bake_status = f"Watch bake failed: {error}"
+    finally:
+        _state["baking"] = False
+
+    return None
+
+
+def _schedule():
+    """
+    Record an edit and make sure the debounce timer is running.
+    """
+    _state["last_edit"] = time.monotonic()
+
+    if not _state["timer_pending"]:
+        _state["timer_pending"] = True
+        bpy.app.timers.register(
+            _process_pending_edits, first_interval=bpy.context.scene.sequenced_bake_props.watch_debounce
+        )
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """
+    depsgraph_update_post handler: records edits that can change a pass.
+    """
+    if not _state["active"] or _state["baking"] or _state["paused"]:
+        return
+
+    edited = False
+
+    for update in depsgraph.updates:
+        id_data = update.id
+
+        if isinstance(id_data, bpy.types.Image):
+            if id_data.name.startswith(WATCH_IMAGE_PREFIX):
+                continue
+            _state["images"].add(id_data.name)
+            edited = True
+
+        elif isinstance(id_data, (bpy.types.Material, bpy.types.NodeTree)):
+            edited = True
+
+        elif isinstance(id_data, bpy.types.Object):
+            if update.is_updated_geometry or update.is_updated_transform:
+                _state["geometry"].add(id_data.original.name)
+                edited = True
+
+        elif isinstance(id_data, (bpy.types.World, bpy.types.Light)):
+            _state["lighting"] = True
+            edited = True
+
+    if edited:
+        _schedule()
+
+
+def start_watch():
+    """
+    Start watching edits; the current frame is baked once right away.
+    """
+    if _state["active"]:
+        return
+
+    _state["active"] = True
+    _state["digests"].clear()
+
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+
+    _schedule()
+
+
+def stop_watch():
+    """
+    Stop watching edits and cancel any pending re-bake.
+    """
+    _state["active"] = False
+    _state["digests"].clear()
+
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+
+    if bpy.app.timers.is_registered(_process_pending_edits):
+        bpy.app.timers.unregister(_process_pending_edits)
+
+    _state["timer_pending"] = False
+
+
+def pause_watch(paused):
+    """
+    Suspend (True) or resume (False) watch re-bakes, e.g. while a sequence
+    bake is running. Calls nest.
+    """
+    _state["paused"] = max(0, _state["paused"] + (1 if paused else -1))
+
+
+@persistent
+def watch_load_post(_filepath):
+    """
+    load_post handler: restarts watch mode for files saved with it enabled.
+    """
+    stop_watch()
+    _state["paused"] = 0
+
+    props = getattr(bpy.context.scene, "sequenced_bake_props", None)
+    if props is not None and props.use_watch_mode:
+        start_watch()
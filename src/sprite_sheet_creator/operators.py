@@ -2,6 +2,7 @@ import bpy
 import os
 from bpy.types import Operator
 from . import processing
+from ..sequenced_bake_core.manifest import is_shard_name
 
 
 class OBJECT_OT_CreateSpriteSheet(Operator):
@@ -44,11 +45,11 @@ class OBJECT_OT_CreateSpriteSheet(Operator):
             self.report({'ERROR'}, f"Invalid or missing directory: {directory}")
             return {'CANCELLED'}
 
-        # Detect subdirectories
+        # Detect subdirectories (shard folders of a sharded bake belong to the directory itself)
         subdirs = [
             os.path.join(directory, d)
             for d in os.listdir(directory)
-            if os.path.isdir(os.path.join(directory, d))
+            if os.path.isdir(os.path.join(directory, d)) and not is_shard_name(d)
         ]
 
         if not subdirs:
@@ -19,6 +19,11 @@ import numpy as np
 import subprocess
 import platform
 
+from ..sequenced_bake_core.manifest import (
+    find_manifest_files,
+    is_shard_name,
+)
+
 
 # ------------------------------------------------------------------------
 # Utilities
@@ -55,8 +60,21 @@ def load_directory_images(directory, start_frame=None, end_frame=None, reversed_
             _report(report_fn, {'ERROR'}, f"Directory not found: {directory}")
             return images
 
+        # Sequenced Bake outputs listed in a bake manifest are opened directly, in frame order.
+        manifest_files = find_manifest_files(directory)
+
+        if manifest_files:
+            if reversed_order:
+                manifest_files.reverse()
+
+            return _load_image_files(manifest_files, start_frame, end_frame, report_fn)
+
         try:
             files = os.listdir(directory)
+
+            # Sharded Sequenced Bake outputs keep their frames in numbered subfolders.
+            for shard in sorted(f for f in files if is_shard_name(f) and os.path.isdir(os.path.join(directory, f))):
+                files += [os.path.join(shard, f) for f in os.listdir(os.path.join(directory, shard))]
         except Exception as e:
             _report(report_fn, {'ERROR'}, f"Failed to list directory contents: {directory}\nError: {e}")
             return images
@@ -93,38 +111,60 @@ def load_directory_images(directory, start_frame=None, end_frame=None, reversed_
             _report(report_fn, {'ERROR'}, f"Failed to sort image files in {directory}\nError: {e}")
             return images
 
-        # Apply start/end frame slicing
-        total_images = len(image_files)
-        start_index = max(0, (start_frame - 1) if start_frame else 0)
-        end_index = min(total_images, end_frame if end_frame else total_images)
+        images = _load_image_files(
+            [os.path.join(directory, filename) for filename in image_files], start_frame, end_frame, report_fn
+        )
 
-        if start_index >= total_images:
-            _report(report_fn, {'WARNING'}, f"start_frame {start_frame} exceeds number of images ({total_images}) in {directory}")
-            return images
+    except Exception as e:
+        _report(report_fn, {'ERROR'}, f"Unexpected failure in load_directory_images for {directory}\nError: {e}")
 
-        if end_index <= 0:
-            _report(report_fn, {'WARNING'}, f"end_frame {end_frame} is before the first image in {directory}")
-            return images
+    return images
 
-        image_files = image_files[start_index:end_index]
 
-        if not image_files:
-            _report(report_fn, {'WARNING'}, f"No images to load after applying start/end frame slice: {start_frame}-{end_frame}")
-            return images
+def _load_image_files(paths, start_frame=None, end_frame=None, report_fn=None):
+    """
+    Slice an ordered list of image paths by start/end frame and load them.
 
-        # Load images into Blender
-        for filename in image_files:
-            path = os.path.join(directory, filename)
-            try:
-                img = bpy.data.images.load(path)
-                images.append(img)
-            except RuntimeError as e:
-                _report(report_fn, {'WARNING'}, f"Failed to load image: {filename}\nBlender Error: {e}")
-            except Exception as e:
-                _report(report_fn, {'ERROR'}, f"Unexpected error loading image: {filename}\nError: {e}")
+    Args:
+        paths (list[str]): Image file paths in playback order.
+        start_frame (int, optional): 1-based starting frame to load.
+        end_frame (int, optional): 1-based ending frame to load.
+        report_fn (callable, optional): Blender report function to call with messages.
 
-    except Exception as e:
-        _report(report_fn, {'ERROR'}, f"Unexpected failure in load_directory_images for {directory}\nError: {e}")
+    Returns:
+        list[bpy.types.Image]: Loaded Blender image objects.
+    """
+    images = []
+
+    # Apply start/end frame slicing
+    total_images = len(paths)
+    start_index = max(0, (start_frame - 1) if start_frame else 0)
+    end_index = min(total_images, end_frame if end_frame else total_images)
+
+    if start_index >= total_images:
+        _report(report_fn, {'WARNING'}, f"start_frame {start_frame} exceeds number of images ({total_images})")
+        return images
+
+    if end_index <= 0:
+        _report(report_fn, {'WARNING'}, f"end_frame {end_frame} is before the first image")
+        return images
+
+    paths = paths[start_index:end_index]
+
+    if not paths:
+        _report(report_fn, {'WARNING'}, f"No images to load after applying start/end frame slice: {start_frame}-{end_frame}")
+        return images
+
+    # Load images into Blender
+    for path in paths:
+        filename = os.path.basename(path)
+        try:
+            img = bpy.data.images.load(path)
+            images.append(img)
+        except RuntimeError as e:
+            _report(report_fn, {'WARNING'}, f"Failed to load image: {filename}\nBlender Error: {e}")
+        except Exception as e:
+            _report(report_fn, {'ERROR'}, f"Unexpected error loading image: {filename}\nError: {e}")
 
     return images
 